@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 import os
 import sys
 from pathlib import Path
@@ -24,7 +25,11 @@ from kedro.framework.cli.utils import (
 )
 from kedro.framework.project import settings
 from kedro.framework.session import KedroSession
-from kedro.utils import load_obj
+from kedro.framework.session.session import _combine_pipelines
+from kedro.pipeline import Pipeline, PlanCache
+from kedro.runner import RunHistory, RunJournal, ScheduleSimulator
+from kedro.runner.distributed_runner import run_worker
+from kedro.utils import find_kedro_project, load_obj
 
 if TYPE_CHECKING:
     from kedro.framework.startup import ProjectMetadata
@@ -42,7 +47,8 @@ FROM_NODES_HELP = """A list of node names which should be used as a starting poi
 TO_NODES_HELP = """A list of node names which should be used as an end point."""
 NODE_ARG_HELP = """Run only nodes with specified names."""
 RUNNER_ARG_HELP = """Specify a runner that you want to run the pipeline with.
-Available runners: 'SequentialRunner', 'ParallelRunner' and 'ThreadRunner'."""
+Available runners: 'SequentialRunner', 'ParallelRunner', 'ThreadRunner',
+'AsyncRunner', 'HybridRunner' and 'DistributedRunner'."""
 ASYNC_ARG_HELP = """Load and save node inputs and outputs asynchronously
 with threads. If not specified, load and save datasets synchronously."""
 TAG_ARG_HELP = """Construct the pipeline using only nodes which have this tag
@@ -69,6 +75,30 @@ OUTPUT_FILE_HELP = """Name of the file where compiled requirements should be sto
 CONF_SOURCE_HELP = """Path of a directory where project configuration is stored."""
 ONLY_MISSING_OUTPUTS_HELP = """Run only nodes with missing outputs.
 If all outputs of a node exist and are persisted, skip the node execution."""
+INCREMENTAL_HELP = """Skip the nodes whose code, parameters and inputs are
+unchanged since they last completed, and whose outputs exist. Node
+fingerprints are recorded to '.kedro/run_history.json' in the project."""
+JOURNAL_HELP = """Record the completed nodes and checkpoint the in-memory datasets
+they produce to '.kedro/journal/<session_id>' in the project, so a failed run
+can be resumed with '--resume'."""
+RESUME_HELP = """Resume the failed run of the given session id from its run journal,
+skipping the completed nodes and restoring the in-memory inputs of the
+remaining nodes."""
+PLAN_HELP = """Print the predicted makespan, worker utilisation and critical path
+of the pipeline for a range of worker counts, replaying the runner scheduling
+over the node durations recorded in '.kedro/run_history.json', without
+running any node."""
+CACHE_PLAN_HELP = """Combine the pipelines to run from the dependency graph and
+topological order compiled by a previous run of the same pipelines, stored in
+'.kedro/plans' in the project, without validating and sorting their nodes
+again. The plan is compiled on the first run."""
+WORKER_CONNECT_HELP = """Address of the 'DistributedRunner' to connect to, either
+'host:port' or 'unix:/path/to/socket'. Defaults to the KEDRO_DISTRIBUTED_ADDRESS
+environment variable, or 'localhost:8765'. The connection is authenticated with
+the key set in the KEDRO_DISTRIBUTED_AUTHKEY environment variable."""
+RUN_HISTORY_FILEPATH = Path(".kedro") / "run_history.json"
+JOURNAL_DIRPATH = Path(".kedro") / "journal"
+PLAN_CACHE_DIRPATH = Path(".kedro") / "plans"
 
 
 @click.group(name="kedro")
@@ -239,6 +269,11 @@ def package(metadata: ProjectMetadata) -> None:
     is_flag=True,
     help=ONLY_MISSING_OUTPUTS_HELP,
 )
+@click.option("--incremental", is_flag=True, help=INCREMENTAL_HELP)
+@click.option("--journal", is_flag=True, help=JOURNAL_HELP)
+@click.option("--resume", type=str, default=None, help=RESUME_HELP)
+@click.option("--plan", is_flag=True, help=PLAN_HELP)
+@click.option("--cache-plan", is_flag=True, help=CACHE_PLAN_HELP)
 def run(  # noqa: PLR0913
     tags: str,
     env: str,
@@ -257,6 +292,11 @@ def run(  # noqa: PLR0913
     params: dict[str, Any],
     namespaces: str,
     only_missing_outputs: bool,
+    incremental: bool,
+    journal: bool,
+    resume: str | None,
+    plan: bool,
+    cache_plan: bool,
 ) -> dict[str, Any]:
     """Run the pipeline."""
 
@@ -268,15 +308,55 @@ def run(  # noqa: PLR0913
     pipelines_to_run = list(set(pipelines)) if pipelines else None
 
     runner_obj = load_obj(runner or "SequentialRunner", "kedro.runner")
+    runner_kwargs: dict[str, Any] = {"is_async": is_async}
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    plan_cache = PlanCache(project_path / PLAN_CACHE_DIRPATH) if cache_plan else None
+    if plan:
+        names = [pipeline] if pipeline else pipelines_to_run or ["__default__"]
+        try:
+            combined_pipelines = _combine_pipelines(names, plan_cache)
+        except ValueError as exc:
+            raise KedroCliError(str(exc)) from exc
+        _print_plan(
+            combined_pipelines.filter(
+                tags=tags,
+                from_nodes=from_nodes,
+                to_nodes=to_nodes,
+                node_names=node_names,
+                from_inputs=from_inputs,
+                to_outputs=to_outputs,
+                node_namespaces=namespaces,
+            ),
+            RunHistory(project_path / RUN_HISTORY_FILEPATH),
+        )
+        return {}
+    if incremental:
+        _check_runner_argument(runner_obj, "run_history", "--incremental")
+        runner_kwargs["run_history"] = RunHistory(project_path / RUN_HISTORY_FILEPATH)
+    if journal or resume:
+        _check_runner_argument(
+            runner_obj, "journal", "--resume" if resume else "--journal"
+        )
+    if resume:
+        journal_path = project_path / JOURNAL_DIRPATH / resume
+        if not journal_path.is_dir():
+            raise KedroCliError(
+                f"No run journal found for session '{resume}' in '{journal_path}'."
+            )
+        runner_kwargs["journal"] = RunJournal(journal_path)
     tuple_tags = tuple(tags)
     tuple_node_names = tuple(node_names)
 
     with KedroSession.create(
         env=env, conf_source=conf_source, runtime_params=params
     ) as session:
+        if journal and not resume:
+            runner_kwargs["journal"] = RunJournal(
+                project_path / JOURNAL_DIRPATH / session.session_id
+            )
         return session.run(
             tags=tuple_tags,
-            runner=runner_obj(is_async=is_async),
+            runner=runner_obj(**runner_kwargs),
             node_names=tuple_node_names,
             from_nodes=from_nodes,
             to_nodes=to_nodes,
@@ -287,4 +367,61 @@ def run(  # noqa: PLR0913
             pipeline_names=pipelines_to_run,
             namespaces=namespaces,
             only_missing_outputs=only_missing_outputs,
+            incremental=incremental,
+            plan_cache=plan_cache,
+        )
+
+
+def _check_runner_argument(runner_class: type, argument: str, option: str) -> None:
+    """Raise a ``KedroCliError`` when the runner class does not take the
+    argument an option of ``kedro run`` passes to it.
+    """
+    parameters = inspect.signature(runner_class).parameters
+    if argument in parameters or any(
+        parameter.kind is parameter.VAR_KEYWORD for parameter in parameters.values()
+    ):
+        return
+    raise KedroCliError(
+        f"Option '{option}' cannot be used with '{runner_class.__name__}', "
+        f"as it does not take a '{argument}' argument."
+    )
+
+
+def _print_plan(pipeline: Pipeline, run_history: RunHistory) -> None:
+    node_durations = run_history.node_durations
+    recorded = sum(n.name in node_durations for n in pipeline.nodes)
+    simulator = ScheduleSimulator(pipeline, node_durations)
+    click.echo(
+        f"Predicted schedule of {len(pipeline.nodes)} nodes, {recorded} with a "
+        f"recorded duration:"
+    )
+    click.echo(f"{'workers':>8}  {'makespan':>10}  {'utilisation':>11}")
+    for workers in range(1, simulator.max_parallelism + 1):
+        prediction = simulator.simulate(workers)
+        click.echo(
+            f"{workers:>8}  {prediction.makespan:>9.2f}s  "
+            f"{prediction.utilisation:>11.0%}"
+        )
+    critical_path = " -> ".join(n.name for n in simulator.critical_path)
+    click.echo(
+        f"Critical path ({simulator.critical_path_length:.2f}s): {critical_path}"
+    )
+
+
+@project_group.command()
+@click.option("--connect", "address", type=str, default=None, help=WORKER_CONNECT_HELP)
+@env_option
+@click.option(
+    "--conf-source",
+    callback=validate_conf_source,
+    help=CONF_SOURCE_HELP,
+)
+def worker(address: str | None, env: str, conf_source: str) -> None:
+    """Run the nodes dispatched by a 'DistributedRunner' until its run completes."""
+    with KedroSession.create(env=env, conf_source=conf_source) as session:
+        context = session.load_context()
+        run_worker(
+            context.catalog,
+            session._hook_manager,
+            address=address,
         )
@@ -36,6 +36,7 @@ if TYPE_CHECKING:
     from kedro.config import AbstractConfigLoader
     from kedro.framework.context import KedroContext
     from kedro.framework.session.store import BaseSessionStore
+    from kedro.pipeline import PlanCache
 
 
 def _describe_git(project_path: Path) -> dict[str, dict[str, Any]]:
@@ -64,6 +65,30 @@ def _describe_git(project_path: Path) -> dict[str, dict[str, Any]]:
     return {"git": git_data}
 
 
+def _combine_pipelines(
+    names: Iterable[str], plan_cache: PlanCache | None = None
+) -> Pipeline:
+    """Combine the registered pipelines ``names``, through ``plan_cache``
+    when given so a stored plan spares validating and sorting the result.
+    """
+    registered = []
+    for name in names:
+        try:
+            registered.append(pipelines[name])
+        except KeyError as exc:
+            raise ValueError(
+                f"Failed to find the pipeline named '{name}'. "
+                f"It needs to be generated and returned "
+                f"by the 'register_pipelines' function."
+            ) from exc
+    if plan_cache is not None:
+        return plan_cache.combine(registered)
+    combined_pipelines = Pipeline([])
+    for registered_pipeline in registered:
+        combined_pipelines += registered_pipeline
+    return combined_pipelines
+
+
 def _jsonify_cli_context(ctx: click.core.Context) -> dict[str, Any]:
     return {
         "args": ctx.args,
@@ -293,6 +318,8 @@ class KedroSession:
         load_versions: dict[str, str] | None = None,
         namespaces: Iterable[str] | None = None,
         only_missing_outputs: bool = False,
+        incremental: bool = False,
+        plan_cache: PlanCache | None = None,
     ) -> dict[str, Any]:
         """Runs the pipeline with a specified runner.
 
@@ -319,6 +346,13 @@ class KedroSession:
                 version timestamp to load.
             namespaces: The namespaces of the nodes that are being run.
             only_missing_outputs: Run only nodes with missing outputs.
+            incremental: Skip the nodes whose code, parameters and inputs are
+                unchanged since they last completed, and whose outputs exist.
+                The runner needs a ``run_history`` to record the node
+                fingerprints to.
+            plan_cache: An optional ``PlanCache`` combining the pipelines
+                from the plan stored by a previous run of the same pipelines,
+                without validating and sorting their nodes again.
         Raises:
             ValueError: If the named or `__default__` pipeline is not
                 defined by `register_pipelines`.
@@ -353,16 +387,7 @@ class KedroSession:
         context = self.load_context()
 
         names = pipeline_names or ["__default__"]
-        combined_pipelines = Pipeline([])
-        for name in names:
-            try:
-                combined_pipelines += pipelines[name]
-            except KeyError as exc:
-                raise ValueError(
-                    f"Failed to find the pipeline named '{name}'. "
-                    f"It needs to be generated and returned "
-                    f"by the 'register_pipelines' function."
-                ) from exc
+        combined_pipelines = _combine_pipelines(names, plan_cache)
 
         filtered_pipeline = combined_pipelines.filter(
             tags=tags,
@@ -391,6 +416,7 @@ class KedroSession:
             "namespaces": namespaces,
             "runner": getattr(runner, "__name__", str(runner)),
             "only_missing_outputs": only_missing_outputs,
+            "incremental": incremental,
         }
 
         runner = runner or SequentialRunner()
@@ -424,6 +450,7 @@ class KedroSession:
                 hook_manager,
                 run_id=session_id,
                 only_missing_outputs=only_missing_outputs,
+                incremental=incremental,
             )
             self._run_called = True
         except Exception as error:
@@ -19,6 +19,7 @@ from .core import (
 from .data_catalog import DataCatalog, SharedMemoryDataCatalog
 from .memory_dataset import MemoryDataset
 from .shared_memory_dataset import SharedMemoryDataset
+from .streaming_dataset import StreamingDataset
 
 __all__ = [
     "AbstractDataset",
@@ -34,5 +35,6 @@ __all__ = [
     "SharedMemoryDataset",
     "SharedMemoryDataCatalog",
     "SharedMemoryCatalogProtocol",
+    "StreamingDataset",
     "Version",
 ]
@@ -113,6 +113,9 @@ class AbstractDataset(abc.ABC, Generic[_DI, _DO]):
     If a specific dataset implementation cannot be used in conjunction with
     the ``ParallelRunner``, such user-defined dataset should have the
     attribute `_SINGLE_PROCESS = True`.
+    Datasets may also define ``aload`` and ``asave`` coroutine methods, which
+    the ``AsyncRunner`` awaits instead of running ``load`` and ``save`` in a
+    thread.
     Example:
     ``` python
     from pathlib import Path, PurePosixPath
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import copy
-from typing import Any
+import pickle
+import sys
+from typing import TYPE_CHECKING, Any
 
 from kedro.io.core import AbstractDataset, DatasetError, TCopyMode
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 _EMPTY = object()
 
 
@@ -51,6 +56,7 @@ class MemoryDataset(AbstractDataset):
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
         self._data = _EMPTY
+        self._spill_path: Path | None = None
         self._copy_mode = copy_mode
         self.metadata = metadata
         self._EPHEMERAL = True
@@ -58,6 +64,8 @@ class MemoryDataset(AbstractDataset):
             self.save.__wrapped__(self, data)  # type: ignore[attr-defined]
 
     def load(self) -> Any:
+        if self._spill_path is not None:
+            self._unspill()
         if self._data is _EMPTY:
             raise DatasetError("Data for MemoryDataset has not been saved yet.")
 
@@ -67,15 +75,57 @@ class MemoryDataset(AbstractDataset):
 
     def save(self, data: Any) -> None:
         copy_mode = self._copy_mode or _infer_copy_mode(data)
+        self._discard_spilled_data()
         self._data = _copy_with_mode(data, copy_mode=copy_mode)
 
     def _exists(self) -> bool:
-        return self._data is not _EMPTY
+        return self._data is not _EMPTY or self._spill_path is not None
 
     def _release(self) -> None:
+        self._discard_spilled_data()
         self._data = _EMPTY
 
+    def _is_in_memory(self) -> bool:
+        return self._data is not _EMPTY
+
+    def _estimate_size(self) -> int:
+        """Estimate the number of bytes held in memory by the data."""
+        return _estimate_size(self._data) if self._data is not _EMPTY else 0
+
+    def _spill(self, filepath: Path) -> None:
+        """Move the data out of memory into a pickle file at ``filepath``. The
+        data is read back into memory the next time it is loaded.
+
+        Raises:
+            DatasetError: When the data cannot be pickled.
+        """
+        if self._data is _EMPTY:
+            return
+        try:
+            with open(filepath, "wb") as spill_file:
+                pickle.dump(self._data, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            filepath.unlink(missing_ok=True)
+            raise DatasetError(
+                f"Unable to spill data of type '{type(self._data).__name__}' "
+                f"to disk: {exc}"
+            ) from exc
+        self._spill_path = filepath
+        self._data = _EMPTY
+
+    def _unspill(self) -> None:
+        with open(self._spill_path, "rb") as spill_file:  # type: ignore[arg-type]
+            self._data = pickle.load(spill_file)  # noqa: S301
+        self._discard_spilled_data()
+
+    def _discard_spilled_data(self) -> None:
+        if self._spill_path is not None:
+            self._spill_path.unlink(missing_ok=True)
+            self._spill_path = None
+
     def _describe(self) -> dict[str, Any]:
+        if self._spill_path is not None:
+            return {"data": f"<spilled to {self._spill_path}>"}
         if self._data is not _EMPTY:
             return {"data": f"<{type(self._data).__name__}>"}
         # the string representation of datasets leaves out __init__
@@ -113,6 +163,48 @@ def _infer_copy_mode(data: Any) -> TCopyMode:
         return "deepcopy"
 
 
+def _estimate_size(data: Any, seen: set[int] | None = None) -> int:
+    """Estimates the number of bytes held in memory by ``data``.
+
+    Objects with a ``memory_usage(deep=True)`` method, such as dataframes,
+    and arrays with ``nbytes`` report their own memory usage, containers are
+    summed over their items and any other object falls back to
+    ``sys.getsizeof``. Objects referenced several times, including
+    containers referencing themselves, are counted once.
+
+    Args:
+        data: The data to estimate the size of.
+        seen: Ids of the objects already counted.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    if seen is None:
+        seen = set()
+    if id(data) in seen:
+        return 0
+    seen.add(id(data))
+    memory_usage = getattr(data, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+        except TypeError:
+            pass
+        else:
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(data)
+    if isinstance(data, dict):
+        size += sum(
+            _estimate_size(k, seen) + _estimate_size(v, seen) for k, v in data.items()
+        )
+    elif isinstance(data, list | tuple | set | frozenset):
+        size += sum(_estimate_size(item, seen) for item in data)
+    return size
+
+
 def _copy_with_mode(data: Any, copy_mode: TCopyMode) -> Any:
     """Returns the copied data using the copy mode specified.
     If no copy mode is provided, then it is inferred based on the type of the data.
@@ -1,16 +1,94 @@
 from __future__ import annotations
 
+import os
 import pickle
-from typing import TYPE_CHECKING, Any
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from kedro.io.core import AbstractDataset, DatasetError
 
 if TYPE_CHECKING:
     from multiprocessing.managers import SyncManager
 
+# Smallest total size of the buffers of an object for it to be moved into a
+# shared memory block rather than sent through the manager
+_MIN_SHARED_MEMORY_BYTES = 1024 * 1024
+
+
+class _PickledData(NamedTuple):
+    """Data pickled with protocol 5. Its out-of-band buffers are either kept
+    inline or written once to a shared memory block.
+    """
+
+    payload: bytes
+    buffers: tuple[bytes, ...] = ()
+    block_name: str | None = None
+    block_spans: tuple[tuple[int, int], ...] = ()
+
+    @classmethod
+    def from_data(cls, data: Any, use_shared_memory: bool = True) -> _PickledData:
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        total_size = sum(raw.nbytes for raw in raw_buffers)
+        # Windows frees a shared memory block as soon as its producer closes it
+        if (
+            not use_shared_memory
+            or total_size < max(_MIN_SHARED_MEMORY_BYTES, 1)
+            or os.name == "nt"
+        ):
+            return cls(payload, buffers=tuple(raw.tobytes() for raw in raw_buffers))
+
+        block = shared_memory.SharedMemory(create=True, size=total_size)
+        spans = []
+        offset = 0
+        for raw in raw_buffers:
+            block.buf[offset : offset + raw.nbytes] = raw  # type: ignore[index]
+            spans.append((offset, offset + raw.nbytes))
+            offset += raw.nbytes
+        block.close()
+        return cls(payload, block_name=block.name, block_spans=tuple(spans))
+
+    def load(self) -> Any:
+        if self.block_name is None:
+            return pickle.loads(self.payload, buffers=self.buffers)  # noqa: S301
+        # Copy the block into memory of the consumer, so writes by the
+        # consumer stay private to it
+        views = memoryview(
+            _read_shared_memory(self.block_name, self.block_spans[-1][1])
+        )
+        return pickle.loads(  # noqa: S301
+            self.payload, buffers=[views[start:end] for start, end in self.block_spans]
+        )
+
+
+def _read_shared_memory(name: str, size: int) -> bytearray:
+    """Copy the first ``size`` bytes of an existing shared memory block."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf[:size] as view:  # type: ignore[index]
+            return bytearray(view)
+    finally:
+        block.close()
+
+
+def _unlink_shared_memory(name: str) -> None:
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
 
 class SharedMemoryDataset(AbstractDataset):
-    """``SharedMemoryDataset`` is a wrapper class for a shared MemoryDataset in SyncManager."""
+    """``SharedMemoryDataset`` is a wrapper class for a shared MemoryDataset in SyncManager.
+
+    Data backed by large buffers, such as NumPy arrays and pandas DataFrames,
+    is written once to a ``multiprocessing.shared_memory`` block which the
+    processes loading it read directly. Only a small reference to the block
+    passes through the manager. Runners free the blocks once the run is over.
+    """
 
     def __init__(self, manager: SyncManager | None = None):
         """Creates a new instance of ``SharedMemoryDataset``,
@@ -21,14 +99,20 @@ class SharedMemoryDataset(AbstractDataset):
 
         """
         self._EPHEMERAL = True
+        self.shared_memory_dataset: Any = None
+        self._shared_memory_blocks: Any = None
 
         if manager:
-            self.shared_memory_dataset = manager.MemoryDataset()  # type: ignore[attr-defined]
-        else:
-            self.shared_memory_dataset = None
+            self.set_manager(manager)
 
     def set_manager(self, manager: SyncManager) -> None:
         self.shared_memory_dataset = manager.MemoryDataset()  # type: ignore[attr-defined]
+        self._shared_memory_blocks = manager.list()
+        if os.name != "nt":
+            # Start the resource tracker before any worker is forked, so all
+            # processes share it and blocks freed here are not reported as
+            # leaked by the workers
+            resource_tracker.ensure_running()
 
     def __getattr__(self, name: str) -> Any:
         # This if condition prevents recursive call when deserialising
@@ -37,22 +121,53 @@ class SharedMemoryDataset(AbstractDataset):
         return getattr(self.shared_memory_dataset, name)  # pragma: no cover
 
     def load(self) -> Any:
-        return self.shared_memory_dataset.load()
+        return self.shared_memory_dataset.load().load()
 
     def save(self, data: Any) -> None:
         """Calls save method of a shared MemoryDataset in SyncManager."""
         try:
-            self.shared_memory_dataset.save(data)
-        except Exception as exc:
-            # Checks if the error is due to serialisation or not
-            try:
-                pickle.dumps(data)
-            except Exception as serialisation_exc:  # SKIP_IF_NO_SPARK
-                raise DatasetError(
-                    f"{data.__class__!s} cannot be serialised. ParallelRunner "
-                    "implicit memory datasets can only be used with serialisable data"
-                ) from serialisation_exc
-            raise exc  # pragma: no cover
+            pickled = _PickledData.from_data(data)
+        except Exception as serialisation_exc:  # SKIP_IF_NO_SPARK
+            raise DatasetError(
+                f"{data.__class__!s} cannot be serialised. ParallelRunner "
+                "implicit memory datasets can only be used with serialisable data"
+            ) from serialisation_exc
+
+        try:
+            self.shared_memory_dataset.save(pickled)
+        except Exception:
+            if pickled.block_name:
+                _unlink_shared_memory(pickled.block_name)
+            raise
+        self._replace_shared_memory_blocks(pickled.block_name)
+
+    def _release(self) -> None:
+        if not self.shared_memory_dataset:
+            return
+        self._replace_shared_memory_blocks(None)
+        self.shared_memory_dataset.release()
+
+    def _move_out_of_shared_memory(self) -> None:
+        """Send the data held in a shared memory block, if any, through the
+        manager instead and free the block, so the data stays loadable without
+        leaving the block behind once the run is over.
+        """
+        if not self.shared_memory_dataset or not self._shared_memory_blocks:
+            return
+        data = self.load()
+        self.shared_memory_dataset.save(
+            _PickledData.from_data(data, use_shared_memory=False)
+        )
+        self._replace_shared_memory_blocks(None)
+
+    def _replace_shared_memory_blocks(self, block_name: str | None) -> None:
+        """Record the shared memory block holding the current data, if any,
+        and free the blocks of any previous data.
+        """
+        previous_blocks = list(self._shared_memory_blocks)
+        self._shared_memory_blocks[:] = [block_name] if block_name else []
+        for name in previous_blocks:
+            _unlink_shared_memory(name)
 
     def _describe(self) -> dict[str, Any]:
         """SharedMemoryDataset doesn't have any constructor argument to return."""
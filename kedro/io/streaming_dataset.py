@@ -0,0 +1,148 @@
+"""``StreamingDataset`` is a dataset implementation which streams the chunks
+saved by one node to another node running at the same time.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from kedro.io.core import AbstractDataset, DatasetError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class StreamingDataset(AbstractDataset):
+    """``StreamingDataset`` passes the chunks saved by a node, typically a
+    generator node, through a bounded in-memory queue to the node loading it,
+    which receives an iterator over the chunks while the producing node is
+    still running. Once ``max_chunks`` chunks are waiting, saving blocks until
+    the consuming node takes one, so memory is bounded by the queue depth
+    rather than by the size of the whole data.
+
+    Streams are only supported by ``ThreadRunner``, which starts the nodes
+    linked by streams together. A stream must be saved by exactly one node
+    and loaded by exactly one node.
+
+    Example:
+    ``` python
+    from kedro.io import DataCatalog, StreamingDataset
+    from kedro.pipeline import node, pipeline
+    from kedro.runner import ThreadRunner
+
+
+    def read_events(path):
+        with open(path) as f:
+            yield from f
+
+
+    def count_events(events):
+        return sum(1 for _ in events)
+
+
+    catalog = DataCatalog({"events": StreamingDataset(max_chunks=4)})
+    ThreadRunner().run(
+        pipeline(
+            [
+                node(read_events, "params:path", "events"),
+                node(count_events, "events", "count"),
+            ]
+        ),
+        catalog,
+    )
+    ```
+    """
+
+    def __init__(self, max_chunks: int = 8, metadata: dict[str, Any] | None = None):
+        """Creates a new instance of ``StreamingDataset``.
+
+        Args:
+            max_chunks: Maximum number of chunks waiting to be consumed.
+            metadata: Any arbitrary metadata.
+                This is ignored by Kedro, but may be consumed by users or external plugins.
+
+        Raises:
+            DatasetError: When ``max_chunks`` is not positive.
+        """
+        if max_chunks <= 0:
+            raise DatasetError("'max_chunks' should be positive.")
+        self._max_chunks = max_chunks
+        self.metadata = metadata
+        self._EPHEMERAL = True
+        self._condition = threading.Condition()
+        self._chunks: deque[Any] = deque()
+        self._closed = False
+        self._discarding = False
+        self._error: str | None = None
+
+    def load(self) -> Iterator[Any]:
+        return self._iter_chunks()
+
+    def save(self, data: Any) -> None:
+        with self._condition:
+            while len(self._chunks) >= self._max_chunks and not (
+                self._error or self._discarding
+            ):
+                self._condition.wait()
+            if self._error:
+                raise DatasetError(f"Stream aborted: {self._error}")
+            if self._closed:
+                raise DatasetError("Cannot save to a closed stream.")
+            if not self._discarding:
+                self._chunks.append(data)
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Mark the end of the stream once the producing node has completed."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def abort(self, reason: str) -> None:
+        """Fail the nodes waiting on the stream, e.g. when the other node
+        linked by the stream has failed.
+
+        Args:
+            reason: Why the stream is aborted.
+        """
+        with self._condition:
+            self._error = reason
+            self._chunks.clear()
+            self._condition.notify_all()
+
+    def reset(self) -> None:
+        """Empty the stream and open it for a new run."""
+        with self._condition:
+            self._chunks.clear()
+            self._closed = False
+            self._discarding = False
+            self._error = None
+
+    def _iter_chunks(self) -> Iterator[Any]:
+        while True:
+            with self._condition:
+                while not (self._chunks or self._closed or self._error):
+                    self._condition.wait()
+                if self._error:
+                    raise DatasetError(f"Stream aborted: {self._error}")
+                if not self._chunks:
+                    return
+                chunk = self._chunks.popleft()
+                self._condition.notify_all()
+            yield chunk
+
+    def _exists(self) -> bool:
+        return self._closed or bool(self._chunks)
+
+    def _release(self) -> None:
+        # The consuming node may stop iterating before the producing node has
+        # completed, whose remaining chunks are then dropped
+        with self._condition:
+            self._chunks.clear()
+            self._discarding = True
+            self._condition.notify_all()
+
+    def _describe(self) -> dict[str, Any]:
+        return {"max_chunks": self._max_chunks}
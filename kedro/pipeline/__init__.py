@@ -5,6 +5,7 @@ data-driven pipelines.
 from .llm_context import LLMContext, LLMContextNode, llm_context_node, tool
 from .node import GroupedNodes, Node, node
 from .pipeline import Pipeline, pipeline
+from .plan_cache import PlanCache
 
 __all__ = [
     "node",
@@ -12,6 +13,7 @@ __all__ = [
     "Node",
     "Pipeline",
     "GroupedNodes",
+    "PlanCache",
     "llm_context_node",
     "LLMContext",
     "LLMContextNode",
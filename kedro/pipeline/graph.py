@@ -0,0 +1,338 @@
+"""``_PipelineGraph`` holds the dependencies between the nodes of a ``Pipeline``
+as dense integer ids in flat arrays, so that sorting and traversing the graph
+does not need to hash ``Node`` objects, and answers which nodes a set of nodes
+depends on, or is depended on by, with bitsets. ``_DatasetNames`` summarises
+the datasets of a pipeline to validate only the new nodes when combining
+pipelines.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from .transcoding import TRANSCODING_SEPARATOR, _strip_transcoding
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from kedro.pipeline.node import Node
+
+
+class _PipelineGraph:
+    """Dependency graph of a sequence of nodes. Nodes are identified by their
+    position in the sequence, and datasets, with their transcoding format
+    stripped, by the order in which they are first seen.
+
+    Parents, children and consumers are stored in compressed sparse row layout:
+    the parents of node ``i`` are
+    ``parent_ids[parent_offsets[i]:parent_offsets[i + 1]]``, and likewise for
+    the children of a node and the nodes consuming a dataset.
+    """
+
+    def __init__(self, nodes: Sequence[Node]):
+        """Index the datasets of ``nodes`` and sort the nodes in layers.
+
+        Args:
+            nodes: The nodes of the pipeline, with unique outputs.
+        """
+        n_nodes = len(nodes)
+        dataset_ids: dict[str, int] = {}
+        # dataset id -> id of the node producing it, or -1
+        producers = array("i")
+        # Distinct datasets loaded by each node, in CSR layout
+        input_offsets = array("i", [0])
+        input_ids = array("i")
+
+        # Names as written in the nodes, to strip each of them only once
+        known_ids: dict[str, int] = {}
+
+        def intern(name: str) -> int:
+            dataset_id = known_ids.get(name)
+            if dataset_id is None:
+                dataset_id = dataset_ids.setdefault(
+                    _strip_transcoding(name), len(dataset_ids)
+                )
+                if dataset_id == len(producers):
+                    producers.append(-1)
+                known_ids[name] = dataset_id
+            return dataset_id
+
+        for node_id, node in enumerate(nodes):
+            start = len(input_ids)
+            for name in node.inputs:
+                dataset_id = intern(name)
+                if dataset_id not in input_ids[start:]:
+                    input_ids.append(dataset_id)
+            input_offsets.append(len(input_ids))
+            for name in node.outputs:
+                producers[intern(name)] = node_id
+
+        parent_offsets = array("i", [0])
+        parent_ids = array("i")
+        child_counts = [0] * n_nodes
+        for node_id in range(n_nodes):
+            parents = {
+                producers[dataset_id]
+                for dataset_id in input_ids[
+                    input_offsets[node_id] : input_offsets[node_id + 1]
+                ]
+            }
+            parents.discard(-1)
+            for parent in parents:
+                child_counts[parent] += 1
+            parent_ids.extend(sorted(parents))
+            parent_offsets.append(len(parent_ids))
+
+        self.dataset_ids = dataset_ids
+        self.producers = producers
+        self.parent_offsets = parent_offsets
+        self.parent_ids = parent_ids
+        self.child_offsets, self.child_ids = _transpose(
+            parent_offsets, parent_ids, child_counts
+        )
+        consumer_counts = [0] * len(dataset_ids)
+        for dataset_id in input_ids:
+            consumer_counts[dataset_id] += 1
+        self.consumer_offsets, self.consumer_ids = _transpose(
+            input_offsets, input_ids, consumer_counts
+        )
+        self.layers = self._sort_layers()
+
+    # Arrays making up the graph, next to the dataset index and the layers
+    _ARRAYS = (
+        "producers",
+        "parent_offsets",
+        "parent_ids",
+        "child_offsets",
+        "child_ids",
+        "consumer_offsets",
+        "consumer_ids",
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Represent the graph with JSON serialisable types."""
+        data: dict[str, Any] = {
+            name: list(getattr(self, name)) for name in self._ARRAYS
+        }
+        data["datasets"] = list(self.dataset_ids)
+        data["layers"] = self.layers
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _PipelineGraph:
+        """Restore a graph represented by ``to_dict`` without indexing the
+        nodes again.
+        """
+        graph = cls.__new__(cls)
+        for name in cls._ARRAYS:
+            setattr(graph, name, array("i", data[name]))
+        graph.dataset_ids = {name: i for i, name in enumerate(data["datasets"])}
+        graph.layers = data["layers"]
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.parent_offsets) - 1
+
+    def parents(self, node_id: int) -> array:
+        """Ids of the nodes producing an input of node ``node_id``."""
+        return self.parent_ids[
+            self.parent_offsets[node_id] : self.parent_offsets[node_id + 1]
+        ]
+
+    def children(self, node_id: int) -> array:
+        """Ids of the nodes loading an output of node ``node_id``."""
+        return self.child_ids[
+            self.child_offsets[node_id] : self.child_offsets[node_id + 1]
+        ]
+
+    def consumers(self, name: str) -> array:
+        """Ids of the nodes loading the dataset ``name``, in any format."""
+        dataset_id = self.dataset_ids.get(_strip_transcoding(name))
+        if dataset_id is None:
+            return array("i")
+        return self.consumer_ids[
+            self.consumer_offsets[dataset_id] : self.consumer_offsets[dataset_id + 1]
+        ]
+
+    def producer(self, name: str) -> int:
+        """Id of the node saving the dataset ``name``, in any format, or -1."""
+        dataset_id = self.dataset_ids.get(_strip_transcoding(name))
+        return -1 if dataset_id is None else self.producers[dataset_id]
+
+    def _sort_layers(self) -> list[list[int]]:
+        """Kahn's algorithm: each layer holds the nodes whose parents are all
+        in earlier layers. Nodes on or after a cycle are left out.
+        """
+        offsets = self.parent_offsets
+        pending = array(
+            "i", (offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1))
+        )
+        layers = []
+        layer = [i for i, count in enumerate(pending) if not count]
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for node_id in layer:
+                for child in self.children(node_id):
+                    pending[child] -= 1
+                    if not pending[child]:
+                        next_layer.append(child)
+            layer = next_layer
+        return layers
+
+    def descendants(self, node_ids: Iterable[int]) -> int:
+        """Bitset of the nodes ``node_ids`` and of all the nodes depending on
+        them, where bit ``i`` stands for node ``i``.
+        """
+        return self._reach(node_ids, self.child_offsets, self.child_ids)
+
+    def ancestors(self, node_ids: Iterable[int]) -> int:
+        """Bitset of the nodes ``node_ids`` and of all the nodes they depend
+        on, where bit ``i`` stands for node ``i``.
+        """
+        return self._reach(node_ids, self.parent_offsets, self.parent_ids)
+
+    def _reach(self, node_ids: Iterable[int], offsets: array, ids: array) -> int:
+        """Walk the CSR adjacency ``offsets``/``ids`` from ``node_ids``, so the
+        cost grows with the nodes reached rather than with the whole graph.
+        """
+        seen = bytearray(len(self))
+        reached = []
+        for node_id in node_ids:
+            if not seen[node_id]:
+                seen[node_id] = 1
+                reached.append(node_id)
+        stack = list(reached)
+        while stack:
+            node_id = stack.pop()
+            for other in ids[offsets[node_id] : offsets[node_id + 1]]:
+                if not seen[other]:
+                    seen[other] = 1
+                    reached.append(other)
+                    stack.append(other)
+        return _bit_mask(reached)
+
+    @property
+    def is_cyclic(self) -> bool:
+        return sum(map(len, self.layers)) < len(self)
+
+    def find_cycle(self) -> list[int]:
+        """Ids of the nodes forming one of the cycles of the graph, or an empty
+        list if there are none.
+        """
+        remaining = set(range(len(self))).difference(*self.layers)
+        if not remaining:
+            return []
+        # Every node left out of the layers has a parent left out as well, so
+        # walking up the parents eventually comes back to a visited node
+        path: list[int] = []
+        position: dict[int, int] = {}
+        node_id = min(remaining)
+        while node_id not in position:
+            position[node_id] = len(path)
+            path.append(node_id)
+            node_id = next(p for p in self.parents(node_id) if p in remaining)
+        return path[position[node_id] :]
+
+
+def _transpose(offsets: array, ids: array, counts: list[int]) -> tuple[array, array]:
+    """Invert a CSR adjacency, given the number of entries of each column."""
+    transposed_offsets = array("i", [0])
+    for count in counts:
+        transposed_offsets.append(transposed_offsets[-1] + count)
+    transposed_ids = array("i", [0]) * len(ids)
+    cursor = list(transposed_offsets[:-1])
+    for row in range(len(offsets) - 1):
+        for column in ids[offsets[row] : offsets[row + 1]]:
+            transposed_ids[cursor[column]] = row
+            cursor[column] += 1
+    return transposed_offsets, transposed_ids
+
+
+class _DatasetNames:
+    """Sets of the dataset names used by some nodes, with transcoding
+    stripped unless noted, which are merged when combining pipelines.
+    """
+
+    __slots__ = (
+        "confirms",
+        "has_namespaces",
+        "inputs",
+        "outputs",
+        "plain_names",
+        "transcoded_names",
+    )
+
+    def __init__(self, nodes: Iterable[Node] = ()):
+        self.inputs: set[str] = set()
+        self.outputs: set[str] = set()
+        self.confirms: set[str] = set()
+        # Names referenced without a transcoding format, and names referenced
+        # with one, which cannot be the same
+        self.plain_names: set[str] = set()
+        self.transcoded_names: set[str] = set()
+        self.has_namespaces = False
+        for node in nodes:
+            for name in node.inputs:
+                self.inputs.add(self._add_name(name))
+            for name in node.outputs:
+                self.outputs.add(self._add_name(name))
+            self.confirms.update(map(_strip_transcoding, node.confirms))
+            self.has_namespaces = self.has_namespaces or bool(node.namespace)
+
+    def _add_name(self, name: str) -> str:
+        if TRANSCODING_SEPARATOR in name:
+            name = _strip_transcoding(name)
+            self.transcoded_names.add(name)
+        else:
+            self.plain_names.add(name)
+        return name
+
+    def conflicts_with(self, other: _DatasetNames) -> bool:
+        """Whether nodes using these datasets and nodes using the ``other``
+        datasets cannot be part of the same pipeline.
+        """
+        return bool(
+            self.outputs & other.outputs
+            or self.confirms & other.confirms
+            or self.plain_names & other.transcoded_names
+            or self.transcoded_names & other.plain_names
+        )
+
+    def __or__(self, other: _DatasetNames) -> _DatasetNames:
+        merged = _DatasetNames()
+        merged.inputs = self.inputs | other.inputs
+        merged.outputs = self.outputs | other.outputs
+        merged.confirms = self.confirms | other.confirms
+        merged.plain_names = self.plain_names | other.plain_names
+        merged.transcoded_names = self.transcoded_names | other.transcoded_names
+        merged.has_namespaces = self.has_namespaces or other.has_namespaces
+        return merged
+
+
+def _bit_mask(ids: Iterable[int]) -> int:
+    """Bitset of ``ids``, packed into bytes so it is built in one pass."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    packed = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        packed[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(packed, "little")
+
+
+def _bit_ids(mask: int) -> list[int]:
+    """Positions of the set bits of ``mask``, in increasing order. The mask
+    is split in 64-bit words, skipping the empty ones, and the lowest set bit
+    of each word is taken with ``word & -word``.
+    """
+    packed = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    ids = []
+    for start in range(0, len(packed), 8):
+        word = int.from_bytes(packed[start : start + 8], "little")
+        while word:
+            lowest = word & -word
+            ids.append(start * 8 + lowest.bit_length() - 1)
+            word ^= lowest
+    return ids
@@ -4,16 +4,20 @@ of Kedro pipelines.
 
 from __future__ import annotations
 
+import asyncio
 import copy
 import hashlib
 import inspect
 import logging
 import re
+import sys
 import warnings
 from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import cached_property, partial
+from functools import partial
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 from warnings import warn
 
@@ -24,11 +28,15 @@ from kedro.utils import KedroExperimentalWarning
 from .transcoding import _strip_transcoding
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterable
+    from collections.abc import Callable, Coroutine, Generator, Iterable, Iterator
 
     from kedro.pipeline.preview_contract import PreviewPayload
 
 
+# Shared by all the nodes without tags
+_NO_TAGS: frozenset[str] = frozenset()
+
+
 @dataclass
 class GroupedNodes:
     """Represents a logical group of nodes, typically by namespace
@@ -48,6 +56,23 @@ class Node:
     run user-provided functions as part of Kedro pipelines.
     """
 
+    __slots__ = (
+        "_confirms",
+        "_func",
+        "_hash",
+        "_input_names",
+        "_inputs",
+        "_name",
+        "_namespace",
+        "_output_names",
+        "_outputs",
+        "_preview_fn",
+        "_resources",
+        "_tags",
+        "_timeout",
+        "_unique_key",
+    )
+
     def __init__(  # noqa: PLR0913, PLR0912
         self,
         func: Callable,
@@ -59,6 +84,8 @@ class Node:
         confirms: str | list[str] | None = None,
         namespace: str | None = None,
         preview_fn: Callable[..., PreviewPayload] | None = None,
+        resources: dict[str, float | str] | None = None,
+        timeout: float | None = None,
     ):
         """Create a node in the pipeline by providing a function to be called
         along with variable names for inputs and/or outputs.
@@ -90,6 +117,12 @@ class Node:
             preview_fn: Optional preview function that returns one of the valid
                 preview types (TextPreview, MermaidPreview, ImagePreview, or CustomPreview).
                 This is an experimental feature.
+            resources: Optional amounts of machine resources the node needs
+                while running, e.g. ``{"cpu": 4, "mem": "8G"}``. Amounts are
+                non-negative numbers, or strings with an optional ``K``, ``M``,
+                ``G`` or ``T`` binary unit suffix.
+            timeout: Optional number of seconds the node may run for. Runners
+                executing nodes concurrently stop the run when it is exceeded.
 
         Raises:
             ValueError: Raised in the following cases:
@@ -100,6 +133,8 @@ class Node:
                 d) When the given node name violates the requirements:
                 it must contain only letters, digits, hyphens, underscores
                 and/or fullstops.
+                e) When the given resource amounts are invalid.
+                f) When the given timeout is not positive.
 
         """
         if not callable(func):
@@ -155,11 +190,17 @@ class Node:
         self._validate_inputs(func, inputs)
 
         self._func = func
-        self._inputs = inputs
+        self._inputs = _intern_names(inputs)
         # The type of _outputs is picked up as possibly being None, however the checks above prevent that
         # ever being the case. Mypy doesn't get that though, so it complains about the assignment of outputs to
         # _outputs with different types.
-        self._outputs: str | list[str] | dict[str, str] = outputs  # type: ignore[assignment]
+        self._outputs: str | list[str] | dict[str, str] = _intern_names(outputs)  # type: ignore[assignment]
+        self._input_names = self._list_inputs()
+        self._output_names = (
+            self._outputs
+            if isinstance(self._outputs, list)
+            else _to_list(self._outputs)
+        )
         if name and not re.match(r"[\w\.-]+$", name):
             raise ValueError(
                 f"'{name}' is not a valid node name. It must contain only "
@@ -167,17 +208,23 @@ class Node:
             )
         self._name = name
         self._namespace = namespace
-        self._tags = set(_to_list(tags))
-        for tag in self._tags:
-            if not re.match(r"[\w\.-]+$", tag):
-                raise ValueError(
-                    f"'{tag}' is not a valid node tag. It must contain only "
-                    f"letters, digits, hyphens, underscores and/or fullstops."
-                )
+        self._tags = frozenset(_to_list(tags)) or _NO_TAGS
+        _validate_tags(self._tags)
 
         self._validate_unique_outputs()
         self._validate_inputs_dif_than_outputs()
         self._confirms = confirms
+        self._resources: dict[str, float] | None = {
+            resource: _parse_resource_amount(amount)
+            for resource, amount in (resources or {}).items()
+        } or None
+        if timeout is not None and not timeout > 0:
+            raise ValueError(
+                _node_error_message(
+                    f"'timeout' must be a positive number of seconds, not {timeout!r}."
+                )
+            )
+        self._timeout = timeout
 
         if preview_fn:
             if not callable(preview_fn):
@@ -195,12 +242,14 @@ class Node:
                 setattr(Node, "__preview_fn_warned__", True)
 
         self._preview_fn = preview_fn
+        self._set_unique_key()
 
     def _copy(self, **overwrite_params: Any) -> Node:
         """
-        Helper function to copy the node, replacing some values.
+        Helper function to copy the node, replacing some values. A copy only
+        changing the tags or the namespace skips validating the node again.
         """
-        params = {
+        params: dict[str, Any] = {
             "func": self._func,
             "inputs": self._inputs,
             "outputs": self._outputs,
@@ -209,16 +258,51 @@ class Node:
             "tags": self._tags,
             "confirms": self._confirms,
             "preview_fn": self._preview_fn,
+            "resources": self._resources,
+            "timeout": self._timeout,
+        }
+        changed = {
+            key for key, value in overwrite_params.items() if value != params[key]
         }
         params.update(overwrite_params)
-        return Node(**params)  # type: ignore[arg-type]
+        if not changed <= {"tags", "namespace"}:
+            return Node(**params)
+
+        tags = frozenset(_to_list(params["tags"])) or _NO_TAGS
+        _validate_tags(tags - self._tags)
+        namespace = params["namespace"]
+        if namespace != self._namespace:
+            for name in chain(self._input_names, self._output_names):
+                _node_dataset_name_validation(name, namespace)
+
+        node = Node.__new__(Node)
+        for attribute in Node.__slots__:
+            setattr(node, attribute, getattr(self, attribute))
+        node._tags = tags
+        if namespace != self._namespace:
+            node._namespace = namespace
+            node._set_unique_key()
+        return node
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {attribute: getattr(self, attribute) for attribute in Node.__slots__}
+        # Hashes of strings differ between processes
+        del state["_hash"]
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+        self._hash = hash(self._unique_key)
 
     @property
     def _logger(self) -> logging.Logger:
         return logging.getLogger(__name__)
 
-    @cached_property
-    def _unique_key(self) -> tuple[Any, Any] | Any | tuple:
+    def _set_unique_key(self) -> None:
+        """Compute the key identifying the node, and its hash, once."""
+
         def hashable(value: Any) -> tuple[Any, Any] | Any | tuple:
             if isinstance(value, dict):
                 # we sort it because a node with inputs/outputs
@@ -229,12 +313,17 @@ class Node:
                 return tuple(value)
             return value
 
-        return self.name, hashable(self._inputs), hashable(self._outputs)
+        self._unique_key: tuple[Any, Any] | Any | tuple = (
+            self.name,
+            hashable(self._inputs),
+            hashable(self._outputs),
+        )
+        self._hash = hash(self._unique_key)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Node):
             return NotImplemented
-        return self._unique_key == other._unique_key
+        return self._hash == other._hash and self._unique_key == other._unique_key
 
     def __lt__(self, other: Any) -> bool:
         if not isinstance(other, Node):
@@ -242,7 +331,7 @@ class Node:
         return self._unique_key < other._unique_key
 
     def __hash__(self) -> int:
-        return hash(self._unique_key)
+        return self._hash
 
     def __str__(self) -> str:
         def _set_to_str(xset: set | list[str]) -> str:
@@ -292,8 +381,8 @@ class Node:
             func: The new function for node's execution.
         """
         self._func = func
-
-        del self.inputs  # clear cached inputs
+        # Inputs given as a dictionary are ordered by the function signature
+        self._input_names = self._list_inputs()
 
     @property
     def tags(self) -> set[str]:
@@ -364,7 +453,7 @@ class Node:
         """
         return self._namespace
 
-    @cached_property
+    @property
     def namespace_prefixes(self) -> list[str]:
         """Return all hierarchical prefixes of the node's namespace.
 
@@ -383,17 +472,23 @@ class Node:
             yield prefix
             prefix += "."
 
-    @cached_property
+    @property
     def inputs(self) -> list[str]:
         """Return node inputs as a list, in the order required to bind them properly to
         the node's function.
 
         Returns:
-            Node input names as a list.
+            Node input names as a list. The list belongs to the node and
+            must not be modified.
 
         """
+        return self._input_names
+
+    def _list_inputs(self) -> list[str]:
         if isinstance(self._inputs, dict):
             return _dict_inputs_to_list(self._func, self._inputs)
+        if isinstance(self._inputs, list):
+            return self._inputs
         return _to_list(self._inputs)
 
     @property
@@ -402,10 +497,29 @@ class Node:
             if possible.
 
         Returns:
-            Node output names as a list.
+            Node output names as a list. The list belongs to the node and
+            must not be modified.
+
+        """
+        return self._output_names
+
+    @property
+    def resources(self) -> dict[str, float]:
+        """Return the amounts of machine resources the node needs while running.
+
+        Returns:
+            Dictionary mapping resource names to the amounts the node needs.
+        """
+        return dict(self._resources or {})
+
+    @property
+    def timeout(self) -> float | None:
+        """Return the number of seconds the node may run for, if limited.
 
+        Returns:
+            The timeout of the node in seconds, or None.
         """
-        return _to_list(self._outputs)
+        return self._timeout
 
     @property
     def confirms(self) -> list[str]:
@@ -443,7 +557,7 @@ class Node:
                 mermaid = "graph LR\\n"
                 for i, step in enumerate(steps):
                     if i < len(steps) - 1:
-                        mermaid += f"    {step} --> {steps[i+1]}\\n"
+                        mermaid += f"    {step} --> {steps[i + 1]}\\n"
 
                 return MermaidPreview(content=mermaid)
 
@@ -530,37 +644,75 @@ class Node:
         """
         self._logger.info("Running node: %s", str(self))
 
-        outputs = None
+        try:
+            outputs = self._call_func(inputs)
+            # ``async def`` node functions are run to completion on a new event loop
+            if inspect.iscoroutine(outputs):
+                outputs = _run_coroutine(outputs)
 
-        if not (inputs is None or isinstance(inputs, dict)):
-            raise ValueError(
-                f"Node.run() expects a dictionary or None, "
-                f"but got {type(inputs)} instead"
-            )
+            return self._outputs_to_dictionary(outputs)
+
+        # purposely catch all exceptions
+        except Exception as exc:
+            self._log_failure(exc)
+            raise exc
+
+    async def arun(self, inputs: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run this node like ``run``, awaiting the result of an ``async def``
+        node function on the running event loop.
+
+        Args:
+            inputs: Dictionary of inputs as specified at the creation of
+                the node.
+
+        Raises:
+            ValueError: When the node function inputs or outputs are
+                incompatible with the node definition, as for ``run``.
+            Exception: Any exception thrown during execution of the node.
+
+        Returns:
+            All produced node outputs are returned in a dictionary, where the
+            keys are defined by the node outputs.
+
+        """
+        self._logger.info("Running node: %s", str(self))
 
         try:
-            inputs = {} if inputs is None else inputs
-            if not self._inputs:
-                outputs = self._run_with_no_inputs(inputs)
-            elif isinstance(self._inputs, str):
-                outputs = self._run_with_one_input(inputs, self._inputs)
-            elif isinstance(self._inputs, list):
-                outputs = self._run_with_list(inputs, self._inputs)
-            elif isinstance(self._inputs, dict):
-                outputs = self._run_with_dict(inputs, self._inputs)
+            outputs = self._call_func(inputs)
+            if inspect.isawaitable(outputs):
+                outputs = await outputs
 
             return self._outputs_to_dictionary(outputs)
 
         # purposely catch all exceptions
         except Exception as exc:
-            self._logger.error(
-                "Node %s failed with error: \n%s",
-                str(self),
-                str(exc),
-                extra={"markup": True},
-            )
+            self._log_failure(exc)
             raise exc
 
+    def _call_func(self, inputs: dict[str, Any] | None) -> Any:
+        if not (inputs is None or isinstance(inputs, dict)):
+            raise ValueError(
+                f"Node.run() expects a dictionary or None, "
+                f"but got {type(inputs)} instead"
+            )
+
+        inputs = {} if inputs is None else inputs
+        if not self._inputs:
+            return self._run_with_no_inputs(inputs)
+        if isinstance(self._inputs, str):
+            return self._run_with_one_input(inputs, self._inputs)
+        if isinstance(self._inputs, list):
+            return self._run_with_list(inputs, self._inputs)
+        return self._run_with_dict(inputs, self._inputs)
+
+    def _log_failure(self, exc: Exception) -> None:
+        self._logger.error(
+            "Node %s failed with error: \n%s",
+            str(self),
+            str(exc),
+            extra={"markup": True},
+        )
+
     def _run_with_no_inputs(self, inputs: dict[str, Any]) -> Any:
         if inputs:
             raise ValueError(
@@ -608,7 +760,8 @@ class Node:
 
     def _outputs_to_dictionary(self, outputs: Any) -> dict[str, Any]:
         def _from_dict() -> dict[str, Any]:
-            result, iterator = outputs, None
+            result: Any = outputs
+            iterator: Iterator[Any] | None = None
             # generator functions are lazy and we need a peek into their first output
             if inspect.isgenerator(outputs):
                 (result,), iterator = spy(outputs)
@@ -638,7 +791,8 @@ class Node:
             return dict(zip(names, result))
 
         def _from_list() -> dict:
-            result, iterator = outputs, None
+            result: Any = outputs
+            iterator: Iterator[Any] | None = None
             # generator functions are lazy and we need a peek into their first output
             if inspect.isgenerator(outputs):
                 (result,), iterator = spy(outputs)
@@ -691,7 +845,7 @@ class Node:
                 ) from exc
 
     def _validate_unique_outputs(self) -> None:
-        cnt = Counter(self.outputs)
+        cnt = Counter(self._output_names)
         diff = {k for k in cnt if cnt[k] > 1}
         if diff:
             raise ValueError(
@@ -700,8 +854,8 @@ class Node:
             )
 
     def _validate_inputs_dif_than_outputs(self) -> None:
-        common_in_out = set(map(_strip_transcoding, self.inputs)).intersection(
-            set(map(_strip_transcoding, self.outputs))
+        common_in_out = set(map(_strip_transcoding, self._input_names)).intersection(
+            set(map(_strip_transcoding, self._output_names))
         )
         if common_in_out:
             raise ValueError(
@@ -727,6 +881,19 @@ class Node:
         return args, kwargs
 
 
+def _run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on a new event loop. When an event loop
+    is already running in this thread, e.g. in a Jupyter notebook, the new
+    loop runs in a worker thread, as ``asyncio.run`` cannot nest loops.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 def _node_error_message(msg: str) -> str:
     return (
         f"Invalid Node definition: {msg}\n"
@@ -734,6 +901,30 @@ def _node_error_message(msg: str) -> str:
     )
 
 
+def _validate_tags(tags: Iterable[str]) -> None:
+    for tag in tags:
+        if not re.match(r"[\w\.-]+$", tag):
+            raise ValueError(
+                f"'{tag}' is not a valid node tag. It must contain only "
+                f"letters, digits, hyphens, underscores and/or fullstops."
+            )
+
+
+def _intern_names(
+    names: str | list[str] | dict[str, str] | None,
+) -> str | list[str] | dict[str, str] | None:
+    """Intern the dataset names of node inputs or outputs, so that the nodes
+    loading and saving a dataset share one string.
+    """
+    if isinstance(names, str):
+        return sys.intern(names)
+    if isinstance(names, list):
+        return [sys.intern(name) for name in names]
+    if isinstance(names, dict):
+        return {key: sys.intern(name) for key, name in names.items()}
+    return names
+
+
 def _node_dataset_name_validation(name: str, namespace: str | None) -> None:
     """Validate the dataset name. The node inputs and outputs should not contain
     '.' characters. This is to ensure that the dot notation is reserved for Kedro's
@@ -771,6 +962,8 @@ def node(  # noqa: PLR0913
     confirms: str | list[str] | None = None,
     namespace: str | None = None,
     preview_fn: Callable[..., PreviewPayload] | None = None,
+    resources: dict[str, float | str] | None = None,
+    timeout: float | None = None,
 ) -> Node:
     """Create a node in the pipeline by providing a function to be called
     along with variable names for inputs and/or outputs.
@@ -800,6 +993,12 @@ def node(  # noqa: PLR0913
         preview_fn: Optional preview function that returns one of the valid
             preview types (TextPreview, MermaidPreview, ImagePreview, or CustomPreview).
             This is an experimental feature.
+        resources: Optional amounts of machine resources the node needs while
+            running, e.g. ``{"cpu": 4, "mem": "8G"}``. Runners configured with
+            resource limits only start the node when these amounts are free.
+        timeout: Optional number of seconds the node may run for. Runners
+            executing nodes concurrently stop the node and fail the run when
+            it is exceeded.
 
     Returns:
         A Node object with mapped inputs, outputs and function.
@@ -842,6 +1041,8 @@ def node(  # noqa: PLR0913
         confirms=confirms,
         namespace=namespace,
         preview_fn=preview_fn,
+        resources=resources,
+        timeout=timeout,
     )
 
 
@@ -855,6 +1056,33 @@ def _dict_inputs_to_list(
     return [*sig.args, *sig.kwargs.values()]
 
 
+_RESOURCE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def _parse_resource_amount(amount: float | str) -> float:
+    """Convert a resource amount, such as ``4``, ``"0.5"`` or ``"8G"``, to a number.
+
+    Raises:
+        ValueError: When the amount is negative or cannot be parsed.
+    """
+    value: float | None = None
+    if isinstance(amount, (int | float)) and not isinstance(amount, bool):
+        value = float(amount)
+    elif isinstance(amount, str):
+        match = re.match(
+            r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:iB|i|B)?\s*$", amount, re.I
+        )
+        if match:
+            value = float(match.group(1)) * _RESOURCE_UNITS[match.group(2).upper()]
+
+    if value is None or value < 0:
+        raise ValueError(
+            f"'{amount}' is not a valid resource amount. It must be a non-negative "
+            f"number, optionally followed by one of the units K, M, G or T."
+        )
+    return value
+
+
 def _to_list(element: str | Iterable[str] | dict[str, str] | None) -> list[str]:
     """Make a list out of node inputs/outputs.
 
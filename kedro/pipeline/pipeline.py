@@ -11,7 +11,6 @@ import difflib
 import json
 from collections import Counter, defaultdict, deque
 from functools import cached_property
-from graphlib import CycleError, TopologicalSorter
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 from warnings import warn
@@ -19,6 +18,12 @@ from warnings import warn
 import kedro
 from kedro.pipeline.node import GroupedNodes, Node, _to_list
 
+from .graph import (
+    _bit_ids,
+    _bit_mask,
+    _DatasetNames,
+    _PipelineGraph,
+)
 from .transcoding import _strip_transcoding, _transcode_split
 
 if TYPE_CHECKING:
@@ -266,74 +271,172 @@ class Pipeline:
         else:
             tagged_nodes = nodes_chain
 
-        self._nodes_by_name = {node.name: node for node in tagged_nodes}
         _validate_unique_outputs(tagged_nodes)
         _validate_unique_confirms(tagged_nodes)
 
-        # input -> nodes with input
-        self._nodes_by_input: dict[str, set[Node]] = defaultdict(set)
-        for node in tagged_nodes:
-            for input_ in node.inputs:
-                self._nodes_by_input[_strip_transcoding(input_)].add(node)
-
-        # output -> node with output
-        self._nodes_by_output: dict[str, Node] = {}
-        for node in tagged_nodes:
-            for output in node.outputs:
-                self._nodes_by_output[_strip_transcoding(output)] = node
-
-        self._nodes = tagged_nodes
-        self._toposorter = TopologicalSorter(self.node_dependencies)
-
-        # test for circular dependencies without executing the toposort for efficiency
-        try:
-            self._toposorter.prepare()
-        except CycleError as exc:
-            loop = list(set(exc.args[1]))
+        self._index(tagged_nodes)
+
+        if self._graph.is_cyclic:
+            loop = [tagged_nodes[i] for i in self._graph.find_cycle()]
             message = f"Circular dependencies exist among the following {len(loop)} item(s): {loop}"
-            raise CircularDependencyError(message) from exc
+            raise CircularDependencyError(message)
 
-        self._toposorted_nodes: list[Node] = []
-        self._toposorted_groups: list[list[Node]] = []
         if any(n.namespace for n in self._nodes):
             self._validate_namespaces()
 
+    def _index(
+        self, nodes: list[Node], node_ids_by_name: dict[str, int] | None = None
+    ) -> None:
+        self._nodes = nodes
+        if node_ids_by_name is None:
+            node_ids_by_name = {node.name: i for i, node in enumerate(nodes)}
+        self._node_ids_by_name = node_ids_by_name
+        # The pipeline whose dependency graph answers the slicing queries of
+        # this one, with the ids and the bitset of these nodes in that pipeline
+        self._index_root = self
+        self._root_ids: list[int] | None = None
+        self._root_mask = (1 << len(nodes)) - 1
+
+    @classmethod
+    def _from_validated(
+        cls, nodes: list[Node], node_ids_by_name: dict[str, int] | None = None
+    ) -> Pipeline:
+        """Create a ``Pipeline`` from nodes known to form a valid pipeline,
+        such as a subset of the nodes of another pipeline, without validating
+        them again.
+        """
+        pipeline = cls.__new__(cls)
+        pipeline._index(nodes, node_ids_by_name)
+        return pipeline
+
+    @cached_property
+    def _graph(self) -> _PipelineGraph:
+        return _PipelineGraph(self._nodes)
+
     @cached_property
-    def _node_children(self) -> dict[Node, set[Node]]:
-        node_children = defaultdict(set)
-        for child, parents in self.node_dependencies.items():
-            for parent in parents:
-                node_children[parent].add(child)
-        return node_children
-
-    def _shortest_path(self, start: Node, end: Node) -> list[Node]:
+    def _dataset_names(self) -> _DatasetNames:
+        return _DatasetNames(self._nodes)
+
+    def _node_ids(self, nodes: Iterable[Node]) -> list[int]:
+        """Ids of the nodes of this pipeline among ``nodes``."""
+        node_ids_by_name = self._node_ids_by_name
+        node_ids = []
+        for node in nodes:
+            node_id = node_ids_by_name.get(node.name)
+            if node_id is not None and self._nodes[node_id] == node:
+                node_ids.append(node_id)
+        return node_ids
+
+    def _union(self, other: Pipeline) -> Pipeline:
+        """Combine two pipelines, only validating the nodes of ``other``
+        missing from this pipeline against the datasets of this pipeline.
+        Whenever they may be invalid, the nodes are validated in full to
+        report the error.
+        """
+        node_ids_by_name = self._node_ids_by_name
+        new_nodes = []
+        for node in other._nodes:
+            node_id = node_ids_by_name.get(node.name)
+            if node_id is None:
+                new_nodes.append(node)
+            elif self._nodes[node_id] != node:
+                return Pipeline(set(self._nodes + other._nodes))
+        if not new_nodes:
+            return self
+
+        names = self._dataset_names
+        new_names = _DatasetNames(new_nodes)
+        if names.conflicts_with(new_names):
+            return Pipeline(set(self._nodes + other._nodes))
+
+        node_ids_by_name = dict(node_ids_by_name)
+        for node_id, node in enumerate(new_nodes, start=len(self._nodes)):
+            node_ids_by_name[node.name] = node_id
+        combined = Pipeline._from_validated(self._nodes + new_nodes, node_ids_by_name)
+        combined._dataset_names = names | new_names
+
+        # A cycle goes both from the nodes of this pipeline to the new nodes
+        # and back, and a namespace is only interrupted along a new path
+        loads_existing = not new_names.inputs.isdisjoint(names.outputs)
+        loaded_by_existing = not new_names.outputs.isdisjoint(names.inputs)
+        if loads_existing and loaded_by_existing and combined._graph.is_cyclic:
+            return Pipeline(set(self._nodes + other._nodes))
+        if (
+            (loads_existing or loaded_by_existing)
+            and names.has_namespaces
+            and new_names.has_namespaces
+        ):
+            combined._validate_namespaces()
+        return combined
+
+    def _root_bits(self, node_ids: Iterable[int]) -> int:
+        return _bit_mask(self._root_node_ids(node_ids))
+
+    def _root_node_ids(self, node_ids: Iterable[int]) -> Iterable[int]:
+        if self._root_ids is not None:
+            return [self._root_ids[i] for i in node_ids]
+        return node_ids
+
+    def _descendants_mask(self, node_ids: Iterable[int]) -> int:
+        graph = self._index_root._graph
+        return graph.descendants(self._root_node_ids(node_ids)) & self._root_mask
+
+    def _ancestors_mask(self, node_ids: Iterable[int]) -> int:
+        graph = self._index_root._graph
+        return graph.ancestors(self._root_node_ids(node_ids)) & self._root_mask
+
+    def _slice(self, mask: int, closed: bool = False) -> Pipeline:
+        """Create a ``Pipeline`` from the nodes of ``mask``, a bitset over the
+        nodes of the index root. When ``closed``, the new pipeline holds every
+        node on the paths between its nodes, as the descendants or ancestors
+        of some nodes do, so reachability within it is the same as in the root
+        and it is sliced further through the root's graph.
+        """
+        root = self._index_root
+        root_ids = _bit_ids(mask)
+        sliced = Pipeline._from_validated([root._nodes[i] for i in root_ids])
+        if closed:
+            sliced._index_root = root
+            sliced._root_ids = root_ids
+            sliced._root_mask = mask
+        if mask == root._root_mask:
+            # The same nodes in the same order, such as an unfiltered pipeline,
+            # share the graph and order the root has already computed
+            for name in ("_graph", "_toposorted_ids"):
+                if name in root.__dict__:
+                    sliced.__dict__[name] = root.__dict__[name]
+        return sliced
+
+    def _shortest_path(self, start: int, end: int) -> list[Node]:
         """Find the shortest path between two nodes in the pipeline, if it exists."""
         queue = deque([(start, [start])])
-        visited = set([start])
+        visited = {start}
 
         while queue:
-            node, path = queue.popleft()
-            if node == end:
-                return path
-            for child in self._node_children[node]:
+            node_id, path = queue.popleft()
+            if node_id == end:
+                return [self._nodes[i] for i in path]
+            for child in self._graph.children(node_id):
                 if child not in visited:
                     visited.add(child)
                     queue.append((child, [*path, child]))
         return []  # pragma: no cover
 
     def _validate_namespaces(self) -> None:
-        node_parents: dict[Node, set[Node]] = self.node_dependencies
-
-        # Here we keep all visited namespaces and the nodes that interrupted them for each node
-        # the mapping is as follows:
-        # {node: {namespace: {interrupting_node}}}
-        seen_namespaces: dict[Node, dict[str, set[Node]]] = defaultdict(dict)
-        for node in self.nodes:
-            visited: dict[str, set[Node]] = defaultdict(set)
-            for parent in node_parents[node]:
+        nodes = self._nodes
+
+        # Here we keep all visited namespaces and the ids of the nodes that
+        # interrupted them for each node id, the mapping is as follows:
+        # {node_id: {namespace: {interrupting_node_id}}}
+        seen_namespaces: dict[int, dict[str, set[int]]] = {}
+        for node_id in self._toposorted_ids:
+            node = nodes[node_id]
+            visited: dict[str, set[int]] = defaultdict(set)
+            for parent_id in self._graph.parents(node_id):
+                parent = nodes[parent_id]
                 last_namespace = parent.namespace or ""
                 curr_namespace = node.namespace or ""
-                seen = seen_namespaces[parent]
+                seen = seen_namespaces[parent_id]
                 # If any part of curr_namespace was visited in paths leading to parent
                 interrupted = next(
                     (ns for ns in node.namespace_prefixes if ns in seen),
@@ -344,14 +447,14 @@ class Pipeline:
                     interrupted + "."
                 ):
                     start = next(iter(seen[interrupted]))
-                    path = [n.name for n in self._shortest_path(start, node)]
+                    path = [n.name for n in self._shortest_path(start, node_id)]
                     warn(
                         f"Namespace '{interrupted}' is interrupted by nodes {path[:-1]} and thus invalid.",
                         UserWarning,
                     )
                 # All visited namespaces for the current node get updated with the parent's visited namespaces
-                for ns, nodes in seen.items():
-                    visited[ns].update(nodes)
+                for ns, interrupting_ids in seen.items():
+                    visited[ns].update(interrupting_ids)
                 # If the current namespace is different from the last namespace and isn't a child namespace,
                 # mark the last namespace and all unrelated parent namespaces as visited to detect potential future interruptions
                 if (
@@ -361,10 +464,10 @@ class Pipeline:
                 ):
                     for prefix in parent.namespace_prefixes:
                         if not curr_namespace.startswith(prefix):
-                            visited[prefix].add(node)
+                            visited[prefix].add(node_id)
 
             # Now we have created the visited namespaces for the current node
-            seen_namespaces[node] = visited
+            seen_namespaces[node_id] = visited
 
     def __repr__(self) -> str:  # pragma: no cover
         """Pipeline ([node1, ..., node10 ...], name='pipeline_name')"""
@@ -381,7 +484,7 @@ class Pipeline:
     def __add__(self, other: Any) -> Pipeline:
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self._nodes + other._nodes))
+        return self._union(other)
 
     def __radd__(self, other: Any) -> Pipeline:
         if isinstance(other, int) and other == 0:
@@ -391,17 +494,18 @@ class Pipeline:
     def __sub__(self, other: Any) -> Pipeline:
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self._nodes) - set(other._nodes))
+        removed = self._root_bits(self._node_ids(other._nodes))
+        return self._slice(self._root_mask & ~removed)
 
     def __and__(self, other: Any) -> Pipeline:
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self._nodes) & set(other._nodes))
+        return self._slice(self._root_bits(self._node_ids(other._nodes)))
 
     def __or__(self, other: Any) -> Pipeline:
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self._nodes + other._nodes))
+        return self._union(other)
 
     def all_inputs(self) -> set[str]:
         """All inputs for all nodes in the pipeline.
@@ -531,13 +635,21 @@ class Pipeline:
             Dictionary where keys are nodes and values are sets made up of
             their parent nodes. Independent nodes have this as empty sets.
         """
-        dependencies: dict[Node, set[Node]] = {node: set() for node in self._nodes}
-        for parent in self._nodes:
-            for output in parent.outputs:
-                for child in self._nodes_by_input[_strip_transcoding(output)]:
-                    dependencies[child].add(parent)
+        nodes = self._nodes
+        return {
+            node: {nodes[parent_id] for parent_id in self._graph.parents(node_id)}
+            for node_id, node in enumerate(nodes)
+        }
 
-        return dependencies
+    @cached_property
+    def _toposorted_ids(self) -> list[int]:
+        # Same order as sorting the nodes themselves, without calling __lt__
+        keys = [node._unique_key for node in self._nodes]
+        return [
+            node_id
+            for layer in self._graph.layers
+            for node_id in sorted(layer, key=keys.__getitem__)
+        ]
 
     @cached_property
     def nodes(self) -> list[Node]:
@@ -549,10 +661,8 @@ class Pipeline:
             The list of all pipeline nodes in topological order.
 
         """
-        if not self._toposorted_nodes:
-            self._toposorted_nodes = [n for group in self.grouped_nodes for n in group]
-
-        return list(self._toposorted_nodes)
+        nodes = self._nodes
+        return [nodes[node_id] for node_id in self._toposorted_ids]
 
     @cached_property
     def grouped_nodes(self) -> list[list[Node]]:
@@ -564,14 +674,13 @@ class Pipeline:
             The pipeline nodes in topologically ordered groups.
 
         """
-
-        if not self._toposorted_groups:
-            while self._toposorter:
-                group = sorted(self._toposorter.get_ready())
-                self._toposorted_groups.append(group)
-                self._toposorter.done(*group)
-
-        return [list(group) for group in self._toposorted_groups]
+        toposorted = self.nodes
+        groups = []
+        start = 0
+        for layer in self._graph.layers:
+            groups.append(toposorted[start : start + len(layer)])
+            start += len(layer)
+        return groups
 
     def group_nodes_by(
         self,
@@ -651,7 +760,14 @@ class Pipeline:
             A new ``Pipeline``, containing only ``nodes``.
 
         """
-        unregistered_nodes = set(node_names) - set(self._nodes_by_name.keys())
+        return self._slice(self._names_mask(node_names))
+
+    def _names_mask(self, node_names: Iterable[str]) -> int:
+        return self._root_bits(self._named_node_ids(node_names))
+
+    def _named_node_ids(self, node_names: Iterable[str]) -> list[int]:
+        node_ids_by_name = self._node_ids_by_name
+        unregistered_nodes = set(node_names) - set(node_ids_by_name.keys())
         if unregistered_nodes:
             # check if unregistered nodes are available under namespace
             namespaces = []
@@ -659,7 +775,7 @@ class Pipeline:
                 namespaces.extend(
                     [
                         node_name
-                        for node_name in self._nodes_by_name.keys()
+                        for node_name in node_ids_by_name.keys()
                         if node_name.endswith(f".{unregistered_node}")
                     ]
                 )
@@ -672,8 +788,7 @@ class Pipeline:
                 f"Pipeline does not contain nodes named {list(unregistered_nodes)}."
             )
 
-        nodes = [self._nodes_by_name[name] for name in node_names]
-        return Pipeline(nodes)
+        return [node_ids_by_name[name] for name in node_names]
 
     def only_nodes_with_namespaces(self, node_namespaces: list[str]) -> Pipeline:
         """Creates a new ``Pipeline`` containing only nodes with the specified
@@ -688,32 +803,35 @@ class Pipeline:
         Returns:
             A new ``Pipeline`` containing nodes with the specified namespaces.
         """
-        nodes = []
+        return self._slice(self._namespaces_mask(node_namespaces))
+
+    def _namespaces_mask(self, node_namespaces: Iterable[str]) -> int:
+        node_ids = []
         unmatched_namespaces = []  # Track namespaces that don't match any nodes
 
         for node_namespace in node_namespaces:
-            matching_nodes = []
-            for n in self._nodes:
+            matching_ids = []
+            for i, n in enumerate(self._nodes):
                 if n.namespace and (
                     n.namespace == node_namespace
                     or n.namespace.startswith(f"{node_namespace}.")
                 ):
-                    matching_nodes.append(n)
+                    matching_ids.append(i)
 
-            if not matching_nodes:
+            if not matching_ids:
                 unmatched_namespaces.append(node_namespace)
-            nodes.extend(matching_nodes)
+            node_ids.extend(matching_ids)
 
         if unmatched_namespaces:
             raise ValueError(
                 f"Pipeline does not contain nodes with the following namespaces: {unmatched_namespaces}"
             )
 
-        return Pipeline(nodes)
+        return self._root_bits(node_ids)
 
-    def _get_nodes_with_inputs_transcode_compatible(
+    def _get_node_ids_with_inputs_transcode_compatible(
         self, datasets: set[str]
-    ) -> set[Node]:
+    ) -> set[int]:
         """Retrieves nodes that use the given `datasets` as inputs.
         If provided a name, but no format, for a transcoded dataset, it
         includes all nodes that use inputs with that name, otherwise it
@@ -724,7 +842,7 @@ class Pipeline:
                 ``Pipeline`` object
 
         Returns:
-            Set of ``Nodes`` that use the given datasets as inputs.
+            Set of ids of the ``Nodes`` that use the given datasets as inputs.
         """
         missing = sorted(
             datasets - self.datasets() - self._transcode_compatible_names()
@@ -732,19 +850,19 @@ class Pipeline:
         if missing:
             raise ValueError(f"Pipeline does not contain datasets named {missing}")
 
-        relevant_nodes = set()
+        nodes = self._nodes
+        relevant_ids: set[int] = set()
         for input_ in datasets:
+            consumers = self._graph.consumers(input_)
             if _strip_transcoding(input_) == input_:
-                relevant_nodes.update(self._nodes_by_input[_strip_transcoding(input_)])
+                relevant_ids.update(consumers)
             else:
-                for node_ in self._nodes_by_input[_strip_transcoding(input_)]:
-                    if input_ in node_.inputs:
-                        relevant_nodes.add(node_)
-        return relevant_nodes
+                relevant_ids.update(i for i in consumers if input_ in nodes[i].inputs)
+        return relevant_ids
 
-    def _get_nodes_with_outputs_transcode_compatible(
+    def _get_node_ids_with_outputs_transcode_compatible(
         self, datasets: set[str]
-    ) -> set[Node]:
+    ) -> set[int]:
         """Retrieves nodes that output to the given `datasets`.
         If provided a name, but no format, for a transcoded dataset, it
         includes the node that outputs to that name, otherwise it matches
@@ -755,7 +873,7 @@ class Pipeline:
                 ``Pipeline`` object
 
         Returns:
-            Set of ``Nodes`` that output to the given datasets.
+            Set of ids of the ``Nodes`` that output to the given datasets.
         """
         missing = sorted(
             datasets - self.datasets() - self._transcode_compatible_names()
@@ -763,17 +881,16 @@ class Pipeline:
         if missing:
             raise ValueError(f"Pipeline does not contain datasets named {missing}")
 
-        relevant_nodes = set()
+        relevant_ids = set()
         for output in datasets:
-            if _strip_transcoding(output) in self._nodes_by_output:
-                node_with_output = self._nodes_by_output[_strip_transcoding(output)]
-                if (
-                    _strip_transcoding(output) == output
-                    or output in node_with_output.outputs
-                ):
-                    relevant_nodes.add(node_with_output)
+            producer = self._graph.producer(output)
+            if producer >= 0 and (
+                _strip_transcoding(output) == output
+                or output in self._nodes[producer].outputs
+            ):
+                relevant_ids.add(producer)
 
-        return relevant_nodes
+        return relevant_ids
 
     def only_nodes_with_inputs(self, *inputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -797,9 +914,9 @@ class Pipeline:
 
         """
         starting = set(inputs)
-        nodes = self._get_nodes_with_inputs_transcode_compatible(starting)
+        node_ids = self._get_node_ids_with_inputs_transcode_compatible(starting)
 
-        return Pipeline(nodes)
+        return self._slice(self._root_bits(node_ids))
 
     def from_inputs(self, *inputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -823,23 +940,12 @@ class Pipeline:
                 copied.
 
         """
-        starting = set(inputs)
-        result: set[Node] = set()
-        next_nodes = self._get_nodes_with_inputs_transcode_compatible(starting)
-
-        while next_nodes:
-            result |= next_nodes
-            outputs = set(chain.from_iterable(node.outputs for node in next_nodes))
-            starting = outputs
-
-            next_nodes = set(
-                chain.from_iterable(
-                    self._nodes_by_input[_strip_transcoding(input_)]
-                    for input_ in starting
-                )
-            )
+        return self._slice(self._from_inputs_mask(inputs), closed=True)
 
-        return Pipeline(result)
+    def _from_inputs_mask(self, inputs: Iterable[str]) -> int:
+        starting = set(inputs)
+        node_ids = self._get_node_ids_with_inputs_transcode_compatible(starting)
+        return self._descendants_mask(node_ids)
 
     def only_nodes_with_outputs(self, *outputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -862,9 +968,9 @@ class Pipeline:
             produce the provided outputs are being copied.
         """
         starting = set(outputs)
-        nodes = self._get_nodes_with_outputs_transcode_compatible(starting)
+        node_ids = self._get_node_ids_with_outputs_transcode_compatible(starting)
 
-        return Pipeline(nodes)
+        return self._slice(self._root_bits(node_ids))
 
     def to_outputs(self, *outputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -888,22 +994,12 @@ class Pipeline:
             required to produce the provided outputs are being copied.
 
         """
-        starting = set(outputs)
-        result: set[Node] = set()
-        next_nodes = self._get_nodes_with_outputs_transcode_compatible(starting)
-
-        while next_nodes:
-            result |= next_nodes
-            inputs = set(chain.from_iterable(node.inputs for node in next_nodes))
-            starting = inputs
-
-            next_nodes = {
-                self._nodes_by_output[_strip_transcoding(output)]
-                for output in starting
-                if _strip_transcoding(output) in self._nodes_by_output
-            }
+        return self._slice(self._to_outputs_mask(outputs), closed=True)
 
-        return Pipeline(result)
+    def _to_outputs_mask(self, outputs: Iterable[str]) -> int:
+        starting = set(outputs)
+        node_ids = self._get_node_ids_with_outputs_transcode_compatible(starting)
+        return self._ancestors_mask(node_ids)
 
     def from_nodes(self, *node_names: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -921,10 +1017,10 @@ class Pipeline:
                 transitively on the provided nodes are being copied.
 
         """
+        return self._slice(self._from_nodes_mask(node_names), closed=True)
 
-        res = self.only_nodes(*node_names)
-        res += self.from_inputs(*map(_strip_transcoding, res.all_outputs()))
-        return res
+    def _from_nodes_mask(self, node_names: Iterable[str]) -> int:
+        return self._descendants_mask(self._named_node_ids(node_names))
 
     def to_nodes(self, *node_names: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes required directly
@@ -942,10 +1038,10 @@ class Pipeline:
                 transitively by the provided nodes are being copied.
 
         """
+        return self._slice(self._to_nodes_mask(node_names), closed=True)
 
-        res = self.only_nodes(*node_names)
-        res += self.to_outputs(*map(_strip_transcoding, res.all_inputs()))
-        return res
+    def _to_nodes_mask(self, node_names: Iterable[str]) -> int:
+        return self._ancestors_mask(self._named_node_ids(node_names))
 
     def only_nodes_with_tags(self, *tags: str) -> Pipeline:
         """Creates a new ``Pipeline`` object with the nodes which contain *any*
@@ -960,9 +1056,13 @@ class Pipeline:
                 nodes of the current one such that only nodes containing *any*
                 of the tags provided are being copied.
         """
+        return self._slice(self._tags_mask(tags))
+
+    def _tags_mask(self, tags: Iterable[str]) -> int:
         unique_tags = set(tags)
-        nodes = [node for node in self._nodes if unique_tags & node.tags]
-        return Pipeline(nodes)
+        return self._root_bits(
+            i for i, node in enumerate(self._nodes) if unique_tags & node.tags
+        )
 
     def filter(  # noqa: PLR0913
         self,
@@ -1017,25 +1117,19 @@ class Pipeline:
         ```
         """
 
+        # Filter methods returning bitsets of nodes, and whether these hold
+        # every node on the paths between their nodes
         filter_methods = {
-            self.only_nodes_with_tags: tags,
-            self.from_nodes: from_nodes,
-            self.to_nodes: to_nodes,
-            self.only_nodes: node_names,
-            self.from_inputs: from_inputs,
-            self.to_outputs: to_outputs,
-            self.only_nodes_with_namespaces: [node_namespaces]
-            if node_namespaces
-            else None,
+            self._tags_mask: (tags, False),
+            self._from_nodes_mask: (from_nodes, True),
+            self._to_nodes_mask: (to_nodes, True),
+            self._names_mask: (node_names, False),
+            self._from_inputs_mask: (from_inputs, True),
+            self._to_outputs_mask: (to_outputs, True),
+            self._namespaces_mask: (node_namespaces, False),
         }
 
-        subset_pipelines = {
-            filter_method(*filter_args)  # type: ignore
-            for filter_method, filter_args in filter_methods.items()
-            if filter_args
-        }
-
-        # Intersect all the pipelines subsets. We apply each filter to the original
+        # Intersect all the subsets of nodes. We apply each filter to the original
         # pipeline object (self) rather than incrementally chaining filter methods
         # together. Hence, the order of filtering does not affect the outcome, and the
         # resultant pipeline is unambiguously defined.
@@ -1044,11 +1138,16 @@ class Pipeline:
         # would give different outcomes depending on the order of filter methods:
         # only_nodes and then from_inputs would give node1, while only_nodes and then
         # from_inputs would give node1 and node3.
-        filtered_pipeline = Pipeline(self._nodes)
-        for subset_pipeline in subset_pipelines:
-            filtered_pipeline &= subset_pipeline
-
-        if not filtered_pipeline.nodes:
+        mask = self._root_mask
+        closed = True
+        for filter_method, (filter_args, filter_closed) in filter_methods.items():
+            if filter_args:
+                mask &= filter_method(list(filter_args))
+                closed = closed and filter_closed
+        filtered_pipeline = self._slice(mask, closed)
+
+        # Sorting the nodes is left to the first user of the filtered pipeline
+        if not filtered_pipeline._nodes:
             raise ValueError(
                 "Pipeline contains no nodes after applying all provided filters. "
                 "Please ensure that at least one pipeline with nodes has been defined."
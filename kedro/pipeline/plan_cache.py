@@ -0,0 +1,210 @@
+"""``PlanCache`` keeps the compiled plans of the pipelines run in a project in
+local JSON files, so that combining the same registered pipelines again builds
+the combined pipeline from its stored dependency graph and topological order
+instead of validating, indexing and sorting its nodes again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from kedro import __version__ as kedro_version
+from kedro.pipeline.graph import _PipelineGraph
+from kedro.pipeline.pipeline import Pipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from kedro.pipeline.node import Node
+
+# Version of the layout of the plan files, part of the key of each plan
+_PLAN_FORMAT_VERSION = 2
+
+
+class PlanCache:
+    """``PlanCache`` stores the compiled plan of each combination of pipelines
+    in a JSON file of a local directory, named after a hash of the nodes of
+    the combined pipelines.
+
+    A compiled plan holds the structure of the combined pipeline which does
+    not depend on the node functions: which of the given nodes it is made of,
+    its dependency arrays and dataset index, and the topological order and
+    groups of its nodes. The plan is looked up before the nodes are validated,
+    so a stored plan spares the validation of the combined pipeline, the
+    building of its dependency graph and its topological sort. Any change to
+    the names, datasets, namespaces or order of the nodes changes the hash, so
+    a stale plan is never used.
+
+    Example:
+    ``` python
+    from kedro.pipeline import PlanCache
+
+    combined = PlanCache(".kedro/plans").combine(
+        [pipelines["data_processing"], pipelines["data_science"]]
+    )
+    ```
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_plans: int = 16):
+        """Instantiates the plan cache.
+
+        Args:
+            directory: Path to the directory holding the plan files. It is
+                created when the first plan is saved.
+            max_plans: Number of plans to keep. Saving a plan removes the
+                least recently used plans beyond this number. Defaults to 16.
+
+        Raises:
+            ValueError: When ``max_plans`` is not positive.
+        """
+        if max_plans <= 0:
+            raise ValueError("'max_plans' should be positive.")
+        self._directory = Path(directory)
+        self._max_plans = max_plans
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def directory(self) -> Path:
+        """Path to the directory holding the plan files."""
+        return self._directory
+
+    def combine(self, pipelines: Iterable[Pipeline]) -> Pipeline:
+        """Combine ``pipelines`` as summing them does, from the stored plan of
+        their nodes when there is one, or compiling and saving the plan of the
+        combined pipeline otherwise.
+
+        Args:
+            pipelines: The pipelines to combine.
+
+        Returns:
+            The combined pipeline.
+
+        Raises:
+            ValueError: When the pipelines cannot be combined and no plan is
+                stored for them.
+        """
+        pipelines = list(pipelines)
+        nodes = [node for pipeline in pipelines for node in pipeline._nodes]
+        key = _plan_key(nodes)
+        filepath = self._filepath(key)
+        data = self._read(filepath)
+        if data is not None and data.get("key") == key:
+            try:
+                combined = _restore_plan(data, nodes)
+            except (IndexError, KeyError, TypeError, ValueError):
+                self._logger.warning(
+                    "Unable to use the compiled plan in '%s', compiling it again.",
+                    filepath,
+                )
+            else:
+                # Mark the plan as recently used
+                os.utime(filepath)
+                return combined
+
+        combined = Pipeline([])
+        for pipeline in pipelines:
+            combined += pipeline
+        self._save(key, _compile_plan(key, nodes, combined))
+        return combined
+
+    def clear(self) -> None:
+        """Remove all the stored plans."""
+        for filepath in self._directory.glob("*.json"):
+            filepath.unlink(missing_ok=True)
+
+    def _save(self, key: str, data: dict[str, Any]) -> None:
+        """Write a compiled plan to its JSON file and remove the least
+        recently used plans beyond ``max_plans``.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        filepath = self._filepath(key)
+        tmp_filepath = filepath.with_name(filepath.name + ".tmp")
+        tmp_filepath.write_text(json.dumps(data))
+        os.replace(tmp_filepath, filepath)
+
+        others = sorted(
+            (path for path in self._directory.glob("*.json") if path != filepath),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in others[self._max_plans - 1 :]:
+            stale.unlink(missing_ok=True)
+
+    def _filepath(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def _read(self, filepath: Path) -> dict[str, Any] | None:
+        if not filepath.is_file():
+            return None
+        try:
+            data = json.loads(filepath.read_text())
+        except (OSError, ValueError):
+            self._logger.warning(
+                "Unable to read the compiled plan from '%s', compiling it again.",
+                filepath,
+            )
+            return None
+        return data if isinstance(data, dict) else None
+
+
+def _compile_plan(key: str, nodes: list[Node], combined: Pipeline) -> dict[str, Any]:
+    """Represent ``combined``, built from ``nodes``, by the position of each
+    of its nodes among ``nodes``, its dependency graph and topological order.
+    """
+    positions: dict[str, int] = {}
+    for position, node in enumerate(nodes):
+        positions.setdefault(node.name, position)
+    return {
+        "key": key,
+        "nodes": [positions[node.name] for node in combined._nodes],
+        "graph": combined._graph.to_dict(),
+        "order": combined._toposorted_ids,
+    }
+
+
+def _restore_plan(data: dict[str, Any], nodes: list[Node]) -> Pipeline:
+    """Create the pipeline compiled in ``data`` from ``nodes``, handing it the
+    stored dependency graph and topological order before either is built.
+    """
+    combined_nodes = [nodes[position] for position in data["nodes"]]
+    graph = _PipelineGraph.from_dict(data["graph"])
+    order = data["order"]
+    if not len(graph) == len(order) == len(combined_nodes):
+        raise ValueError("The compiled plan does not match the pipelines.")
+    combined = Pipeline._from_validated(combined_nodes)
+    combined._graph = graph
+    combined._toposorted_ids = order
+    return combined
+
+
+def _plan_key(nodes: list[Node]) -> str:
+    """Hash of the names, namespaces, inputs, outputs and confirmed datasets
+    of ``nodes``, which decide whether they form a valid pipeline, in the
+    order the positions of the nodes in a compiled plan refer to.
+    """
+    digest = hashlib.sha256(f"{_PLAN_FORMAT_VERSION}:{kedro_version}".encode())
+    for node in nodes:
+        # Separators which cannot appear in node or dataset names
+        digest.update(
+            "\x1f".join(
+                [
+                    node.name,
+                    node.namespace or "",
+                    *node.inputs,
+                    "\x1e",
+                    *node.outputs,
+                    "\x1e",
+                    *node.confirms,
+                    "\x1d",
+                ]
+            ).encode()
+        )
+    return digest.hexdigest()
@@ -2,15 +2,27 @@
 to execute ``Pipeline`` instances.
 """
 
+from .async_runner import AsyncRunner
+from .distributed_runner import DistributedRunner
+from .hybrid_runner import HybridRunner
 from .parallel_runner import ParallelRunner
+from .run_history import RunHistory
+from .run_journal import RunJournal
 from .runner import AbstractRunner
+from .schedule_simulator import ScheduleSimulator
 from .sequential_runner import SequentialRunner
 from .task import Task
 from .thread_runner import ThreadRunner
 
 __all__ = [
     "AbstractRunner",
+    "AsyncRunner",
+    "DistributedRunner",
+    "HybridRunner",
     "ParallelRunner",
+    "RunHistory",
+    "RunJournal",
+    "ScheduleSimulator",
     "SequentialRunner",
     "Task",
     "ThreadRunner",
@@ -0,0 +1,235 @@
+"""``AsyncRunner`` is an ``AbstractRunner`` implementation. It can be used
+to run the ``Pipeline`` concurrently from a single ``asyncio`` event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from contextlib import AbstractAsyncContextManager, nullcontext
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from kedro.runner.runner import AbstractRunner, _execute_task
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pluggy import PluginManager
+
+    from kedro.io import CatalogProtocol
+    from kedro.pipeline import Pipeline
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
+    from kedro.runner.task import Task
+
+
+class AsyncRunner(AbstractRunner):
+    """``AsyncRunner`` is an ``AbstractRunner`` implementation. It can be used
+    to run the ``Pipeline`` concurrently from a single ``asyncio`` event loop.
+
+    ``async def`` node functions are awaited directly on the event loop, while
+    other node functions run in a thread. Node inputs and outputs are loaded
+    and saved concurrently, awaiting the ``aload`` and ``asave`` coroutine
+    methods of datasets which define them and using threads otherwise. Nodes
+    mostly waiting on I/O then cost a coroutine rather than an OS thread.
+    The event loop runs in a background thread for the duration of the run.
+    A node failing, or running for longer than its timeout, stops the run and
+    cancels the other running nodes.
+
+    Example:
+    ``` python
+    import httpx
+    from kedro.pipeline import node, pipeline
+    from kedro.runner import AsyncRunner
+
+
+    async def fetch(url):
+        async with httpx.AsyncClient() as client:
+            return (await client.get(url)).json()
+
+
+    runner = AsyncRunner(max_concurrency=1000)
+    runner.run(pipeline([node(fetch, "params:url", "response")]), catalog)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        is_async: bool = True,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        journal: RunJournal | None = None,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            max_concurrency: Maximum number of nodes running at the same time.
+                If not set, all ready nodes are started.
+            is_async: Ignored, as ``AsyncRunner`` always loads and saves the
+                node inputs and outputs asynchronously.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                If provided, ready nodes on the longest remaining path,
+                weighted by their recorded durations, are started first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. A node is only started when the
+                resources it declares fit within these limits next to the
+                nodes already running.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(
+            is_async=True,
+            run_history=run_history,
+            resource_limits=resource_limits,
+            journal=journal,
+            # Running coroutines can be cancelled, so a failing node stops the
+            # others instead of waiting for them
+            fail_fast=True,
+        )
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency should be positive")
+        self._max_concurrency = max_concurrency
+
+    def _get_required_workers_count(self, pipeline: Pipeline) -> int:
+        return self._max_concurrency or max(len(pipeline.nodes), 1)
+
+    def _get_executor(self, max_workers: int) -> _EventLoopExecutor:
+        return _EventLoopExecutor(self._max_concurrency)
+
+    def _run(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        """The method implementing asynchronous pipeline running. The nodes
+        run on an event loop of their own, which the calling thread waits on,
+        so it cannot be called from a running event loop.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: An implemented instance of ``CatalogProtocol`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            run_id: The id of the run.
+
+        Raises:
+            RuntimeError: When called from a running event loop.
+            Exception: in case of any downstream node failure.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "'AsyncRunner' cannot run from a running event loop, such as the "
+                "one of a Jupyter notebook, as it would block that loop until "
+                "the run completes. Run it in another thread instead, for "
+                "example with 'await asyncio.to_thread(runner.run, pipeline, "
+                "catalog)'."
+            )
+        super()._run(
+            pipeline=pipeline,
+            catalog=catalog,
+            hook_manager=hook_manager,
+            run_id=run_id,
+        )
+
+
+class _EventLoopExecutor(Executor):
+    """``Executor`` running the ``Task`` of each node submitted with
+    ``_execute_task`` as a coroutine of an event loop in a background thread,
+    at most ``max_concurrency`` of them at a time. Unlike threads, running
+    coroutines are stopped when the executor shuts down with
+    ``cancel_futures``.
+    """
+
+    def __init__(self, max_concurrency: int | None = None):
+        self._slots: AbstractAsyncContextManager = (
+            nullcontext()
+            if max_concurrency is None
+            else asyncio.Semaphore(max_concurrency)
+        )
+        self._tasks: set[asyncio.Task] = set()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="AsyncRunner", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future:
+        if fn is not _execute_task or kwargs or len(args) != 1:
+            raise TypeError(
+                "The event loop only runs the node of a 'Task' submitted with "
+                "'_execute_task'."
+            )
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future: Future = Future()
+            self._loop.call_soon_threadsafe(self._start, args[0], future)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        stopped = threading.Event()
+        self._loop.call_soon_threadsafe(
+            self._loop.create_task, self._stop(cancel_futures, stopped)
+        )
+        # Cancelled coroutines stop at their next await, so the executor waits
+        # for them even if it does not wait for the nodes running in threads
+        if wait or cancel_futures:
+            stopped.wait()
+        if wait:
+            self._thread.join()
+
+    def _start(self, task: Task, future: Future) -> None:
+        loop_task = self._loop.create_task(self._execute(task, future))
+        self._tasks.add(loop_task)
+        loop_task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, task: Task, future: Future) -> None:
+        async with self._slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            start_time = perf_counter()
+            try:
+                node = await task.aexecute()
+            except BaseException as exc:
+                future.set_exception(exc)
+                if not isinstance(exc, Exception):
+                    raise
+            else:
+                future.set_result([(node, perf_counter() - start_time)])
+
+    async def _stop(self, cancel: bool, stopped: threading.Event) -> None:
+        if cancel:
+            for loop_task in self._tasks:
+                loop_task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        stopped.set()
+        await self._loop.shutdown_asyncgens()
+        await self._loop.shutdown_default_executor()
+        self._loop.stop()
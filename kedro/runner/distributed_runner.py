@@ -0,0 +1,608 @@
+"""``DistributedRunner`` is an ``AbstractRunner`` implementation. It can be
+used to run the ``Pipeline`` on worker processes connecting to the runner over
+TCP or Unix sockets, possibly from other machines.
+
+The runner and its workers exchange pickled messages over connections
+authenticated with a shared key, using ``multiprocessing.connection``:
+
+1. The worker connects to the address the runner listens on and sends
+   ``("ready", <protocol version>)``.
+2. The runner sends ``("task", node, inputs, outputs, is_async, run_id)`` for
+   each node it dispatches to the worker. ``inputs`` holds the data of the
+   node inputs which are in-memory datasets of the runner catalog, and
+   ``outputs`` the names of the node outputs which are.
+3. The worker runs the node, loading and saving the other datasets from its
+   own catalog, and replies ``("done", outputs, duration)`` with the data of
+   the in-memory outputs, or ``("error", exception)``.
+4. Once the run completes, the runner sends ``("close",)``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from multiprocessing.reduction import ForkingPickler
+from pickle import PicklingError
+from typing import TYPE_CHECKING, Any
+
+from kedro.io import AbstractDataset, DataCatalog, MemoryDataset, SharedMemoryDataset
+from kedro.runner.runner import AbstractRunner, _execute_task
+from kedro.runner.task import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from multiprocessing.connection import Connection
+
+    from pluggy import PluginManager
+
+    from kedro.io import CatalogProtocol
+    from kedro.pipeline import Pipeline
+    from kedro.pipeline.node import Node
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
+
+_PROTOCOL_VERSION = 1
+_ADDRESS_ENV_VAR = "KEDRO_DISTRIBUTED_ADDRESS"
+_AUTHKEY_ENV_VAR = "KEDRO_DISTRIBUTED_AUTHKEY"
+_DEFAULT_ADDRESS = "localhost:8765"
+_UNIX_ADDRESS_PREFIX = "unix:"
+# How often, in seconds, a worker retries connecting to a runner not yet listening
+_CONNECT_RETRY_INTERVAL = 0.5
+# How often, in seconds, the runner checks whether it has been left without workers
+_WORKER_CHECK_INTERVAL = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_address(address: str) -> str | tuple[str, int]:
+    """Convert an address, either ``"host:port"`` or ``"unix:/path/to/socket"``,
+    to the address of a ``multiprocessing.connection`` listener.
+
+    Raises:
+        ValueError: When the address cannot be parsed.
+    """
+    if address.startswith(_UNIX_ADDRESS_PREFIX):
+        path = address[len(_UNIX_ADDRESS_PREFIX) :]
+        if path:
+            return path
+    else:
+        host, _, port = address.rpartition(":")
+        if host and port.isdigit():
+            return host, int(port)
+    raise ValueError(
+        f"Invalid address '{address}'. It should be 'host:port' or "
+        f"'{_UNIX_ADDRESS_PREFIX}/path/to/socket'."
+    )
+
+
+def _get_address(address: str | None) -> str | tuple[str, int]:
+    """Parse the given address, or the one set in ``KEDRO_DISTRIBUTED_ADDRESS``,
+    defaulting to ``"localhost:8765"``.
+    """
+    return _parse_address(address or os.environ.get(_ADDRESS_ENV_VAR, _DEFAULT_ADDRESS))
+
+
+def _get_authkey(authkey: str | bytes | None) -> bytes:
+    """Return the key authenticating the connections between the runner and
+    its workers, read from ``KEDRO_DISTRIBUTED_AUTHKEY`` if not given.
+
+    Raises:
+        ValueError: When no key is given nor set in the environment.
+    """
+    authkey = authkey or os.environ.get(_AUTHKEY_ENV_VAR)
+    if not authkey:
+        raise ValueError(
+            f"An authentication key shared by the runner and its workers is "
+            f"required. Pass 'authkey' or set the '{_AUTHKEY_ENV_VAR}' "
+            f"environment variable."
+        )
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+def _is_in_memory(dataset: Any) -> bool:
+    return isinstance(dataset, (MemoryDataset, SharedMemoryDataset))
+
+
+class _RemoteTask:
+    """A node dispatched to a worker. The data of its in-memory inputs is sent
+    along with the node, and the data of its in-memory outputs received back
+    is saved to the runner catalog.
+    """
+
+    def __init__(
+        self, node: Node, catalog: CatalogProtocol, is_async: bool, run_id: str | None
+    ):
+        self.node = node
+        self.catalog = catalog
+        self.is_async = is_async
+        self.run_id = run_id
+
+    def request(self) -> tuple:
+        inputs = {
+            name: self.catalog.load(name)
+            for name in self.node.inputs
+            if _is_in_memory(self.catalog.get(name))
+        }
+        outputs = [
+            name for name in self.node.outputs if _is_in_memory(self.catalog.get(name))
+        ]
+        return ("task", self.node, inputs, outputs, self.is_async, self.run_id)
+
+    def complete(self, reply: tuple) -> list[tuple[Node, float]]:
+        if reply[0] == "error":
+            raise reply[1]
+        _, outputs, duration = reply
+        for name, data in outputs.items():
+            self.catalog.save(name, data)
+        return [(self.node, duration)]
+
+
+class _WorkerPool(Executor):
+    """Dispatch tasks to the workers connected to a listening socket. Each
+    worker is served by a thread taking the next task from a shared queue,
+    sending it to the worker and waiting for its reply. The tasks of a worker
+    whose connection is lost are dispatched to another worker.
+
+    The queued tasks fail when no worker connects within ``connect_timeout``
+    seconds, or when all the workers disconnect and none reconnects within
+    ``idle_timeout`` seconds. Either timeout is disabled if None.
+    """
+
+    def __init__(
+        self,
+        address: str | tuple[str, int],
+        authkey: bytes,
+        connect_timeout: float | None = None,
+        idle_timeout: float | None = None,
+    ):
+        self._authkey = authkey
+        self._listener = Listener(address, authkey=authkey)
+        self._tasks: queue.SimpleQueue[tuple[Future, _RemoteTask] | None] = (
+            queue.SimpleQueue()
+        )
+        self._threads: list[threading.Thread] = []
+        self._shutdown = False
+        self._stopped = threading.Event()
+        self._connect_timeout = connect_timeout
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._connected_workers = 0
+        self._ever_connected = False
+        # When the pool was last left without any connected worker
+        self._idle_since = time.monotonic()
+        threading.Thread(target=self._accept_workers, daemon=True).start()
+        threading.Thread(target=self._watch_workers, daemon=True).start()
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        address: str | tuple[str, int] = self._listener.address
+        return address
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        """Dispatch ``fn(task)`` to the next worker available, where ``fn`` is
+        ``_execute_task`` and ``task`` a ``Task`` running a single node.
+
+        Raises:
+            TypeError: When asked to run anything else, which workers cannot do.
+        """
+        if (
+            fn is not _execute_task
+            or kwargs
+            or len(args) != 1
+            or not isinstance(args[0], Task)
+            or args[0].fused_nodes
+        ):
+            raise TypeError(
+                "Workers only run the node of a 'Task' submitted with '_execute_task'."
+            )
+        task: Task = args[0]
+        future: Future[list[tuple[Node, float]]] = Future()
+        self._tasks.put(
+            (future, _RemoteTask(task.node, task.catalog, task.is_async, task.run_id))
+        )
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._stopped.set()
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        self._tasks.put(None)
+        # Wake up the thread accepting connections, so it sees the shutdown
+        with contextlib.suppress(OSError):
+            Client(self._listener.address, authkey=self._authkey).close()
+        self._listener.close()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _accept_workers(self) -> None:
+        while True:
+            try:
+                connection = self._listener.accept()
+            except (AuthenticationError, OSError) as exc:
+                if self._shutdown:
+                    return
+                logger.warning("Rejected a worker connection: %s", exc)
+                continue
+            if self._shutdown:
+                connection.close()
+                return
+            thread = threading.Thread(
+                target=self._serve_worker, args=(connection,), daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _serve_worker(self, connection: Connection) -> None:
+        with connection:
+            try:
+                hello = connection.recv()
+            except (EOFError, OSError):
+                return
+            if hello != ("ready", _PROTOCOL_VERSION):
+                logger.warning(
+                    "Rejected a worker speaking an unsupported protocol: %r", hello
+                )
+                return
+            with self._lock:
+                self._connected_workers += 1
+                self._ever_connected = True
+            try:
+                self._dispatch_tasks(connection)
+            finally:
+                with self._lock:
+                    self._connected_workers -= 1
+                    if not self._connected_workers:
+                        self._idle_since = time.monotonic()
+
+    def _dispatch_tasks(self, connection: Connection) -> None:
+        """Send the queued tasks to a connected worker one at a time, until
+        the pool shuts down or the connection is lost.
+        """
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                # Let the threads serving the other workers stop too
+                self._tasks.put(None)
+                with contextlib.suppress(OSError):
+                    connection.send(("close",))
+                return
+            future, task = item
+            if not future.running() and not future.set_running_or_notify_cancel():
+                continue
+            try:
+                request = task.request()
+                connection.send(request)
+            except (EOFError, OSError):
+                self._requeue(item)
+                return
+            except Exception as exc:
+                future.set_exception(exc)
+                continue
+            try:
+                reply = connection.recv()
+            except (EOFError, OSError):
+                self._requeue(item)
+                return
+            try:
+                future.set_result(task.complete(reply))
+            except Exception as exc:
+                future.set_exception(exc)
+
+    def _watch_workers(self) -> None:
+        """Fail the queued tasks while the pool has had no worker for longer
+        than the connect or idle timeout, so the run does not wait forever.
+        """
+        while not self._stopped.wait(_WORKER_CHECK_INTERVAL):
+            with self._lock:
+                if self._connected_workers:
+                    continue
+                timeout = (
+                    self._idle_timeout
+                    if self._ever_connected
+                    else self._connect_timeout
+                )
+                if timeout is None or time.monotonic() - self._idle_since < timeout:
+                    continue
+            if self._ever_connected:
+                message = (
+                    f"All the workers disconnected from the runner at "
+                    f"{self.address!r} and none reconnected within {timeout} seconds."
+                )
+            else:
+                message = (
+                    f"No worker connected to the runner at {self.address!r} "
+                    f"within {timeout} seconds."
+                )
+            self._fail_queued_tasks(TimeoutError(message))
+
+    def _fail_queued_tasks(self, error: Exception) -> None:
+        while True:
+            try:
+                item = self._tasks.get_nowait()
+            except queue.Empty:
+                return
+            if item is None:
+                # Keep the shutdown signal for the threads serving the workers
+                self._tasks.put(None)
+                return
+            future = item[0]
+            # The tasks of a lost worker are queued again while running
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _requeue(self, item: tuple[Future, _RemoteTask]) -> None:
+        logger.warning(
+            "Lost the connection to a worker running node '%s'. Dispatching "
+            "the node to another worker.",
+            item[1].node.name,
+        )
+        self._tasks.put(item)
+
+
+class DistributedRunner(AbstractRunner):
+    """``DistributedRunner`` is an ``AbstractRunner`` implementation. It
+    listens on a TCP or Unix socket address and dispatches the nodes of the
+    ``Pipeline`` to the workers connecting to it, which can run on other
+    machines. Start a worker from a Kedro project with
+    ``kedro worker --connect <address>``.
+
+    Workers resolve the datasets from the catalog of their own project
+    configuration, rather than receiving pickled dataset instances, so they
+    need access to the same storage as the runner. The data of in-memory
+    datasets, including parameters, is sent between the runner and the
+    workers instead.
+
+    Example:
+    ``` python
+    from kedro.runner import DistributedRunner
+
+    # Workers connect with `kedro worker --connect scheduler:8765`, sharing the
+    # key set in the KEDRO_DISTRIBUTED_AUTHKEY environment variable
+    runner = DistributedRunner(address="0.0.0.0:8765")
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        address: str | None = None,
+        authkey: str | bytes | None = None,
+        is_async: bool = False,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        journal: RunJournal | None = None,
+        fail_fast: bool = False,
+        connect_timeout: float | None = 300.0,
+        idle_timeout: float | None = 300.0,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            address: Address to listen on for workers, either ``"host:port"``
+                or ``"unix:/path/to/socket"``. Defaults to the
+                ``KEDRO_DISTRIBUTED_ADDRESS`` environment variable, or
+                ``"localhost:8765"``.
+            authkey: Key authenticating the connections of the workers.
+                Defaults to the ``KEDRO_DISTRIBUTED_AUTHKEY`` environment
+                variable.
+            is_async: If True, the workers load and save the node inputs and
+                outputs asynchronously with threads. Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                If provided, ready nodes on the longest remaining path,
+                weighted by their recorded durations, are dispatched first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. A node is only dispatched when
+                the resources it declares fit within these limits next to the
+                nodes already running.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            fail_fast: If True, as soon as a node fails, cancel the nodes
+                waiting to be dispatched and raise without waiting for the
+                others to complete. Defaults to False.
+            connect_timeout: How long to wait for a first worker to connect,
+                in seconds, before failing the run. Waits forever if None.
+                Defaults to 300.
+            idle_timeout: How long to wait for a worker to reconnect once all
+                the workers have disconnected, in seconds, before failing the
+                run. Waits forever if None. Defaults to 300.
+
+        Raises:
+            ValueError: When the address is invalid or no authentication key
+                is given.
+        """
+        super().__init__(
+            is_async=is_async,
+            run_history=run_history,
+            resource_limits=resource_limits,
+            journal=journal,
+            fail_fast=fail_fast,
+        )
+        self._address = _get_address(address)
+        self._authkey = _get_authkey(authkey)
+        self._connect_timeout = connect_timeout
+        self._idle_timeout = idle_timeout
+
+    @classmethod
+    def _validate_nodes(cls, nodes: Iterable[Node]) -> None:
+        """Ensure all nodes can be sent to the workers."""
+        unserialisable = []
+        for node in nodes:
+            try:
+                ForkingPickler.dumps(node)
+            except (AttributeError, PicklingError):
+                unserialisable.append(node)
+
+        if unserialisable:
+            raise AttributeError(
+                f"The following nodes cannot be serialised: {sorted(unserialisable)}\n"
+                f"In order to send nodes to workers you need to make sure they "
+                f"are serialisable, i.e. nodes should not include lambda "
+                f"functions, nested functions, closures, etc.\nIf you "
+                f"are using custom decorators ensure they are correctly decorated using "
+                f"functools.wraps()."
+            )
+
+    def _get_required_workers_count(self, pipeline: Pipeline) -> int:
+        # Nodes run on as many workers as connect to the runner
+        return len(pipeline.nodes)
+
+    def _get_executor(self, max_workers: int) -> Executor:
+        pool = _WorkerPool(
+            self._address, self._authkey, self._connect_timeout, self._idle_timeout
+        )
+        self._logger.info("Waiting for workers to connect to %s", pool.address)
+        return pool
+
+    def _run(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        """The method implementing distributed pipeline running.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: An implemented instance of ``CatalogProtocol`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            run_id: The id of the run.
+
+        Raises:
+            AttributeError: When the nodes cannot be sent to the workers.
+            TimeoutError: When the runner is left without workers for longer
+                than the connect or idle timeout.
+            Exception: In case of any downstream node failure.
+        """
+        super()._run(
+            pipeline=pipeline,
+            catalog=catalog,
+            hook_manager=hook_manager,
+            run_id=run_id,
+        )
+
+
+def run_worker(
+    catalog: CatalogProtocol,
+    hook_manager: PluginManager,
+    address: str | None = None,
+    authkey: str | bytes | None = None,
+    connect_timeout: float = 60.0,
+) -> None:
+    """Connect to a ``DistributedRunner`` and run the nodes it dispatches
+    until the run completes.
+
+    Args:
+        catalog: The catalog to load and save the datasets which are not
+            in-memory datasets of the runner from.
+        hook_manager: The ``PluginManager`` to activate hooks.
+        address: Address the runner listens on, either ``"host:port"`` or
+            ``"unix:/path/to/socket"``. Defaults to the
+            ``KEDRO_DISTRIBUTED_ADDRESS`` environment variable, or
+            ``"localhost:8765"``.
+        authkey: Key authenticating the connection to the runner. Defaults
+            to the ``KEDRO_DISTRIBUTED_AUTHKEY`` environment variable.
+        connect_timeout: How long to retry connecting to a runner which is
+            not listening yet, in seconds.
+
+    Raises:
+        ValueError: When the address is invalid or no authentication key is
+            given.
+        ConnectionError: When the runner cannot be reached in time.
+    """
+    parsed_address = _get_address(address)
+    key = _get_authkey(authkey)
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = Client(parsed_address, authkey=key)
+            break
+        except (ConnectionRefusedError, FileNotFoundError) as exc:
+            if time.monotonic() >= deadline:
+                raise ConnectionError(
+                    f"Unable to connect to a runner at {parsed_address!r}."
+                ) from exc
+            time.sleep(_CONNECT_RETRY_INTERVAL)
+
+    logger.info("Connected to runner at %r", parsed_address)
+    with connection:
+        connection.send(("ready", _PROTOCOL_VERSION))
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+            if message[0] == "close":
+                break
+            reply = _run_remote_node(catalog, hook_manager, *message[1:])
+            try:
+                payload = ForkingPickler.dumps(reply)
+            except Exception as exc:
+                # The outputs or the error of the node cannot be pickled
+                error = RuntimeError(
+                    f"Unable to send the result of node '{message[1].name}' "
+                    f"to the runner: {exc}"
+                )
+                payload = ForkingPickler.dumps(("error", error))
+            connection.send_bytes(payload)
+    logger.info("Disconnected from runner at %r", parsed_address)
+
+
+def _run_remote_node(  # noqa: PLR0913
+    catalog: CatalogProtocol,
+    hook_manager: PluginManager,
+    node: Node,
+    inputs: dict[str, Any],
+    outputs: list[str],
+    is_async: bool,
+    run_id: str | None,
+) -> tuple:
+    """Run a node dispatched by the runner and build the reply to send back."""
+    datasets: dict[str, AbstractDataset] = {
+        name: MemoryDataset(data) for name, data in inputs.items()
+    }
+    datasets.update({name: MemoryDataset() for name in outputs})
+    try:
+        for name in {*node.inputs, *node.outputs} - datasets.keys():
+            dataset = catalog.get(name)
+            if dataset is None:
+                raise ValueError(
+                    f"Dataset '{name}' of node '{node.name}' is not defined in "
+                    f"the catalog of the worker."
+                )
+            datasets[name] = dataset
+        task_catalog = DataCatalog(datasets=datasets)
+        [(_, duration)] = _execute_task(
+            Task(
+                node=node,
+                catalog=task_catalog,
+                is_async=is_async,
+                hook_manager=hook_manager,
+                run_id=run_id,
+            )
+        )
+        return (
+            "done",
+            {name: task_catalog.load(name) for name in outputs},
+            duration,
+        )
+    except Exception as exc:
+        return ("error", exc)
@@ -0,0 +1,147 @@
+"""Fingerprints of the nodes of a pipeline, used by incremental runs to skip
+the nodes whose code, parameters and inputs have not changed since they last
+ran.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import pickle
+from functools import partial
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+from kedro.io import DatasetError, MemoryDataset
+from kedro.io.core import get_filepath_str
+from kedro.pipeline.transcoding import _strip_transcoding
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kedro.io import AbstractDataset, CatalogProtocol
+    from kedro.pipeline import Pipeline
+    from kedro.pipeline.node import Node
+
+# File system metadata which changes whenever the content of a file does
+_FILE_INFO_KEYS = ("mtime", "ETag", "etag", "LastModified", "md5", "generation")
+
+
+def _compute_node_fingerprints(
+    pipeline: Pipeline, catalog: CatalogProtocol
+) -> dict[Node, str | None]:
+    """Compute the fingerprint of each node of the pipeline. It is hashed from
+    the name, inputs and outputs of the node, the source code of its function,
+    and the fingerprint of each input: the fingerprint of the node producing
+    it, or the content of the dataset for parameters and in-memory data, or
+    its version and file metadata for other datasets.
+
+    Args:
+        pipeline: The ``Pipeline`` whose nodes to fingerprint.
+        catalog: The catalog of the run.
+
+    Returns:
+        Dictionary mapping each node to its fingerprint, or to None when the
+        fingerprint of one of its inputs cannot be determined.
+    """
+    producers = {
+        _strip_transcoding(output): node
+        for node in pipeline.nodes
+        for output in node.outputs
+    }
+    dataset_fingerprints: dict[str, str | None] = {}
+    fingerprints: dict[Node, str | None] = {}
+    for node in pipeline.nodes:
+        parts = [
+            node.name,
+            repr(node._inputs),
+            repr(node._outputs),
+            _function_fingerprint(node.func),
+        ]
+        for name in node.inputs:
+            producer = producers.get(_strip_transcoding(name))
+            if producer is not None:
+                input_fingerprint = fingerprints[producer]
+            else:
+                if name not in dataset_fingerprints:
+                    dataset_fingerprints[name] = _dataset_fingerprint(catalog.get(name))
+                input_fingerprint = dataset_fingerprints[name]
+            if input_fingerprint is None:
+                fingerprints[node] = None
+                break
+            parts.append(f"{name}={input_fingerprint}")
+        else:
+            fingerprints[node] = _hash("\0".join(parts).encode())
+    return fingerprints
+
+
+def _function_fingerprint(func: Callable) -> str:
+    """Describe a node function by its source code, or by its bytecode when
+    the source is not available.
+    """
+    if isinstance(func, partial):
+        arguments = _hash_data((func.args, sorted(func.keywords.items())))
+        return f"{_function_fingerprint(func.func)}\0{arguments}"
+
+    func = inspect.unwrap(func)
+    defaults = _hash_data(getattr(func, "__defaults__", None))
+    try:
+        return f"{inspect.getsource(func)}\0{defaults}"
+    except (OSError, TypeError):
+        pass
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', '')}"
+    return f"{code.co_code.hex()}\0{code.co_consts!r}\0{defaults}"
+
+
+def _dataset_fingerprint(dataset: AbstractDataset | None) -> str | None:
+    """Fingerprint the data of a dataset which is not produced by the
+    pipeline: the content of in-memory data, such as parameters, or the
+    resolved version and file metadata of datasets stored in files.
+
+    Returns:
+        The fingerprint, or None if it cannot be determined.
+    """
+    if isinstance(dataset, MemoryDataset):
+        return _hash_data(dataset.load()) if dataset._is_in_memory() else None
+    if dataset is None:
+        return None
+    return _file_fingerprint(dataset)
+
+
+def _file_fingerprint(dataset: AbstractDataset) -> str | None:
+    """Fingerprint a dataset stored in a file from its resolved load path and
+    the metadata of the file, or return None if it has no file.
+    """
+    try:
+        load_path = dataset._get_load_path()  # type: ignore[attr-defined]
+    except (AttributeError, DatasetError):
+        load_path = getattr(dataset, "_filepath", None)
+    fs = getattr(dataset, "_fs", None)
+    if load_path is None or fs is None:
+        return None
+
+    filepath = get_filepath_str(
+        PurePosixPath(load_path), getattr(dataset, "_protocol", "file")
+    )
+    try:
+        info = fs.info(filepath)
+    except Exception:
+        return None
+    metadata = sorted((key, str(info[key])) for key in _FILE_INFO_KEYS if key in info)
+    if not metadata:
+        return None
+    return _hash(repr((filepath, info.get("size"), metadata)).encode())
+
+
+def _hash_data(data: Any) -> str | None:
+    """Hash picklable data, or return None if it cannot be pickled."""
+    try:
+        return _hash(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return None
+
+
+def _hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
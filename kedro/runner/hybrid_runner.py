@@ -0,0 +1,425 @@
+"""``HybridRunner`` is an ``AbstractRunner`` implementation. It can be used
+to run the ``Pipeline`` in parallel, running each node either in a thread or
+in a separate process.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing import get_context
+from multiprocessing.reduction import ForkingPickler
+from pickle import PicklingError
+from typing import TYPE_CHECKING, Any
+
+from kedro.io import (
+    AbstractDataset,
+    DataCatalog,
+    MemoryDataset,
+    SharedMemoryDataset,
+)
+from kedro.runner.parallel_runner import (
+    ParallelRunnerManager,
+    _execute_worker_task,
+)
+from kedro.runner.runner import AbstractRunner
+from kedro.runner.scheduling import _max_antichain_width
+from kedro.runner.task import _init_worker, _WorkerPids
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pluggy import PluginManager
+
+    from kedro.io import CatalogProtocol
+    from kedro.pipeline import Pipeline
+    from kedro.pipeline.node import Node
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
+
+_EXECUTOR_TAG_PREFIX = "executor."
+_EXECUTORS = ("thread", "process")
+
+
+def _start_worker() -> None:
+    """Make a ``ProcessPoolExecutor`` start its worker processes."""
+
+
+class _HybridExecutor(Executor):
+    """A thread pool and a process pool used side by side. Tasks running a
+    node in a worker process, with ``_execute_worker_task``, are submitted to
+    the process pool and any other callable to the thread pool.
+    """
+
+    def __init__(self, thread_pool: ThreadPoolExecutor, process_pool: Executor | None):
+        self.thread_pool = thread_pool
+        self.process_pool = process_pool
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        if fn is not _execute_worker_task:
+            return self.thread_pool.submit(fn, *args, **kwargs)
+        if self.process_pool is None:
+            raise RuntimeError(
+                "No process pool runs the nodes tagged 'executor.process'."
+            )
+        return self.process_pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.thread_pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class HybridRunner(AbstractRunner):
+    """``HybridRunner`` is an ``AbstractRunner`` implementation. It can be
+    used to run the ``Pipeline`` in parallel, keeping a thread pool and a
+    process pool side by side.
+
+    Nodes tagged ``executor.process`` run in the process pool and nodes tagged
+    ``executor.thread`` in the thread pool. Other nodes run in the pool given
+    by ``default_executor``. Only the in-memory datasets produced or consumed
+    by nodes running in processes are replaced by ``SharedMemoryDataset``s, so
+    data exchanged between nodes running in threads is never pickled.
+
+    Example:
+    ``` python
+    from kedro.pipeline import node
+    from kedro.runner import HybridRunner
+
+    node(train_model, "model_input", "model", tags="executor.process")
+
+    runner = HybridRunner(max_workers=4, max_threads=16)
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_workers: int | None = None,
+        max_threads: int | None = None,
+        default_executor: str = "thread",
+        is_async: bool = False,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        fuse_nodes: bool = False,
+        journal: RunJournal | None = None,
+        fail_fast: bool = False,
+        prefetch_memory: float | str | None = None,
+        write_behind_threads: int = 0,
+    ):
+        """
+        Instantiates the runner.
+
+        Args:
+            max_workers: Number of worker processes to spawn. If not set,
+                calculated automatically based on the pipeline configuration
+                and CPU core count. On windows machines, the max_workers value
+                cannot be larger than 61 and will be set to min(61, max_workers).
+            max_threads: Number of threads running nodes. If not set,
+                calculated automatically based on the pipeline configuration
+                and CPU core count.
+            default_executor: Where to run nodes without an ``executor.`` tag,
+                either ``"thread"`` or ``"process"``. Defaults to ``"thread"``.
+            is_async: If True, the inputs and outputs of the nodes running in
+                processes are loaded and saved asynchronously with threads.
+                Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                If provided, ready nodes on the longest remaining path,
+                weighted by their recorded durations, are submitted first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. A node is only submitted when the
+                resources it declares fit within these limits next to the
+                nodes already running.
+            fuse_nodes: If True, chains of nodes linked only by in-memory
+                datasets loaded by a single node run as single tasks, passing
+                these datasets from node to node in memory. Nodes are only
+                fused with nodes running in the same pool. Defaults to False.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            fail_fast: If True, as soon as a node fails, cancel the nodes
+                waiting to start, terminate the worker processes and raise
+                without waiting for the others to complete. Defaults to False.
+            prefetch_memory: Optional amount of memory, e.g. ``"2G"``, for the
+                persistent inputs loaded in the background for the nodes
+                running in threads which are one dependency away from ready,
+                so they are in memory when the nodes start. Inputs are not
+                prefetched if it is not set.
+            write_behind_threads: Number of background threads saving the
+                persistent outputs of the nodes running in threads, so a node
+                completes without waiting for its outputs to be written. The
+                nodes loading these outputs in the meantime receive them from
+                memory, and the run ends once all of them are written. If 0, outputs are saved
+                before the node completes. Defaults to 0.
+        Raises:
+            ValueError: bad parameters passed
+        """
+        self._manager: ParallelRunnerManager | None = None
+        if default_executor not in _EXECUTORS:
+            raise ValueError(
+                f"default_executor should be one of {list(_EXECUTORS)}, "
+                f"got '{default_executor}'"
+            )
+        super().__init__(
+            is_async=is_async,
+            run_history=run_history,
+            resource_limits=resource_limits,
+            fuse_nodes=fuse_nodes,
+            journal=journal,
+            fail_fast=fail_fast,
+            prefetch_memory=prefetch_memory,
+            write_behind_threads=write_behind_threads,
+        )
+        self._max_workers = self._validate_max_workers(max_workers)
+        self._max_threads = self._validate_max_workers(max_threads)
+        self._default_executor = default_executor
+        self._worker_initargs: tuple[Any, ...] = ()
+
+    def __del__(self) -> None:
+        if self._manager is not None:
+            self._manager.shutdown()
+
+    def _get_node_executor(self, node: Node) -> str:
+        """Return where to run the node, ``"thread"`` or ``"process"``."""
+        executors = {
+            tag[len(_EXECUTOR_TAG_PREFIX) :]
+            for tag in node.tags
+            if tag.startswith(_EXECUTOR_TAG_PREFIX)
+        }
+        if not executors:
+            return self._default_executor
+        if len(executors) > 1 or not executors <= set(_EXECUTORS):
+            raise ValueError(
+                f"Node '{node.name}' should be tagged with exactly one of "
+                f"{[_EXECUTOR_TAG_PREFIX + e for e in _EXECUTORS]}, got "
+                f"{sorted(_EXECUTOR_TAG_PREFIX + e for e in executors)}"
+            )
+        return executors.pop()
+
+    def _can_fuse(self, parent: Node, child: Node) -> bool:
+        """Only fuse nodes running in the same pool."""
+        return super()._can_fuse(parent, child) and self._get_node_executor(
+            parent
+        ) == self._get_node_executor(child)
+
+    def _shares_memory(self, node: Node) -> bool:
+        """Only nodes running in threads share the memory of the runner."""
+        return self._get_node_executor(node) == "thread"
+
+    def _validate_nodes(self, nodes: Iterable[Node]) -> None:
+        """Ensure all nodes running in processes are serialisable."""
+        unserialisable = []
+        for node in nodes:
+            if self._get_node_executor(node) != "process":
+                continue
+            try:
+                ForkingPickler.dumps(node)
+            except (AttributeError, PicklingError):
+                unserialisable.append(node)
+
+        if unserialisable:
+            raise AttributeError(
+                f"The following nodes cannot be serialised: {sorted(unserialisable)}\n"
+                f"In order to run nodes in processes you need to make sure they "
+                f"are serialisable, i.e. nodes should not include lambda "
+                f"functions, nested functions, closures, etc.\nIf you "
+                f"are using custom decorators ensure they are correctly decorated using "
+                f"functools.wraps()."
+            )
+
+    def _get_pool_sizes(self, pipeline: Pipeline) -> tuple[int, int]:
+        """
+        Calculate the max number of threads and processes required for the
+        pipeline, limited to ``max_threads`` and ``max_workers``.
+        """
+        # At most the largest set of mutually independent nodes of each pool,
+        # its maximum antichain, can run at the same time
+        process_nodes = [
+            node
+            for node in pipeline.nodes
+            if self._get_node_executor(node) == "process"
+        ]
+        thread_nodes = set(pipeline.nodes).difference(process_nodes)
+        thread_width = _max_antichain_width(pipeline, thread_nodes)
+        return (
+            min(max(thread_width, 1), self._max_threads),
+            min(_max_antichain_width(pipeline, process_nodes), self._max_workers)
+            if process_nodes
+            else 0,
+        )
+
+    def _get_required_workers_count(self, pipeline: Pipeline) -> int:
+        return sum(self._get_pool_sizes(pipeline))
+
+    def _get_pipeline_executor(self, pipeline: Pipeline, max_workers: int) -> Executor:
+        return self._get_executor(*self._get_pool_sizes(pipeline))
+
+    def _get_executor(self, max_workers: int, max_processes: int = 0) -> Executor:
+        """Create a pool of ``max_workers`` threads, next to a pool of
+        ``max_processes`` worker processes unless it is 0.
+        """
+        process_pool = None
+        if max_processes:
+            context = os.environ.get("KEDRO_MP_CONTEXT")
+            if context and context not in {"fork", "spawn"}:
+                context = None
+            mp_context = get_context(context)
+            self._worker_pids = _WorkerPids(mp_context)
+            process_pool = ProcessPoolExecutor(
+                max_workers=max_processes,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(*self._worker_initargs, 0, None, self._worker_pids),
+            )
+            # Start the worker processes before any node runs in a thread, as
+            # forking while other threads hold locks can deadlock the workers
+            process_pool.submit(_start_worker).result()
+        return _HybridExecutor(ThreadPoolExecutor(max_workers), process_pool)
+
+    def _submit_node(
+        self,
+        executor: Executor,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+    ) -> Future[list[tuple[Node, float]]]:
+        """Submit the node to the thread pool or, with just its name, to the
+        process pool, whose workers already hold the nodes they run.
+        """
+        if self._get_node_executor(node) == "process":
+            fused_node_names = tuple(n.name for n in self._fused_nodes.get(node, []))
+            return executor.submit(_execute_worker_task, node.name, fused_node_names)
+        return super()._submit_node(executor, node, catalog, hook_manager, run_id)
+
+    def _share_process_datasets(
+        self, process_nodes: list[Node], catalog: CatalogProtocol
+    ) -> dict[str, SharedMemoryDataset]:
+        """Create a ``SharedMemoryDataset`` holding the data of each in-memory
+        dataset produced or consumed by nodes running in processes, to use in
+        its place for the run.
+
+        Raises:
+            AttributeError: When a dataset used by a node running in a process
+                cannot be used with multiprocessing.
+        """
+        dataset_names = {
+            name for node in process_nodes for name in (*node.inputs, *node.outputs)
+        }
+        produced = {name for node in process_nodes for name in node.outputs}
+        to_share: dict[str, MemoryDataset] = {}
+        unserialisable = []
+        for name in sorted(dataset_names):
+            dataset = catalog[name]
+            if isinstance(dataset, MemoryDataset) and (
+                name in produced or not dataset._is_in_memory()
+            ):
+                to_share[name] = dataset
+                continue
+            if getattr(dataset, "_SINGLE_PROCESS", False):  # SKIP_IF_NO_SPARK
+                unserialisable.append(name)
+                continue
+            try:
+                ForkingPickler.dumps(dataset)
+            except (AttributeError, PicklingError):
+                unserialisable.append(name)
+
+        if unserialisable:
+            raise AttributeError(
+                f"The following datasets cannot be used by nodes running in "
+                f"processes: {unserialisable}\nIn order to utilize "
+                f"multiprocessing you need to make sure all datasets are "
+                f"serialisable, i.e. datasets should not make use of lambda "
+                f"functions, nested functions, closures etc.\nIf you are using "
+                f"custom decorators ensure they are correctly decorated using "
+                f"functools.wraps()."
+            )
+
+        if to_share and self._manager is None:
+            self._manager = ParallelRunnerManager()
+            self._manager.start()
+        shared_datasets = {}
+        for name, memory_dataset in to_share.items():
+            shared = shared_datasets[name] = SharedMemoryDataset(manager=self._manager)
+            if memory_dataset._is_in_memory():
+                shared.save(memory_dataset.load())
+        return shared_datasets
+
+    @staticmethod
+    def _restore_process_datasets(
+        catalog: CatalogProtocol, shared_datasets: dict[str, SharedMemoryDataset]
+    ) -> None:
+        """Move the data left in the ``SharedMemoryDataset``s created by
+        ``_share_process_datasets`` into the in-memory datasets of the
+        catalog they stood in for, and free their shared memory blocks.
+        """
+        for name, shared in shared_datasets.items():
+            if shared.exists():
+                catalog[name].save(shared.load())
+            shared.release()
+
+    def _run(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        """The method implementing hybrid pipeline running.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: An implemented instance of ``CatalogProtocol`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            run_id: The id of the run.
+
+        Raises:
+            AttributeError: When the nodes or datasets running in processes
+                cannot be serialised.
+            ValueError: When a node is tagged with an invalid executor.
+            Exception: In case of any downstream node failure.
+        """
+        process_nodes = [
+            node
+            for node in pipeline.nodes
+            if self._get_node_executor(node) == "process"
+        ]
+        shared_datasets: dict[str, SharedMemoryDataset] = {}
+        run_catalog = catalog
+        try:
+            if process_nodes:
+                shared_datasets = self._share_process_datasets(process_nodes, catalog)
+                if shared_datasets:
+                    # Run on a copy of the catalog holding the shared datasets,
+                    # leaving the catalog passed to the runner as it is
+                    run_catalog = DataCatalog(
+                        datasets={**dict(catalog.items()), **shared_datasets}
+                    )
+                worker_datasets: dict[str, AbstractDataset] = {
+                    name: run_catalog[name]
+                    for node in process_nodes
+                    for name in (*node.inputs, *node.outputs)
+                }
+                # Ship the datasets and nodes used in processes to each worker
+                # process once, when it starts, rather than with every task
+                self._worker_initargs = (
+                    DataCatalog(datasets=worker_datasets),
+                    {node.name: node for node in process_nodes},
+                    self._is_async,
+                    run_id,
+                )
+            super()._run(
+                pipeline=pipeline,
+                catalog=run_catalog,
+                hook_manager=hook_manager,
+                run_id=run_id,
+            )
+        finally:
+            self._worker_initargs = ()
+            self._worker_pids = None
+            self._restore_process_datasets(catalog, shared_datasets)
@@ -6,25 +6,38 @@ from __future__ import annotations
 
 import os
 from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import suppress
 from multiprocessing import get_context
 from multiprocessing.managers import SyncManager
 from multiprocessing.reduction import ForkingPickler
 from pickle import PicklingError
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from kedro.io import (
+    DatasetError,
     MemoryDataset,
+    SharedMemoryDataset,
+)
+from kedro.runner.runner import AbstractRunner, _execute_task
+from kedro.runner.scheduling import _max_antichain_width
+from kedro.runner.task import (
+    Task,
+    _init_worker,
+    _limit_task_native_threads,
+    _WorkerPids,
 )
-from kedro.runner.runner import AbstractRunner
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from concurrent.futures import Future
 
     from pluggy import PluginManager
 
-    from kedro.io import SharedMemoryCatalogProtocol
+    from kedro.io import CatalogProtocol, SharedMemoryCatalogProtocol
     from kedro.pipeline import Pipeline
     from kedro.pipeline.node import Node
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
 
 
 class ParallelRunnerManager(SyncManager):
@@ -36,6 +49,28 @@ class ParallelRunnerManager(SyncManager):
 ParallelRunnerManager.register("MemoryDataset", MemoryDataset)
 
 
+def _execute_worker_task(
+    node_name: str, fused_node_names: tuple[str, ...] = ()
+) -> list[tuple[Node, float]]:
+    """Run a node, with the nodes fused after it if any, in a worker process
+    set up by ``_init_worker``.
+    """
+    _limit_task_native_threads((node_name, *fused_node_names))
+    return _execute_task(Task._from_worker_context(node_name, fused_node_names))
+
+
+def _free_shared_memory(
+    pipeline: Pipeline, catalog: CatalogProtocol | SharedMemoryCatalogProtocol
+) -> None:
+    """Free the shared memory blocks of the ``SharedMemoryDataset``s of a run
+    which is over, keeping their data loadable through the manager.
+    """
+    for name in pipeline.datasets():
+        dataset = catalog.get(name)
+        if isinstance(dataset, SharedMemoryDataset):
+            dataset._move_out_of_shared_memory()
+
+
 class ParallelRunner(AbstractRunner):
     """``ParallelRunner`` is an ``AbstractRunner`` implementation. It can
     be used to run the ``Pipeline`` in parallel groups formed by toposort.
@@ -44,10 +79,16 @@ class ParallelRunner(AbstractRunner):
     single process only using the `_SINGLE_PROCESS` dataset attribute.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         max_workers: int | None = None,
         is_async: bool = False,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        fuse_nodes: bool = False,
+        journal: RunJournal | None = None,
+        fail_fast: bool = False,
+        native_threads: int | None = None,
     ):
         """
         Instantiates the runner by creating a Manager.
@@ -59,16 +100,56 @@ class ParallelRunner(AbstractRunner):
                 cannot be larger than 61 and will be set to min(61, max_workers).
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                If provided, ready nodes on the longest remaining path,
+                weighted by their recorded durations, are submitted first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. A node is only submitted when the
+                resources it declares fit within these limits next to the
+                nodes already running.
+            fuse_nodes: If True, chains of nodes linked only by in-memory
+                datasets loaded by a single node run as single tasks, passing
+                these datasets from node to node in memory. Defaults to False.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            fail_fast: If True, as soon as a node fails, cancel the nodes
+                waiting to start, terminate the worker processes and raise
+                without waiting for the others to complete. Defaults to False.
+            native_threads: Number of threads of the native thread pools, such
+                as OpenMP, MKL and OpenBLAS, of each worker process. If not
+                set, the CPU core count is divided between the workers. A node
+                declaring a ``cpu`` resource gets that many threads instead.
+                Set to 0 to leave the thread pools unlimited.
         Raises:
             ValueError: bad parameters passed
         """
-        super().__init__(is_async=is_async)
+        super().__init__(
+            is_async=is_async,
+            run_history=run_history,
+            resource_limits=resource_limits,
+            fuse_nodes=fuse_nodes,
+            journal=journal,
+            fail_fast=fail_fast,
+        )
+        if native_threads is not None and native_threads < 0:
+            raise ValueError("'native_threads' should not be negative.")
+        # The datasets using the manager, whose blocks are freed before it
+        # shuts down
+        self._shared_datasets: dict[int, SharedMemoryDataset] = {}
         self._manager = ParallelRunnerManager()
         self._manager.start()
 
         self._max_workers = self._validate_max_workers(max_workers)
+        self._native_threads = native_threads
+        self._worker_initargs: tuple[Any, ...] = ()
 
     def __del__(self) -> None:
+        # The manager is already stopped if the interpreter is exiting
+        with suppress(DatasetError):
+            for dataset in self._shared_datasets.values():
+                dataset.release()
         self._manager.shutdown()
 
     @classmethod
@@ -101,18 +182,20 @@ class ParallelRunner(AbstractRunner):
 
     def _set_manager_datasets(self, catalog: SharedMemoryCatalogProtocol) -> None:  # type: ignore[override]
         catalog.set_manager_datasets(self._manager)
+        self._shared_datasets.update(
+            (id(dataset), dataset)
+            for dataset in catalog.values()
+            if isinstance(dataset, SharedMemoryDataset)
+        )
 
     def _get_required_workers_count(self, pipeline: Pipeline) -> int:
         """
         Calculate the max number of processes required for the pipeline,
         limit to the number of CPU cores.
         """
-        # Number of nodes is a safe upper-bound estimate.
-        # It's also safe to reduce it by the number of layers minus one,
-        # because each layer means some nodes depend on other nodes
-        # and they can not run in parallel.
-        # It might be not a perfect solution, but good enough and simple.
-        required_processes = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        # At most the nodes of the largest set of mutually independent nodes,
+        # the maximum antichain of the pipeline, can run at the same time
+        required_processes = max(_max_antichain_width(pipeline), 1)
 
         return min(required_processes, self._max_workers)
 
@@ -121,7 +204,53 @@ class ParallelRunner(AbstractRunner):
         if context and context not in {"fork", "spawn"}:
             context = None
         ctx = get_context(context)
-        return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+        initargs = self._worker_initargs
+        if initargs:
+            self._worker_pids = _WorkerPids(ctx)
+            initargs = (
+                *initargs,
+                *self._get_native_threads(max_workers),
+                self._worker_pids,
+            )
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_worker if initargs else None,
+            initargs=initargs,
+        )
+
+    def _get_native_threads(self, max_workers: int) -> tuple[int, dict[str, int]]:
+        """Split the CPU cores between the worker processes, so the native
+        thread pools of numerical libraries in each worker do not
+        oversubscribe them. Nodes declaring a ``cpu`` resource get the number
+        of threads they declare.
+        """
+        native_threads = self._native_threads
+        if native_threads is None:
+            native_threads = max((os.cpu_count() or 1) // max_workers, 1)
+        if not native_threads:
+            return 0, {}
+        _, nodes, *_ = self._worker_initargs
+        node_threads = {
+            name: max(int(node.resources["cpu"]), 1)
+            for name, node in nodes.items()
+            if "cpu" in node.resources
+        }
+        return native_threads, node_threads
+
+    def _submit_node(
+        self,
+        executor: Executor,
+        node: Node,
+        catalog: SharedMemoryCatalogProtocol,  # type: ignore[override]
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+    ) -> Future[list[tuple[Node, float]]]:
+        """Submit only the names of the node and of the nodes fused after it,
+        as the worker processes already hold the catalog and nodes of the run.
+        """
+        fused_node_names = tuple(n.name for n in self._fused_nodes.get(node, []))
+        return executor.submit(_execute_worker_task, node.name, fused_node_names)
 
     def _run(
         self,
@@ -152,8 +281,22 @@ class ParallelRunner(AbstractRunner):
                 "for potential performance gains. https://docs.kedro.org/en/stable/build/run_a_pipeline/#load-and-save-asynchronously"
             )
 
-        super()._run(
-            pipeline=pipeline,
-            catalog=catalog,
-            run_id=run_id,
+        # Ship the catalog and nodes to each worker process once, when it
+        # starts, rather than with every task
+        self._worker_initargs = (
+            catalog,
+            {node.name: node for node in pipeline.nodes},
+            self._is_async,
+            run_id,
         )
+        try:
+            super()._run(
+                pipeline=pipeline,
+                catalog=catalog,
+                hook_manager=hook_manager,
+                run_id=run_id,
+            )
+        finally:
+            self._worker_initargs = ()
+            self._worker_pids = None
+            _free_shared_memory(pipeline, catalog)
@@ -0,0 +1,130 @@
+"""``RunHistory`` keeps measurements from previous pipeline runs, such as how
+long each node took or how large each dataset was, in a local JSON file so
+that runners can make better scheduling decisions on the next run. It also
+keeps the node fingerprints used by incremental runs to skip unchanged nodes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+
+class RunHistory:
+    """``RunHistory`` stores per-node measurements of previous runs in a local
+    JSON file, keyed by node and dataset name.
+
+    Example:
+    ``` python
+    from kedro.runner import ParallelRunner, RunHistory
+
+    runner = ParallelRunner(run_history=RunHistory("logs/run_history.json"))
+    ```
+    """
+
+    def __init__(self, filepath: str | os.PathLike):
+        """Instantiates the run history and loads any previously saved
+        measurements from ``filepath``.
+
+        Args:
+            filepath: Path to the JSON file holding the run history. The file
+                is created on ``save()`` if it does not exist yet.
+        """
+        self._filepath = Path(filepath)
+        data = self._load()
+        self._node_durations: dict[str, float] = data.get("node_durations", {})
+        self._dataset_sizes: dict[str, int] = data.get("dataset_sizes", {})
+        self._node_fingerprints: dict[str, str] = data.get("node_fingerprints", {})
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def filepath(self) -> Path:
+        """Path to the JSON file holding the run history."""
+        return self._filepath
+
+    @property
+    def node_durations(self) -> dict[str, float]:
+        """Wall-clock duration in seconds of the last recorded run of each node.
+
+        Returns:
+            Dictionary mapping node names to durations in seconds.
+        """
+        return dict(self._node_durations)
+
+    @property
+    def dataset_sizes(self) -> dict[str, int]:
+        """Estimated in-memory size in bytes of each dataset as last recorded.
+
+        Returns:
+            Dictionary mapping dataset names to sizes in bytes.
+        """
+        return dict(self._dataset_sizes)
+
+    @property
+    def node_fingerprints(self) -> dict[str, str]:
+        """Fingerprint of the code, parameters and inputs of each node when it
+        last completed in an incremental run.
+
+        Returns:
+            Dictionary mapping node names to fingerprints.
+        """
+        return dict(self._node_fingerprints)
+
+    def record_node_duration(self, node_name: str, duration: float) -> None:
+        """Record how long a node took to run.
+
+        Args:
+            node_name: Name of the node.
+            duration: Wall-clock duration of the node run in seconds.
+        """
+        self._node_durations[node_name] = duration
+
+    def record_dataset_size(self, dataset_name: str, size: int) -> None:
+        """Record how much memory the data of a dataset took.
+
+        Args:
+            dataset_name: Name of the dataset.
+            size: Estimated in-memory size of the data in bytes.
+        """
+        self._dataset_sizes[dataset_name] = size
+
+    def record_node_fingerprint(self, node_name: str, fingerprint: str) -> None:
+        """Record the fingerprint of a node which has just completed.
+
+        Args:
+            node_name: Name of the node.
+            fingerprint: Fingerprint of the code, parameters and inputs of the
+                node.
+        """
+        self._node_fingerprints[node_name] = fingerprint
+
+    def save(self) -> None:
+        """Write the run history to its JSON file."""
+        data = self._load()
+        data["node_durations"] = self._node_durations
+        if self._dataset_sizes:
+            data["dataset_sizes"] = self._dataset_sizes
+        if self._node_fingerprints:
+            data["node_fingerprints"] = self._node_fingerprints
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self._filepath.with_name(self._filepath.name + ".tmp")
+        tmp_filepath.write_text(json.dumps(data, indent=2, sort_keys=True))
+        os.replace(tmp_filepath, self._filepath)
+
+    def _load(self) -> dict[str, Any]:
+        if not self._filepath.is_file():
+            return {}
+        try:
+            data = json.loads(self._filepath.read_text())
+        except (OSError, ValueError):
+            self._logger.warning(
+                "Unable to read run history from '%s', ignoring it.", self._filepath
+            )
+            return {}
+        return data if isinstance(data, dict) else {}
@@ -0,0 +1,141 @@
+"""``RunJournal`` records the progress of a pipeline run in a local directory,
+so that a failed run can be resumed from the nodes which did not complete
+without recomputing the in-memory data they need.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+_COMPLETED_NODES_FILENAME = "completed_nodes.txt"
+_CHECKPOINTS_DIRNAME = "checkpoints"
+
+
+class RunJournal:
+    """``RunJournal`` records the nodes completed by a run and checkpoints the
+    in-memory datasets they produce to a local directory. When passed to a
+    runner, a run journal which already holds completed nodes makes the runner
+    resume the run: the completed nodes are skipped and their checkpointed
+    outputs are restored into the catalog.
+
+    Checkpoints are deleted as soon as the runner releases their dataset, and
+    the whole journal once the run completes successfully.
+
+    Example:
+    ``` python
+    from kedro.runner import RunJournal, SequentialRunner
+
+    runner = SequentialRunner(journal=RunJournal(".kedro/journal/my_run"))
+    ```
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Instantiates the run journal.
+
+        Args:
+            path: Directory holding the journal. It is created when the first
+                node completes if it does not exist yet.
+        """
+        self._path = Path(path)
+        self._completed_nodes = self._load_completed_nodes()
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def path(self) -> Path:
+        """Directory holding the journal."""
+        return self._path
+
+    @property
+    def completed_nodes(self) -> set[str]:
+        """Names of the nodes recorded as completed.
+
+        Returns:
+            Set of node names.
+        """
+        return set(self._completed_nodes)
+
+    def record_node(self, node_name: str) -> None:
+        """Durably record that a node has completed.
+
+        Args:
+            node_name: Name of the node.
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        with open(self._path / _COMPLETED_NODES_FILENAME, "a") as journal_file:
+            journal_file.write(node_name + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        self._completed_nodes.add(node_name)
+
+    def checkpoint(self, dataset_name: str, data: Any) -> bool:
+        """Write the data of a dataset to the journal.
+
+        Args:
+            dataset_name: Name of the dataset.
+            data: The data to checkpoint.
+
+        Returns:
+            Whether the data could be checkpointed. Data which cannot be
+            pickled is not.
+        """
+        filepath = self._get_checkpoint_filepath(dataset_name)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = filepath.with_name(filepath.name + ".tmp")
+        try:
+            with open(tmp_filepath, "wb") as checkpoint_file:
+                pickle.dump(data, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            tmp_filepath.unlink(missing_ok=True)
+            self._logger.warning(
+                "Unable to checkpoint dataset '%s' to the run journal: %s",
+                dataset_name,
+                exc,
+            )
+            return False
+        os.replace(tmp_filepath, filepath)
+        return True
+
+    def has_checkpoint(self, dataset_name: str) -> bool:
+        """Whether the journal holds a checkpoint of the dataset."""
+        return self._get_checkpoint_filepath(dataset_name).is_file()
+
+    def load_checkpoint(self, dataset_name: str) -> Any:
+        """Load the checkpointed data of a dataset.
+
+        Args:
+            dataset_name: Name of the dataset.
+
+        Returns:
+            The checkpointed data.
+        """
+        with open(self._get_checkpoint_filepath(dataset_name), "rb") as checkpoint_file:
+            return pickle.load(checkpoint_file)  # noqa: S301
+
+    def evict(self, dataset_name: str) -> None:
+        """Delete the checkpoint of a dataset, if any."""
+        self._get_checkpoint_filepath(dataset_name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete the journal."""
+        shutil.rmtree(self._path, ignore_errors=True)
+        self._completed_nodes = set()
+
+    def _get_checkpoint_filepath(self, dataset_name: str) -> Path:
+        return (
+            self._path / _CHECKPOINTS_DIRNAME / (quote(dataset_name, safe="") + ".pkl")
+        )
+
+    def _load_completed_nodes(self) -> set[str]:
+        filepath = self._path / _COMPLETED_NODES_FILENAME
+        if not filepath.is_file():
+            return set()
+        return {line for line in filepath.read_text().splitlines() if line}
@@ -4,11 +4,12 @@ implementations.
 
 from __future__ import annotations
 
+import inspect
 import logging
 import os
 import sys
 from abc import ABC, abstractmethod
-from collections import Counter, deque
+from collections import Counter, defaultdict, deque
 from concurrent.futures import (
     FIRST_COMPLETED,
     Executor,
@@ -21,12 +22,31 @@ from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import (
+    MemoryDataset,
+    SharedMemoryDataset,
+    StreamingDataset,
+)
 from kedro.pipeline import Pipeline
-from kedro.runner.task import Task
+from kedro.pipeline.node import _parse_resource_amount
+from kedro.runner.fingerprint import _compute_node_fingerprints
+from kedro.runner.scheduling import (
+    _build_node_children_index,
+    _critical_path_priorities,
+    _MemoryBudget,
+    _Prefetcher,
+    _ReadyQueue,
+    _ReleasePlan,
+    _TimeoutWatch,
+    _WriteBehind,
+)
+from kedro.runner.task import Task, _WorkerPids
 
 # see https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L114
 _MAX_WINDOWS_WORKERS = 61
 
+_TIMEOUT_TAG_PREFIX = "timeout."
+
 if TYPE_CHECKING:
     from collections.abc import Collection, Iterable
 
@@ -34,6 +54,8 @@ if TYPE_CHECKING:
 
     from kedro.io import CatalogProtocol, SharedMemoryCatalogProtocol
     from kedro.pipeline.node import Node
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
 
 
 class AbstractRunner(ABC):
@@ -41,29 +63,130 @@ class AbstractRunner(ABC):
     implementations.
     """
 
-    def __init__(
+    # Whether the runner starts the nodes linked by ``StreamingDataset``s
+    # together, in threads of the same process
+    _SUPPORTS_STREAMING = False
+
+    def __init__(  # noqa: PLR0913
         self,
         is_async: bool = False,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        memory_budget: float | str | None = None,
+        spill_dir: str | os.PathLike | None = None,
+        fuse_nodes: bool = False,
+        journal: RunJournal | None = None,
+        chunk_write_depth: int = 0,
+        fail_fast: bool = False,
+        prefetch_memory: float | str | None = None,
+        write_behind_threads: int = 0,
     ):
         """Instantiates the runner class.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                Runners executing nodes concurrently also use it to submit
+                the ready nodes on the longest remaining path first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. Runners executing nodes
+                concurrently only start a node when the resources it declares
+                fit within these limits next to the nodes already running.
+            memory_budget: Optional amount of memory, e.g. ``"32G"``, for the
+                data of ``MemoryDataset``s during sequential runs. Nodes are
+                then run in an order keeping this data small, and the least
+                recently used datasets are spilled to disk while the budget
+                is exceeded.
+            spill_dir: Directory to spill datasets to when ``memory_budget``
+                is exceeded. Defaults to a new temporary directory.
+            fuse_nodes: If True, chains of nodes linked only by in-memory
+                datasets loaded by a single node run as single tasks, passing
+                these datasets from node to node in memory. Defaults to False.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            chunk_write_depth: Maximum number of chunks yielded by a generator
+                node waiting to be saved by background writer threads while
+                the node computes the next chunks. If 0, each chunk is saved
+                before the next one is computed. Defaults to 0.
+            fail_fast: If True, runners executing nodes concurrently cancel
+                the nodes waiting to start as soon as a node fails, terminate
+                the worker processes running the others and raise without
+                waiting for the nodes running in threads. Defaults to False.
+            prefetch_memory: Optional amount of memory, e.g. ``"2G"``, for the
+                persistent inputs which runners executing nodes in threads
+                load in the background for the nodes one dependency away from
+                ready. Inputs are not prefetched if it is not set.
+            write_behind_threads: Number of background threads saving the
+                persistent outputs of the nodes running in threads, so the
+                nodes complete without waiting for their outputs to be
+                written. If 0, outputs are saved before the node completes.
+                Defaults to 0.
+
+        Raises:
+            ValueError: When the resource limits, the memory budget, the
+                chunk write depth, the prefetch memory or the number of write
+                behind threads are invalid, or when outputs are written behind
+                during a journaled run.
         """
+        if chunk_write_depth < 0:
+            raise ValueError("'chunk_write_depth' should not be negative.")
+        if write_behind_threads < 0:
+            raise ValueError("'write_behind_threads' should not be negative.")
+        if write_behind_threads and journal is not None:
+            raise ValueError(
+                "'write_behind_threads' cannot be used with a 'journal', which "
+                "records nodes as completed before their outputs are written."
+            )
         self._is_async = is_async
+        self._run_history = run_history
+        self._resource_limits = {
+            resource: _parse_resource_amount(amount)
+            for resource, amount in (resource_limits or {}).items()
+        }
+        self._memory_budget = (
+            None if memory_budget is None else _parse_resource_amount(memory_budget)
+        )
+        self._spill_dir = spill_dir
+        self._prefetch_memory = (
+            None if prefetch_memory is None else _parse_resource_amount(prefetch_memory)
+        )
+        # The loader of the inputs prefetched during a pooled run
+        self._prefetcher: _Prefetcher | None = None
+        self._write_behind_threads = write_behind_threads
+        # The writer of the outputs written behind during a run
+        self._pending_writes: _WriteBehind | None = None
+        self._chunk_write_depth = chunk_write_depth
+        self._fail_fast = fail_fast
+        # The process ids of the worker processes of a run in processes
+        self._worker_pids: _WorkerPids | None = None
+        self._fuse_nodes = fuse_nodes
+        # The nodes fused after the first node of each chain during a run
+        self._fused_nodes: dict[Node, list[Node]] = {}
+        # The fingerprints of the nodes of an incremental run
+        self._node_fingerprints: dict[Node, str] = {}
+        self._journal = journal
+        # The datasets loaded by the nodes of a journaled run
+        self._loaded_datasets: set[str] = set()
+        # The streams of a run, and the nodes started after the first node of
+        # each group of nodes linked by streams
+        self._streams: dict[str, StreamingDataset] = {}
+        self._streaming_groups: dict[Node, list[Node]] = {}
 
     @property
     def _logger(self) -> logging.Logger:
         return logging.getLogger(self.__module__)
 
-    def run(
+    def run(  # noqa: PLR0913
         self,
         pipeline: Pipeline,
         catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
         hook_manager: PluginManager | None = None,
         run_id: str | None = None,
         only_missing_outputs: bool = False,
+        incremental: bool = False,
     ) -> dict[str, Any]:
         """Run the ``Pipeline`` using the datasets provided by ``catalog``
         and save results back to the same objects.
@@ -74,17 +197,32 @@ class AbstractRunner(ABC):
             hook_manager: The ``PluginManager`` to activate hooks.
             run_id: The id of the run.
             only_missing_outputs: Run only nodes with missing outputs.
+            incremental: Skip the nodes whose code, parameters and inputs are
+                unchanged since they last completed, and whose outputs exist.
+                The node fingerprints are recorded to the ``run_history`` of
+                the runner. Implies ``only_missing_outputs``.
 
         Raises:
-            ValueError: Raised when ``Pipeline`` inputs cannot be satisfied.
+            ValueError: Raised when ``Pipeline`` inputs cannot be satisfied,
+                or when ``incremental`` is set but the runner has no
+                ``run_history``.
 
         Returns:
             Dictionary with pipeline outputs, where keys are dataset names
             and values are dataset objects.
         """
-        # Apply missing outputs filtering if requested
-        if only_missing_outputs:
+        self._node_fingerprints = {}
+        if self._journal is not None and self._journal.completed_nodes:
+            pipeline = self._resume_from_journal(pipeline, catalog)
+        # Apply incremental or missing outputs filtering if requested
+        if incremental:
+            pipeline = self._filter_pipeline_for_changed_nodes(pipeline, catalog)
+        elif only_missing_outputs:
             pipeline = self._filter_pipeline_for_missing_outputs(pipeline, catalog)
+        if self._journal is not None:
+            self._loaded_datasets = set(
+                chain.from_iterable(n.inputs for n in pipeline.nodes)
+            )
 
         # Check which datasets used in the pipeline are in the catalog or match
         # a pattern in the catalog, not including extra dataset patterns
@@ -112,8 +250,14 @@ class AbstractRunner(ABC):
             )
 
         start_time = perf_counter()
-        self._run(pipeline, catalog, hook_or_null_manager, run_id)  # type: ignore[arg-type]
+        try:
+            self._run(pipeline, catalog, hook_or_null_manager, run_id)  # type: ignore[arg-type]
+        finally:
+            if self._run_history is not None:
+                self._run_history.save()
         end_time = perf_counter()
+        if self._journal is not None:
+            self._journal.clear()
         run_duration = end_time - start_time
 
         self._logger.info(
@@ -160,6 +304,106 @@ class AbstractRunner(ABC):
 
         return filtered_pipeline
 
+    def _resume_from_journal(
+        self, pipeline: Pipeline, catalog: CatalogProtocol | SharedMemoryCatalogProtocol
+    ) -> Pipeline:
+        """Filter pipeline to only include the nodes which did not complete
+        according to the run journal, and the completed nodes which need to run
+        again to provide their inputs. Checkpointed inputs of the remaining
+        nodes are restored into the catalog.
+        """
+        journal: RunJournal = self._journal  # type: ignore[assignment]
+        completed = journal.completed_nodes
+
+        # Decide in reverse topological order, so the children of a node
+        # are decided before it
+        node_children = _build_node_children_map(pipeline)
+        nodes_to_run: set[Node] = set()
+        for node in reversed(pipeline.nodes):
+            if node.name not in completed or any(
+                dataset in child.inputs
+                and not journal.has_checkpoint(dataset)
+                and _is_dataset_ephemeral_or_missing(dataset, catalog)
+                for child in node_children[node] & nodes_to_run
+                for dataset in node.outputs
+            ):
+                nodes_to_run.add(node)
+
+        produced_by_skipped = {
+            dataset
+            for node in pipeline.nodes
+            if node not in nodes_to_run
+            for dataset in node.outputs
+        }
+        restored = sorted(
+            {
+                dataset
+                for node in nodes_to_run
+                for dataset in node.inputs
+                if dataset in produced_by_skipped and journal.has_checkpoint(dataset)
+            }
+        )
+        for dataset in restored:
+            catalog[dataset] = journal.load_checkpoint(dataset)
+
+        self._logger.info(
+            f"Resuming run from journal '{journal.path}': skipping "
+            f"{len(pipeline.nodes) - len(nodes_to_run)} completed nodes and "
+            f"restoring {len(restored)} checkpointed datasets"
+        )
+        if not nodes_to_run:
+            return Pipeline([])
+        return pipeline.filter(node_names=[n.name for n in nodes_to_run])
+
+    def _filter_pipeline_for_changed_nodes(
+        self, pipeline: Pipeline, catalog: CatalogProtocol | SharedMemoryCatalogProtocol
+    ) -> Pipeline:
+        """Filter pipeline to only include the nodes whose fingerprint changed
+        since they last completed, and the nodes which need to run to provide
+        their inputs or missing outputs.
+
+        Raises:
+            ValueError: When the runner has no ``run_history``.
+        """
+        if self._run_history is None:
+            raise ValueError(
+                "Incremental runs need a 'run_history' to record the node "
+                "fingerprints to."
+            )
+        fingerprints = _compute_node_fingerprints(pipeline, catalog)
+        recorded = self._run_history.node_fingerprints
+
+        # Decide in reverse topological order, so the children of a node
+        # are decided before it
+        node_children = _build_node_children_map(pipeline)
+        nodes_to_run: set[Node] = set()
+        for node in reversed(pipeline.nodes):
+            fingerprint = fingerprints[node]
+            if fingerprint is None or recorded.get(node.name) != fingerprint:
+                self._logger.debug(f"Node '{node.name}' must run: it has changed")
+                nodes_to_run.add(node)
+            elif _should_node_run(
+                node, catalog, nodes_to_run, node_children, self._logger
+            ):
+                nodes_to_run.add(node)
+
+        self._node_fingerprints = {
+            node: fingerprint
+            for node, fingerprint in fingerprints.items()
+            if fingerprint is not None
+        }
+        skipped = sorted(n.name for n in pipeline.nodes if n not in nodes_to_run)
+        if skipped:
+            self._logger.info(
+                f"Skipping {len(skipped)} unchanged nodes: {', '.join(skipped)}"
+            )
+        self._logger.info(
+            f"Running {len(nodes_to_run)} out of {len(pipeline.nodes)} nodes"
+        )
+        if not nodes_to_run:
+            return Pipeline([])
+        return pipeline.filter(node_names=[n.name for n in nodes_to_run])
+
     def _log_filtering_results(
         self,
         original_node_count: int,
@@ -194,6 +438,15 @@ class AbstractRunner(ABC):
         """Abstract method to provide the correct executor (e.g., ThreadPoolExecutor, ProcessPoolExecutor or None if running sequentially)."""
         pass
 
+    def _get_pipeline_executor(
+        self, pipeline: Pipeline, max_workers: int
+    ) -> Executor | None:
+        """Provide the executor running the nodes of ``pipeline`` on
+        ``max_workers`` workers. Runners whose pools depend on the nodes they
+        run override it.
+        """
+        return self._get_executor(max_workers)
+
     @abstractmethod  # pragma: no cover
     def _run(
         self,
@@ -217,78 +470,658 @@ class AbstractRunner(ABC):
 
         self._validate_catalog(catalog)
         self._validate_nodes(nodes)
+        self._validate_node_resources(nodes)
+        for node in nodes:
+            self._get_node_timeout(node)
         self._set_manager_datasets(catalog)
 
-        load_counts = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
-        done_nodes: set[Node] = set()
-        futures = set()
-        done = None
+        release_plan = _ReleasePlan(pipeline)
+        self._fused_nodes = self._find_fused_nodes(pipeline, catalog)
+        self._streaming_groups = self._find_streaming_groups(pipeline, catalog)
         max_workers = self._get_required_workers_count(pipeline)
-
-        pool = self._get_executor(max_workers)
-        if pool is None:
-            for exec_index, node in enumerate(nodes):
-                try:
-                    Task(
-                        node=node,
-                        catalog=catalog,
-                        hook_manager=hook_manager,
-                        is_async=self._is_async,
-                        run_id=run_id,
-                    ).execute()
-                    done_nodes.add(node)
-                except Exception:
-                    self._suggest_resume_scenario(pipeline, done_nodes, catalog)
-                    raise
-                self._logger.info("Completed node: %s", node.name)
-                self._logger.info(
-                    "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+        self._validate_streaming_groups(max_workers)
+
+        self._start_writes(pipeline, catalog, hook_manager)
+        try:
+            pool = self._get_pipeline_executor(pipeline, max_workers)
+            if pool is None:
+                self._run_sequentially(
+                    pipeline, catalog, hook_manager, run_id, release_plan
                 )
-                self._release_datasets(node, catalog, load_counts, pipeline)
+            else:
+                self._run_in_pool(
+                    pool,
+                    max_workers,
+                    pipeline,
+                    catalog,
+                    hook_manager,
+                    run_id,
+                    release_plan,
+                )
+        except BaseException:
+            self._flush_writes(raise_error=False)
+            raise
+        self._flush_writes()
 
-            return  # Exit early since everything runs sequentially
+    def _run_in_pool(  # noqa: PLR0913
+        self,
+        pool: Executor,
+        max_workers: int,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+        release_plan: _ReleasePlan,
+    ) -> None:
+        """Run the nodes of the pipeline in the executor of a pooled run, as
+        soon as their parents have completed and the resources they declare
+        are free.
+        """
+        nodes = pipeline.nodes
+        priorities = self._get_node_priorities(pipeline)
+        ready = _ReadyQueue(pipeline, priorities, self._streaming_groups)
+        resources_in_use: dict[str, float] = defaultdict(float)
+        timeouts = _TimeoutWatch()
+        done_nodes: set[Node] = set()
+        futures: set[Future[list[tuple[Node, float]]]] = set()
+        done = None
+        wait_for_workers = True
+        self._start_prefetcher(pipeline, catalog)
 
-        with pool as executor:
+        try:
             while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    task = Task(
-                        node=node,
-                        catalog=catalog,
-                        hook_manager=hook_manager,
-                        is_async=self._is_async,
-                        run_id=run_id,
+                # When nodes are prioritised, keep at most one task per worker
+                # in flight, so the ready queue picks the next node each time a
+                # worker frees up
+                free_workers = max_workers - len(futures) if priorities else None
+                for node in self._admit_ready_nodes(
+                    ready, resources_in_use, free_workers
+                ):
+                    future = self._submit_node(
+                        pool, node, catalog, hook_manager, run_id
                     )
-                    if isinstance(executor, ProcessPoolExecutor):
-                        task.parallel = True
-                    futures.add(executor.submit(task))
+                    futures.add(future)
+                    timeouts.watch(future, node, self._get_node_timeout(node))
+                self._prefetch_almost_ready(ready, done_nodes)
                 if not futures:
-                    if todo_nodes:
-                        self._raise_runtime_error(todo_nodes, done_nodes, ready, done)
+                    if len(done_nodes) < len(nodes):
+                        todo_nodes = set(nodes) - done_nodes
+                        self._raise_runtime_error(todo_nodes, done_nodes, set(), done)
                     break
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                done, futures = wait(
+                    futures, timeout=timeouts.next_check(), return_when=FIRST_COMPLETED
+                )
                 for future in done:
+                    timeouts.discard(future)
                     try:
-                        node = future.result()
-                    except Exception:
-                        self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                        completed = future.result()
+                    except Exception as exc:
+                        wait_for_workers = not self._fail_fast
+                        self._stop_failed_run(
+                            pool, futures, exc, pipeline, done_nodes, catalog
+                        )
                         raise
-                    done_nodes.add(node)
-                    self._logger.info("Completed node: %s", node.name)
-                    self._logger.info(
-                        "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+                    for node, duration in completed:
+                        for resource, amount in node.resources.items():
+                            resources_in_use[resource] -= amount
+                        self._close_streams(node)
+                        self._complete_node(
+                            node,
+                            duration,
+                            done_nodes,
+                            len(nodes),
+                            catalog,
+                            release_plan,
+                        )
+                    # Only the last node of a fused chain has children outside it
+                    ready.mark_done(completed[-1][0])
+                write_error = self._write_error()
+                if write_error is not None:
+                    wait_for_workers = not self._fail_fast
+                    self._stop_failed_run(
+                        pool, futures, write_error, pipeline, done_nodes, catalog
+                    )
+                    raise write_error
+                expired = timeouts.expired()
+                if expired is not None:
+                    exc = self._node_timeout_error(
+                        *expired, catalog, hook_manager, run_id
                     )
-                    self._release_datasets(node, catalog, load_counts, pipeline)
+                    wait_for_workers = False
+                    self._stop_failed_run(
+                        pool, futures, exc, pipeline, done_nodes, catalog, cancel=True
+                    )
+                    raise exc
+        finally:
+            pool.shutdown(wait=wait_for_workers, cancel_futures=not wait_for_workers)
+            self._stop_prefetcher()
+
+    def _run_sequentially(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+        release_plan: _ReleasePlan,
+    ) -> None:
+        """Run the nodes of the pipeline one after another in the calling thread."""
+        nodes = pipeline.nodes
+        done_nodes: set[Node] = set()
+        memory_budget = self._get_memory_budget(pipeline, catalog)
+        order = memory_budget.execution_order() if memory_budget else nodes
+        try:
+            for node in order:
+                if node in done_nodes:
+                    continue  # Already run as part of a fused chain
+                write_error = self._write_error()
+                if write_error is not None:
+                    self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                    raise write_error
+                try:
+                    completed = _execute_task(
+                        Task(
+                            node=node,
+                            catalog=catalog,
+                            hook_manager=hook_manager,
+                            is_async=self._is_async,
+                            run_id=run_id,
+                            fused_nodes=self._fused_nodes.get(node),
+                            chunk_write_depth=self._chunk_write_depth,
+                            pending_writes=self._pending_writes,
+                        )
+                    )
+                except Exception:
+                    self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                    raise
+                for completed_node, duration in completed:
+                    self._complete_node(
+                        completed_node,
+                        duration,
+                        done_nodes,
+                        len(nodes),
+                        catalog,
+                        release_plan,
+                    )
+                    if memory_budget is not None:
+                        for dataset, size in memory_budget.update(
+                            completed_node
+                        ).items():
+                            self._record_dataset_size(dataset, size)
+        finally:
+            if memory_budget is not None:
+                memory_budget.close()
+
+    def _complete_node(  # noqa: PLR0913
+        self,
+        node: Node,
+        duration: float,
+        done_nodes: set[Node],
+        node_count: int,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        release_plan: _ReleasePlan,
+    ) -> None:
+        """Record a node which completed in ``duration`` seconds, and release
+        the datasets no other node of the run loads anymore.
+        """
+        done_nodes.add(node)
+        self._record_node_duration(node, duration)
+        self._logger.info("Completed node: %s", node.name)
+        self._logger.info("Completed %d out of %d tasks", len(done_nodes), node_count)
+        self._journal_node(node, catalog)
+        self._release_datasets(node, catalog, release_plan)
+
+    def _stop_failed_run(  # noqa: PLR0913
+        self,
+        pool: Executor,
+        futures: Iterable[Future],
+        error: Exception,
+        pipeline: Pipeline,
+        done_nodes: set[Node],
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        cancel: bool | None = None,
+    ) -> None:
+        """Stop a pooled run which failed with ``error``, cancelling its
+        running nodes if ``cancel`` is set or, by default, if ``fail_fast`` is
+        enabled, and suggest how to resume it.
+        """
+        if self._fail_fast if cancel is None else cancel:
+            self._cancel_nodes(pool, futures)
+        self._abort_streams(error)
+        self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+
+    def _node_timeout_error(
+        self,
+        node: Node,
+        timeout: float,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+    ) -> TimeoutError:
+        """Create the error of a node running for longer than its timeout,
+        and report it to the ``on_node_error`` hook.
+        """
+        exc = TimeoutError(f"Node '{node.name}' timed out after {timeout} seconds.")
+        if hook_manager is not None:
+            hook_manager.hook.on_node_error(
+                error=exc,
+                node=node,
+                catalog=catalog,
+                inputs={},
+                is_async=self._is_async,
+                run_id=run_id,
+            )
+        return exc
+
+    def _submit_node(
+        self,
+        executor: Executor,
+        node: Node,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager | None,
+        run_id: str | None,
+    ) -> Future[list[tuple[Node, float]]]:
+        """Submit a node, with the nodes fused after it if any, to the executor
+        of a pooled run.
+        """
+        task = Task(
+            node=node,
+            catalog=catalog,
+            hook_manager=hook_manager,
+            is_async=self._is_async,
+            run_id=run_id,
+            fused_nodes=self._fused_nodes.get(node),
+            chunk_write_depth=self._chunk_write_depth,
+            prefetcher=self._prefetcher,
+            pending_writes=self._pending_writes,
+        )
+        if isinstance(executor, ProcessPoolExecutor):
+            task.parallel = True
+            task.prefetcher = None
+            task.pending_writes = None
+        return executor.submit(_execute_task, task)
+
+    def _find_fused_nodes(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+    ) -> dict[Node, list[Node]]:
+        """Find the maximal chains of nodes to run as single tasks, if
+        ``fuse_nodes`` is enabled.
+
+        A node is fused with its only child if that child has no other parent,
+        and every output of the node is an in-memory dataset loaded by the
+        child alone.
+
+        Returns:
+            Dictionary mapping the first node of each chain to the nodes fused
+            after it, in order.
+        """
+        if not self._fuse_nodes:
+            return {}
+
+        node_dependencies = pipeline.node_dependencies
+        node_children = _build_node_children_index(node_dependencies)
+        load_counts = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
+
+        def fused_child(parent: Node) -> Node | None:
+            children = node_children.get(parent, [])
+            if len(children) != 1 or len(node_dependencies[children[0]]) != 1:
+                return None
+            child = children[0]
+            if not self._can_fuse(parent, child):
+                return None
+            for dataset in parent.outputs:
+                loads = child.inputs.count(dataset)
+                if not loads or load_counts[dataset] != loads:
+                    return None
+                if not isinstance(
+                    catalog.get(dataset), (MemoryDataset, SharedMemoryDataset)
+                ):
+                    return None
+            return child
+
+        fused_nodes: dict[Node, list[Node]] = {}
+        in_chain: set[Node] = set()
+        for node in pipeline.nodes:
+            if node in in_chain:
+                continue
+            members = []
+            child = fused_child(node)
+            while child is not None:
+                members.append(child)
+                child = fused_child(child)
+            if members:
+                fused_nodes[node] = members
+                in_chain.update(members)
+        return fused_nodes
+
+    def _can_fuse(self, parent: Node, child: Node) -> bool:
+        """Whether ``child`` can run right after ``parent`` in the same task.
+        Generator nodes and nodes declaring resources or a timeout are never
+        fused.
+        """
+        return not any(
+            inspect.isgeneratorfunction(node.func)
+            or node.resources
+            or self._get_node_timeout(node) is not None
+            for node in (parent, child)
+        )
+
+    def _shares_memory(self, node: Node) -> bool:
+        """Whether a node runs in a thread of this process, so its inputs can
+        be prefetched and the outputs written behind for it served in memory.
+        """
+        return True
+
+    def _start_prefetcher(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+    ) -> None:
+        """Start prefetching the inputs of the nodes of a pooled run, if
+        ``prefetch_memory`` is set.
+        """
+        if self._prefetch_memory is not None:
+            self._prefetcher = _Prefetcher(
+                pipeline, catalog, self._prefetch_memory, self._pending_writes
+            )
+
+    def _prefetch_almost_ready(
+        self, ready: _ReadyQueue, done_nodes: Collection[Node]
+    ) -> None:
+        """Prefetch the inputs of the nodes running in this process whose
+        parents are about to complete.
+        """
+        if self._prefetcher is None:
+            return
+        for node in ready.pop_almost_ready():
+            if self._shares_memory(node):
+                self._prefetcher.prefetch(node, done_nodes)
+
+    def _stop_prefetcher(self) -> None:
+        """Stop prefetching and drop the inputs prefetched during the run."""
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    def _start_writes(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager | None,
+    ) -> None:
+        """Start the background writers of the outputs written behind during
+        the run, if ``write_behind_threads`` is set.
+        """
+        if self._write_behind_threads:
+            self._pending_writes = _WriteBehind(
+                pipeline,
+                catalog,
+                hook_manager,  # type: ignore[arg-type]
+                self._write_behind_threads,
+                self._shares_memory,
+            )
+
+    def _write_error(self) -> Exception | None:
+        """Return the error of the first output written behind which failed
+        to be written during the run, if any.
+        """
+        return self._pending_writes.error if self._pending_writes else None
+
+    def _flush_writes(self, raise_error: bool = True) -> None:
+        """Wait for the outputs written behind during the run to be saved.
+
+        Args:
+            raise_error: Whether to raise the error of a failed write, if any.
+        """
+        pending_writes, self._pending_writes = self._pending_writes, None
+        if pending_writes is None:
+            return
+        error = pending_writes.flush()
+        if error is not None and raise_error:
+            raise error
+
+    def _get_node_timeout(self, node: Node) -> float | None:
+        """Return the number of seconds the node may run for, declared with
+        its ``timeout`` attribute or, failing that, with a ``timeout.<seconds>``
+        tag such as ``timeout.600``.
+
+        Raises:
+            ValueError: When a timeout tag of the node is not a positive
+                number of seconds.
+        """
+        if node.timeout is not None:
+            return node.timeout
+        timeouts = []
+        for tag in node.tags:
+            if not tag.startswith(_TIMEOUT_TAG_PREFIX):
+                continue
+            try:
+                timeout = float(tag[len(_TIMEOUT_TAG_PREFIX) :])
+            except ValueError:
+                timeout = 0.0
+            if not timeout > 0:
+                raise ValueError(
+                    f"Node '{node.name}' has an invalid timeout tag '{tag}'. "
+                    f"It should be '{_TIMEOUT_TAG_PREFIX}<seconds>' with a "
+                    f"positive number of seconds."
+                )
+            timeouts.append(timeout)
+        return min(timeouts, default=None)
+
+    def _cancel_nodes(self, executor: Executor, futures: Iterable[Future]) -> None:
+        """Cancel the nodes of a failed run which have not started yet, and
+        terminate the worker processes running the others. Nodes running in
+        threads cannot be stopped and complete in the background.
+        """
+        for future in futures:
+            future.cancel()
+        # ``ProcessPoolExecutor`` has no public API to stop the tasks it runs
+        if self._worker_pids is not None:
+            self._worker_pids.terminate()
+
+    def _find_streaming_groups(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+    ) -> dict[Node, list[Node]]:
+        """Find the groups of nodes linked by ``StreamingDataset``s, which
+        must run at the same time, and reset their streams.
+
+        Returns:
+            Dictionary mapping the first node of each group to the other
+            nodes of the group, in topological order.
+
+        Raises:
+            ValueError: When the runner does not support streams, or a stream
+                is not saved and loaded by exactly one node each.
+        """
+        self._streams = {
+            name: dataset
+            for name in sorted(pipeline.datasets())
+            if isinstance(dataset := catalog.get(name), StreamingDataset)
+        }
+        if not self._streams:
+            return {}
+        if not self._SUPPORTS_STREAMING:
+            raise ValueError(
+                f"{self.__class__.__name__} does not support streaming "
+                f"datasets {sorted(self._streams)}. Use 'ThreadRunner' instead."
+            )
+
+        free_datasets = pipeline.inputs() | pipeline.outputs()
+        load_counts = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
+        invalid = sorted(
+            name
+            for name in self._streams
+            if name in free_datasets or load_counts[name] != 1
+        )
+        if invalid:
+            raise ValueError(
+                f"Streaming datasets {invalid} must be saved by exactly one node "
+                f"and loaded by exactly one node of the pipeline."
+            )
+
+        # Merge the producer and consumer of each stream into one group
+        producers = {name: n for n in pipeline.nodes for name in n.outputs}
+        group_of = {node: [node] for node in pipeline.nodes}
+        for node in pipeline.nodes:
+            for name in node.inputs:
+                producer = producers.get(name)
+                if name not in self._streams or producer is None:
+                    continue
+                if group_of[producer] is not group_of[node]:
+                    merged = group_of[producer] + group_of[node]
+                    for member in merged:
+                        group_of[member] = merged
+
+        node_order = {n: i for i, n in enumerate(pipeline.nodes)}
+        streaming_groups: dict[Node, list[Node]] = {}
+        for group in {id(g): g for g in group_of.values() if len(g) > 1}.values():
+            first, *others = sorted(group, key=node_order.__getitem__)
+            streaming_groups[first] = others
+        for stream in self._streams.values():
+            stream.reset()
+        return streaming_groups
+
+    def _validate_streaming_groups(self, max_workers: int) -> None:
+        """Ensure the workers of the runner can run all the nodes of each
+        group of nodes linked by streams at the same time.
+        """
+        largest = max((len(g) + 1 for g in self._streaming_groups.values()), default=0)
+        if largest > max_workers:
+            raise ValueError(
+                f"Streaming datasets link {largest} nodes which must run at the "
+                f"same time, but the runner only has {max_workers} workers."
+            )
+
+    def _close_streams(self, node: Node) -> None:
+        """Mark the end of the streams saved by a completed node."""
+        for name in node.outputs:
+            if name in self._streams:
+                self._streams[name].close()
+
+    def _abort_streams(self, exc: Exception) -> None:
+        """Stop the nodes still running on streams after a node failed."""
+        for stream in self._streams.values():
+            stream.abort(f"a node of the run failed with {exc!r}")
+
+    def _admit_ready_nodes(
+        self,
+        ready: _ReadyQueue,
+        resources_in_use: dict[str, float],
+        max_nodes: int | None = None,
+    ) -> list[Node]:
+        """Take the ready nodes whose declared resources fit within the resource
+        limits next to the resources in use, and add them to the resources in use.
+        Nodes which do not fit stay in the ready queue until resources are freed.
+        At most ``max_nodes`` nodes are taken, if given. The nodes of a group
+        linked by streams are taken together and kept next to each other, and
+        a group which does not fit within ``max_nodes`` stops the admission,
+        so nodes of a lower priority do not take the slots it waits for.
+        """
+        admitted: list[Node] = []
+        deferred: list[Node] = []
+        while ready and (max_nodes is None or len(admitted) < max_nodes):
+            node = ready.pop()
+            group = ready.group(node)
+            if max_nodes is not None and len(admitted) + len(group) > max_nodes:
+                deferred.append(node)
+                break
+            needed: dict[str, float] = defaultdict(float)
+            for member in group:
+                for resource, amount in member.resources.items():
+                    needed[resource] += amount
+            if all(
+                resources_in_use[resource] + needed.get(resource, 0.0) <= limit
+                for resource, limit in self._resource_limits.items()
+            ):
+                for resource, amount in needed.items():
+                    resources_in_use[resource] += amount
+                admitted.extend(group)
+            else:
+                deferred.append(node)
+        for node in deferred:
+            ready.push(node)
+        return admitted
+
+    def _validate_node_resources(self, nodes: Iterable[Node]) -> None:
+        """Ensure no node needs more of a resource than the resource limits,
+        as it could never be started.
+        """
+        oversized = {
+            node.name: sorted(
+                resource
+                for resource, limit in self._resource_limits.items()
+                if node.resources.get(resource, 0.0) > limit
+            )
+            for node in nodes
+        }
+        oversized = {name: res for name, res in oversized.items() if res}
+        if oversized:
+            raise ValueError(
+                f"The following nodes need more resources than the runner "
+                f"resource limits {self._resource_limits} allow: {oversized}"
+            )
+
+    def _get_node_priorities(self, pipeline: Pipeline) -> dict[Node, float]:
+        """Rank nodes by their critical path length if there is a run history."""
+        if self._run_history is None:
+            return {}
+        return _critical_path_priorities(pipeline, self._run_history.node_durations)
+
+    def _record_node_duration(self, node: Node, duration: float) -> None:
+        """Record how long a completed node took and, in incremental runs,
+        its fingerprint.
+        """
+        if self._run_history is not None:
+            self._run_history.record_node_duration(node.name, duration)
+            if node in self._node_fingerprints:
+                self._run_history.record_node_fingerprint(
+                    node.name, self._node_fingerprints[node]
+                )
+
+    def _journal_node(
+        self, node: Node, catalog: CatalogProtocol | SharedMemoryCatalogProtocol
+    ) -> None:
+        """Checkpoint the in-memory outputs of a completed node which other
+        nodes load, then record the node as completed in the run journal.
+        """
+        if self._journal is None:
+            return
+        for dataset_name in node.outputs:
+            dataset = catalog.get(dataset_name)
+            if (
+                isinstance(dataset, (MemoryDataset, SharedMemoryDataset))
+                and dataset_name in self._loaded_datasets
+                and dataset.exists()
+            ):
+                self._journal.checkpoint(dataset_name, dataset.load())
+        self._journal.record_node(node.name)
+
+    def _get_memory_budget(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+    ) -> _MemoryBudget | None:
+        """Set up the memory budget of a sequential run, if one is configured."""
+        if self._memory_budget is None:
+            return None
+        known_sizes = self._run_history.dataset_sizes if self._run_history else {}
+        return _MemoryBudget(
+            pipeline, catalog, self._memory_budget, self._spill_dir, known_sizes
+        )
+
+    def _record_dataset_size(self, dataset: str, size: int) -> None:
+        if self._run_history is not None:
+            self._run_history.record_dataset_size(dataset, size)
 
     @staticmethod
     def _raise_runtime_error(
         todo_nodes: set[Node],
         done_nodes: set[Node],
         ready: set[Node],
-        done: set[Future[Node]] | None,
+        done: set[Future[list[tuple[Node, float]]]] | None,
     ) -> None:
         debug_data = {
             "todo_nodes": todo_nodes,
@@ -311,7 +1144,8 @@ class AbstractRunner(ABC):
         """
         Suggest a command to the user to resume a run after it fails.
         The run should be started from the point closest to the failure
-        for which persisted input exists.
+        for which persisted input exists, or resumed from the run journal
+        if the runner has one.
 
         Args:
             pipeline: the ``Pipeline`` of the run.
@@ -321,6 +1155,16 @@ class AbstractRunner(ABC):
         """
         remaining_nodes = set(pipeline.nodes) - set(done_nodes)
 
+        if self._journal is not None and self._journal.completed_nodes:
+            self._logger.warning(
+                f"There are {len(remaining_nodes)} nodes that have not run.\n"
+                "You can resume the pipeline run from the run journal, "
+                "restoring the in-memory inputs of the remaining nodes, by "
+                "adding the following argument to your previous command:\n"
+                f'  --resume "{self._journal.path.name}"'
+            )
+            return
+
         postfix = ""
         if done_nodes:
             start_node_names = _find_nodes_to_resume_from(
@@ -343,21 +1187,19 @@ class AbstractRunner(ABC):
                 f"argument to your previous command:\n{postfix}"
             )
 
-    @staticmethod
     def _release_datasets(
+        self,
         node: Node,
         catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
-        load_counts: dict,
-        pipeline: Pipeline,
+        release_plan: _ReleasePlan,
     ) -> None:
-        """Decrement dataset load counts and release any datasets we've finished with"""
-        for dataset in node.inputs:
-            load_counts[dataset] -= 1
-            if load_counts[dataset] < 1 and dataset not in pipeline.inputs():
-                catalog.release(dataset)
-        for dataset in node.outputs:
-            if load_counts[dataset] < 1 and dataset not in pipeline.outputs():
-                catalog.release(dataset)
+        """Release any datasets we've finished with once ``node`` has run,
+        along with their run journal checkpoints.
+        """
+        for dataset in release_plan.datasets_to_release(node):
+            catalog.release(dataset)
+            if self._journal is not None:
+                self._journal.evict(dataset)
 
     def _validate_catalog(
         self, catalog: CatalogProtocol | SharedMemoryCatalogProtocol
@@ -403,6 +1245,17 @@ class AbstractRunner(ABC):
         return max_workers
 
 
+def _execute_task(task: Task) -> list[tuple[Node, float]]:
+    """Execute a ``Task`` and measure the wall-clock duration in seconds of
+    each node it runs.
+    """
+    start_time = perf_counter()
+    node = task.execute()
+    if task.fused_nodes:
+        return task.node_durations
+    return [(node, perf_counter() - start_time)]
+
+
 def _find_nodes_to_resume_from(
     pipeline: Pipeline,
     unfinished_nodes: Collection[Node],
@@ -570,23 +1423,8 @@ def _build_node_children_map(pipeline: Pipeline) -> dict[Node, set[Node]]:
     Returns:
         Dictionary mapping each node to set of its child nodes.
     """
-    # Empty children sets
-    node_children: dict[Node, set[Node]] = {node: set() for node in pipeline.nodes}
-
-    # Build map for efficient lookup
-    output_to_node: dict[str, Node] = {}
-    for node in pipeline.nodes:
-        for output in node.outputs:
-            output_to_node[output] = node
-
-    # Build children relationships
-    for node in pipeline.nodes:
-        for input_dataset in node.inputs:
-            if input_dataset in output_to_node:
-                parent = output_to_node[input_dataset]
-                node_children[parent].add(node)
-
-    return node_children
+    node_children = _build_node_children_index(pipeline.node_dependencies)
+    return {node: set(node_children.get(node, ())) for node in pipeline.nodes}
 
 
 def _determine_nodes_to_run(
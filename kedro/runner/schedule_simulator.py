@@ -0,0 +1,149 @@
+"""``ScheduleSimulator`` replays the scheduling policy of the runners over the
+dependencies of a pipeline using recorded node durations, to predict how long
+a run would take without executing any node.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kedro.runner.scheduling import (
+    _build_node_children_index,
+    _critical_path_priorities,
+    _max_antichain_width,
+    _ReadyQueue,
+)
+
+if TYPE_CHECKING:
+    from kedro.pipeline import Pipeline
+    from kedro.pipeline.node import Node
+    from kedro.runner.run_history import RunHistory
+
+
+@dataclass(frozen=True)
+class SchedulePrediction:
+    """Predicted outcome of running a pipeline with a number of workers.
+
+    Attributes:
+        workers: Number of nodes allowed to run at the same time.
+        makespan: Predicted wall-clock duration of the run in seconds.
+        utilisation: Fraction of the worker time spent running nodes.
+    """
+
+    workers: int
+    makespan: float
+    utilisation: float
+
+
+class ScheduleSimulator:
+    """``ScheduleSimulator`` predicts the makespan of a pipeline run by
+    replaying the runners' scheduling policy, which starts the ready node with
+    the longest remaining path first, against the node durations recorded in a
+    ``RunHistory``. Nodes without a recorded duration are assumed to take the
+    mean recorded duration, or one second if none was recorded.
+
+    Example:
+    ``` python
+    from kedro.runner import RunHistory, ScheduleSimulator
+
+    simulator = ScheduleSimulator(
+        pipeline, RunHistory(".kedro/run_history.json").node_durations
+    )
+    for workers in range(1, simulator.max_parallelism + 1):
+        print(simulator.simulate(workers))
+    ```
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        node_durations: dict[str, float] | RunHistory | None = None,
+    ):
+        """Instantiates the simulator and ranks the nodes of the pipeline by
+        their critical path length.
+
+        Args:
+            pipeline: The ``Pipeline`` to simulate.
+            node_durations: Durations in seconds of previous node runs, keyed
+                by node name, or the ``RunHistory`` recording them.
+        """
+        if node_durations is None:
+            node_durations = {}
+        elif not isinstance(node_durations, dict):
+            node_durations = node_durations.node_durations
+        self._pipeline = pipeline
+        known = [
+            node_durations[n.name] for n in pipeline.nodes if n.name in node_durations
+        ]
+        default_duration = sum(known) / len(known) if known else 1.0
+        self._durations = {
+            n: node_durations.get(n.name, default_duration) for n in pipeline.nodes
+        }
+        self._priorities = _critical_path_priorities(pipeline, node_durations)
+        self._max_parallelism: int | None = None
+
+    @property
+    def max_parallelism(self) -> int:
+        """Largest number of nodes which do not depend on each other and so
+        can run at the same time. More workers than this are never busy.
+        """
+        if self._max_parallelism is None:
+            self._max_parallelism = _max_antichain_width(self._pipeline)
+        return self._max_parallelism
+
+    @property
+    def critical_path(self) -> list[Node]:
+        """The chain of dependent nodes taking the longest in total, which no
+        number of workers can run faster than.
+        """
+        node_children = _build_node_children_index(self._pipeline.node_dependencies)
+        path: list[Node] = []
+        candidates = self._pipeline.nodes
+        while candidates:
+            node = max(candidates, key=self._priorities.__getitem__)
+            path.append(node)
+            candidates = node_children.get(node, [])
+        return path
+
+    @property
+    def critical_path_length(self) -> float:
+        """Predicted duration in seconds of the critical path."""
+        return sum(self._durations[n] for n in self.critical_path)
+
+    def simulate(self, workers: int) -> SchedulePrediction:
+        """Predict the makespan and utilisation of a run with ``workers``
+        nodes running at the same time.
+
+        Args:
+            workers: Number of nodes allowed to run at the same time.
+
+        Returns:
+            The predicted outcome of the run.
+
+        Raises:
+            ValueError: If ``workers`` is not positive.
+        """
+        if workers <= 0:
+            raise ValueError("'workers' should be positive.")
+
+        ready = _ReadyQueue(self._pipeline, self._priorities)
+        node_order = {n: i for i, n in enumerate(self._pipeline.nodes)}
+        running: list[tuple[float, int, Node]] = []
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < workers:
+                node = ready.pop()
+                finish = now + self._durations[node]
+                heapq.heappush(running, (finish, node_order[node], node))
+            now = running[0][0]
+            # Complete every node finishing now before starting any other
+            while running and running[0][0] == now:
+                ready.mark_done(heapq.heappop(running)[-1])
+
+        busy = sum(self._durations.values())
+        utilisation = busy / (workers * now) if now else 0.0
+        return SchedulePrediction(
+            workers=workers, makespan=now, utilisation=utilisation
+        )
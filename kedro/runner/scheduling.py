@@ -0,0 +1,774 @@
+"""Helpers scheduling the nodes of a run: the order and priority in which
+ready nodes start, how many of them can run at once, when datasets can be
+released, and the background loading, writing and memory budget of their
+data.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import logging
+import re
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from kedro.io import DatasetError, MemoryDataset
+from kedro.io.memory_dataset import _copy_with_mode, _estimate_size, _infer_copy_mode
+from kedro.pipeline.transcoding import _strip_transcoding
+from kedro.runner.task import Task
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Collection, Iterable, Iterator
+
+    from pluggy import PluginManager
+
+    from kedro.io import CatalogProtocol, SharedMemoryCatalogProtocol
+    from kedro.pipeline import Pipeline
+    from kedro.pipeline.node import Node
+
+# How often, in seconds, the runner checks whether the nodes with a timeout
+# submitted to the executor have started
+_TIMEOUT_POLL_INTERVAL = 0.1
+
+
+def _critical_path_priorities(
+    pipeline: Pipeline, node_durations: dict[str, float]
+) -> dict[Node, float]:
+    """Compute the weighted length of the longest path from each node of the
+    pipeline to any of its terminal nodes, including the node itself.
+
+    Args:
+        pipeline: The ``Pipeline`` to rank the nodes of.
+        node_durations: Durations of previous node runs, keyed by node name.
+
+    Returns:
+        Dictionary mapping each node to its longest remaining path length.
+    """
+    nodes = pipeline.nodes
+    known = [node_durations[n.name] for n in nodes if n.name in node_durations]
+    default_duration = sum(known) / len(known) if known else 1.0
+    node_children = _build_node_children_index(pipeline.node_dependencies)
+
+    priorities: dict[Node, float] = {}
+    for node in reversed(nodes):
+        longest_child_path = max(
+            (priorities.get(child, 0.0) for child in node_children.get(node, ())),
+            default=0.0,
+        )
+        priorities[node] = (
+            node_durations.get(node.name, default_duration) + longest_child_path
+        )
+    return priorities
+
+
+def _max_antichain_width(
+    pipeline: Pipeline, nodes: Iterable[Node] | None = None
+) -> int:
+    """Compute the largest number of nodes of the pipeline which do not depend
+    on each other, directly or transitively, and so can run at the same time.
+
+    By Dilworth's theorem, this width is the number of nodes minus the size of
+    a maximum matching in the bipartite graph linking each node to all of its
+    descendants. Reachability is kept as one integer bitset per node.
+
+    Args:
+        pipeline: The ``Pipeline`` whose dependencies constrain the nodes.
+        nodes: The nodes of the pipeline to consider, all of them by default.
+            Dependencies through the other nodes of the pipeline still apply.
+
+    Returns:
+        The maximum antichain width of the nodes.
+    """
+    all_nodes = pipeline.nodes
+    node_index = {node: i for i, node in enumerate(all_nodes)}
+    node_children = _build_node_children_index(pipeline.node_dependencies)
+    descendants = [0] * len(all_nodes)
+    for i in range(len(all_nodes) - 1, -1, -1):
+        for child in node_children.get(all_nodes[i], ()):
+            j = node_index[child]
+            descendants[i] |= (1 << j) | descendants[j]
+
+    indices = (
+        range(len(all_nodes))
+        if nodes is None
+        else sorted({node_index[node] for node in nodes})
+    )
+    mask = sum(1 << i for i in indices)
+    reachable = {i: descendants[i] & mask for i in indices}
+    # Node matched as a descendant -> node it is matched to
+    matches: dict[int, int] = {}
+    for start in indices:
+        _augment_matching(start, reachable, matches)
+    return len(indices) - len(matches)
+
+
+def _augment_matching(
+    start: int, reachable: dict[int, int], matches: dict[int, int]
+) -> bool:
+    """Search depth-first for an augmenting path from ``start`` and, if found,
+    flip the matches along it.
+    """
+    visited = 0
+    path: list[int] = []
+    stack = [start]
+    candidates = [reachable[start]]
+    while stack:
+        free = candidates[-1] & ~visited
+        if not free:
+            stack.pop()
+            candidates.pop()
+            if path:
+                path.pop()
+            continue
+        target = (free & -free).bit_length() - 1
+        visited |= 1 << target
+        path.append(target)
+        matched = matches.get(target)
+        if matched is None:
+            for source, descendant in zip(stack, path):
+                matches[descendant] = source
+            return True
+        stack.append(matched)
+        candidates.append(reachable[matched])
+    return False
+
+
+class _TimeoutWatch:
+    """Track the deadlines of the nodes with a timeout submitted to the
+    executor of a pooled run. The timeout of a node counts from when its
+    future is first seen running.
+    """
+
+    def __init__(self) -> None:
+        self._timeouts: dict[Future, tuple[Node, float]] = {}
+        self._deadlines: dict[Future, float] = {}
+
+    def watch(self, future: Future, node: Node, timeout: float | None) -> None:
+        """Start watching the future of a node, if the node has a timeout."""
+        if timeout is not None:
+            self._timeouts[future] = (node, timeout)
+
+    def discard(self, future: Future) -> None:
+        """Stop watching the future of a completed node."""
+        self._timeouts.pop(future, None)
+        self._deadlines.pop(future, None)
+
+    def next_check(self) -> float | None:
+        """Return how long to wait for nodes to complete before checking the
+        deadlines again, or None to wait indefinitely.
+        """
+        now = perf_counter()
+        for future, (_, timeout) in self._timeouts.items():
+            if future not in self._deadlines and future.running():
+                self._deadlines[future] = now + timeout
+        if not self._timeouts:
+            return None
+        waits = [deadline - now for deadline in self._deadlines.values()]
+        if len(self._deadlines) < len(self._timeouts):
+            waits.append(_TIMEOUT_POLL_INTERVAL)
+        return max(min(waits), 0.0)
+
+    def expired(self) -> tuple[Node, float] | None:
+        """Return a node running for longer than its timeout, with the
+        timeout, if any.
+        """
+        now = perf_counter()
+        for future, deadline in self._deadlines.items():
+            if deadline <= now and not future.done():
+                return self._timeouts[future]
+        return None
+
+
+class _Prefetcher:
+    """Load the persistent inputs of the nodes one dependency away from ready
+    in background threads, so the nodes find them in memory when they start.
+
+    Each prefetched dataset is held for a single node. Loads only start while
+    the prefetched data waiting to be taken is below the memory budget, and
+    data which would exceed the budget once loaded is dropped, leaving the
+    node to load it itself.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        budget: float,
+        pending_writes: _WriteBehind | None = None,
+    ):
+        self._catalog = catalog
+        self._budget = budget
+        # Datasets still being written cannot be loaded yet
+        self._pending_writes = pending_writes
+        self._producers = {
+            _strip_transcoding(output): node
+            for node in pipeline.nodes
+            for output in node.outputs
+        }
+        self._executor = ThreadPoolExecutor(thread_name_prefix="kedro-prefetch")
+        self._lock = threading.Lock()
+        # The node each dataset is prefetched for, and the future of its data
+        self._prefetched: dict[str, tuple[Node, Future]] = {}
+        self._sizes: dict[str, int] = {}
+        self._size = 0
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    def prefetch(self, node: Node, done_nodes: Collection[Node]) -> None:
+        """Start loading the persistent inputs of ``node`` whose producers,
+        if any, have completed.
+        """
+        for name in dict.fromkeys(node.inputs):
+            producer = self._producers.get(_strip_transcoding(name))
+            if producer is not None and producer not in done_nodes:
+                continue
+            if self._pending_writes and self._pending_writes.is_pending(name):
+                continue
+            dataset = self._catalog.get(name)
+            if dataset is None or dataset._EPHEMERAL:
+                continue
+            with self._lock:
+                if name in self._prefetched or self._size >= self._budget:
+                    continue
+                future = self._executor.submit(self._catalog.load, name)
+                self._prefetched[name] = (node, future)
+            future.add_done_callback(functools.partial(self._account, name))
+
+    def take(self, node: Node, name: str) -> Future | None:
+        """Hand over the future of a dataset prefetched for ``node``.
+
+        Returns:
+            The future of the data, or None if the dataset was not prefetched
+            for the node.
+        """
+        with self._lock:
+            node_and_future = self._prefetched.get(name)
+            if node_and_future is None or node_and_future[0] is not node:
+                return None
+            del self._prefetched[name]
+            self._size -= self._sizes.pop(name, 0)
+        return node_and_future[1]
+
+    def close(self) -> None:
+        """Cancel the loads not started yet and drop the data not taken, e.g.
+        by the nodes which did not run because the run failed.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._prefetched.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    def _account(self, name: str, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        size = _estimate_size(future.result())
+        with self._lock:
+            node_and_future = self._prefetched.get(name)
+            if node_and_future is None or node_and_future[1] is not future:
+                return  # Already taken
+            if self._size + size > self._budget:
+                del self._prefetched[name]
+                self._logger.debug(
+                    "Dropped prefetched dataset '%s' exceeding the prefetch memory.",
+                    name,
+                )
+                return
+            self._sizes[name] = size
+            self._size += size
+
+
+class _WriteBehind:
+    """Save the persistent outputs of nodes in background threads, so the
+    worker which ran a node can take its next task straight away.
+
+    Until an output is written, the nodes loading it receive a copy of its
+    data from memory. An output whose write failed raises the error of the
+    write to the nodes loading it, rather than letting them load the data
+    left in the dataset by a previous run. Outputs which no node loads are
+    written first, since their data is only held in memory to be written,
+    while the others serve their consumers in the meantime. Outputs loaded by
+    nodes which do not share the memory of the runner, or under another
+    transcoded name, are saved by the node itself.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        hook_manager: PluginManager,
+        threads: int,
+        shares_memory: Callable[[Node], bool],
+    ):
+        self._catalog = catalog
+        self._hook_manager = hook_manager
+        self._consumers = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
+        # The names each dataset is loaded under, None standing for nodes
+        # which cannot be served in memory
+        loaded_as: defaultdict[str, set[str | None]] = defaultdict(set)
+        for node in pipeline.nodes:
+            for name in node.inputs:
+                loaded_as[_strip_transcoding(name)].add(
+                    name if shares_memory(node) else None
+                )
+        self._outputs: set[str] = set()
+        for node in pipeline.nodes:
+            if not shares_memory(node):
+                continue
+            for name in node.outputs:
+                dataset = catalog.get(name)
+                if (
+                    dataset is not None
+                    and not dataset._EPHEMERAL
+                    and loaded_as[_strip_transcoding(name)] <= {name}
+                ):
+                    self._outputs.add(name)
+        self._condition = threading.Condition()
+        # Outputs waiting for a writer, by number of consumers and arrival
+        self._queue: list[tuple[int, int, str]] = []
+        self._arrivals = itertools.count()
+        # Outputs not written yet, with the node which produced them
+        self._pending: dict[str, tuple[Node, Any]] = {}
+        # Outputs which failed to be written, with the error of the write
+        self._failed: dict[str, Exception] = {}
+        self._closed = False
+        self.error: Exception | None = None
+        self._threads = [
+            threading.Thread(
+                target=self._write, name=f"kedro-write-behind-{i}", daemon=True
+            )
+            for i in range(threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def save(self, name: str, data: Any, node: Node) -> bool:
+        """Hand an output of ``node`` over to the background writers.
+
+        Returns:
+            Whether the output is written behind, or must be saved by the node.
+        """
+        if name not in self._outputs:
+            return False
+        with self._condition:
+            self._pending[name] = (node, data)
+            entry = (self._consumers[name], next(self._arrivals), name)
+            heapq.heappush(self._queue, entry)
+            self._condition.notify_all()
+        return True
+
+    def load(self, name: str) -> tuple[bool, Any]:
+        """Return whether an output is still being written, with a copy of its
+        data if so.
+
+        Raises:
+            Exception: The error of the write of the output, if it failed.
+        """
+        with self._condition:
+            if name in self._failed:
+                raise self._failed[name]
+            if name not in self._pending:
+                return False, None
+            data = self._pending[name][1]
+        return True, _copy_with_mode(data, _infer_copy_mode(data))
+
+    def is_pending(self, name: str) -> bool:
+        """Whether an output is still being written, or failed to be written."""
+        with self._condition:
+            return name in self._pending or name in self._failed
+
+    def flush(self) -> Exception | None:
+        """Wait for all the outputs to be written and stop the writers.
+
+        Returns:
+            The error of the first write which failed, if any.
+        """
+        with self._condition:
+            while self._pending:
+                self._condition.wait()
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        return self.error
+
+    def _write(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                name = heapq.heappop(self._queue)[-1]
+                node, data = self._pending[name]
+            try:
+                Task._synchronous_dataset_save(
+                    name, data, node, self._catalog, self._hook_manager
+                )
+            except Exception as exc:
+                with self._condition:
+                    self.error = self.error or exc
+                    self._failed[name] = exc
+            with self._condition:
+                del self._pending[name]
+                self._condition.notify_all()
+
+
+class _ReadyQueue:
+    """Nodes of a pipeline whose parents have all completed, ordered by
+    priority and then by their position in the toposort.
+
+    Each node keeps a count of its unfinished parents, so completing a node
+    only revisits its children and scheduling stays linear in the number of
+    nodes and dependencies. A group of nodes which must run at the same time
+    is queued as its first node, once all the parents outside the group of
+    its nodes have completed.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        priorities: dict[Node, float],
+        node_groups: dict[Node, list[Node]] | None = None,
+    ):
+        nodes = pipeline.nodes
+        node_dependencies = pipeline.node_dependencies
+        self._node_groups = node_groups or {}
+        self._group_leaders = {
+            member: leader
+            for leader, members in self._node_groups.items()
+            for member in members
+        }
+        self._pending_parents = {
+            n: sum(self._leader(parent) is not self._leader(n) for parent in deps)
+            for n, deps in node_dependencies.items()
+        }
+        for member, leader in self._group_leaders.items():
+            self._pending_parents[leader] += self._pending_parents.pop(member)
+        self._node_children = _build_node_children_index(node_dependencies)
+        self._priorities = priorities
+        self._node_order = {n: i for i, n in enumerate(nodes)}
+        self._heap: list[tuple[float, int, Node]] = []
+        for node in nodes:
+            if not self._pending_parents.get(node, 1):
+                self.push(node)
+        # Nodes left with a single unfinished parent, not yet returned by
+        # ``pop_almost_ready``
+        self._almost_ready = [n for n in nodes if self._pending_parents.get(n) == 1]
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, node: Node) -> None:
+        """Add a node that is ready to run."""
+        entry = (-self._priorities.get(node, 0.0), self._node_order[node], node)
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Node:
+        """Remove and return the ready node to run next."""
+        return heapq.heappop(self._heap)[-1]
+
+    def group(self, node: Node) -> list[Node]:
+        """Return the nodes to run together with a node popped from the queue,
+        starting with the node itself.
+        """
+        return [node, *self._node_groups.get(node, ())]
+
+    def mark_done(self, node: Node) -> None:
+        """Add the children of a completed node which are now ready to run."""
+        for child in self._node_children.get(node, ()):
+            leader = self._leader(child)
+            if leader is self._leader(node):
+                continue
+            self._pending_parents[leader] -= 1
+            if not self._pending_parents[leader]:
+                self.push(leader)
+            elif self._pending_parents[leader] == 1:
+                self._almost_ready.append(leader)
+
+    def pop_almost_ready(self) -> list[Node]:
+        """Return the nodes left with a single unfinished parent since the
+        last call.
+        """
+        almost_ready, self._almost_ready = self._almost_ready, []
+        return almost_ready
+
+    def _leader(self, node: Node) -> Node:
+        return self._group_leaders.get(node, node)
+
+
+class _ReleasePlan:
+    """Datasets that can be released once each node of a pipeline has run.
+
+    The plan is compiled once per run. Pipeline inputs and outputs are never
+    released. A dataset loaded by a single node is released right after that
+    node, and an output nobody loads right after its producer. Only datasets
+    loaded by several nodes keep a countdown of remaining loads, because
+    pooled runners may complete their consumers in any order.
+    """
+
+    def __init__(self, pipeline: Pipeline):
+        nodes = pipeline.nodes
+        protected = pipeline.inputs() | pipeline.outputs()
+        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
+
+        self._loads_left = {
+            dataset: count
+            for dataset, count in load_counts.items()
+            if count > 1 and dataset not in protected
+        }
+        self._plan: dict[Node, list[str]] = {}
+        for node in nodes:
+            releasable = [
+                dataset
+                for dataset in dict.fromkeys(node.inputs)
+                if dataset not in protected
+            ]
+            releasable.extend(
+                dataset
+                for dataset in node.outputs
+                if not load_counts[dataset] and dataset not in protected
+            )
+            if releasable:
+                self._plan[node] = releasable
+
+    def datasets_to_release(self, node: Node) -> list[str]:
+        """Return the datasets no longer needed after ``node`` has run.
+
+        Args:
+            node: The ``Node`` that has just completed.
+
+        Returns:
+            Names of the datasets that can be released.
+        """
+        to_release = []
+        for dataset in self._plan.get(node, ()):
+            if dataset in self._loads_left:
+                self._loads_left[dataset] -= node.inputs.count(dataset)
+                if self._loads_left[dataset] > 0:
+                    continue
+            to_release.append(dataset)
+        return to_release
+
+
+class _MemoryBudget:
+    """Keeps the data of the ``MemoryDataset``s of a sequential run within a
+    memory budget.
+
+    Nodes are run in a topological order which greedily picks the ready node
+    adding the least data to memory, using the dataset sizes of previous runs
+    or measured after each node. While the data in memory exceeds the budget,
+    the least recently used datasets are spilled to disk and read back the
+    next time they are loaded.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        catalog: CatalogProtocol | SharedMemoryCatalogProtocol,
+        budget: float,
+        spill_dir: str | os.PathLike | None,
+        known_sizes: dict[str, int],
+    ):
+        self._pipeline = pipeline
+        self._catalog = catalog
+        self._budget = budget
+        self._spill_dir = None if spill_dir is None else Path(spill_dir)
+        # The temporary spill directory created when no ``spill_dir`` is given
+        self._temporary_dir: tempfile.TemporaryDirectory | None = None
+        self._spill_count = itertools.count()
+        self._sizes = dict(known_sizes)
+        self._default_size = self._mean_size()
+        self._protected = pipeline.inputs() | pipeline.outputs()
+        self._loads_left = Counter(
+            chain.from_iterable(n.inputs for n in pipeline.nodes)
+        )
+        # Datasets whose data is in memory, least recently used first
+        self._in_memory: dict[str, int] = {}
+        self._unspillable: set[str] = set()
+        self._spilled: set[str] = set()
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    def execution_order(self) -> Iterator[Node]:
+        """Yield the nodes of the pipeline in a topological order, picking the
+        ready node adding the least data to memory next. Each node must have
+        run and been passed to ``update`` before the next one is requested.
+
+        The ready nodes are kept in a heap keyed on their memory delta and
+        toposort position. Measured sizes change the delta of queued nodes,
+        so a popped node whose delta has changed is pushed back with the new
+        one, and the last node left to load a dataset is pushed again as it
+        now frees that dataset.
+        """
+        nodes = self._pipeline.nodes
+        node_order = {n: i for i, n in enumerate(nodes)}
+        node_dependencies = self._pipeline.node_dependencies
+        pending_parents = {n: len(deps) for n, deps in node_dependencies.items()}
+        node_children = _build_node_children_index(node_dependencies)
+        # Nodes left to run loading each dataset
+        consumers_left: dict[str, set[Node]] = defaultdict(set)
+        for node in nodes:
+            for name in node.inputs:
+                consumers_left[name].add(node)
+
+        ready: set[Node] = set()
+        heap: list[tuple[float, int, Node]] = []
+
+        def push(node: Node) -> None:
+            ready.add(node)
+            entry = (self._memory_delta(node), node_order[node], node)
+            heapq.heappush(heap, entry)
+
+        for node in nodes:
+            if not pending_parents[node]:
+                push(node)
+        while heap:
+            delta, order, node = heapq.heappop(heap)
+            if node not in ready:
+                continue
+            current_delta = self._memory_delta(node)
+            if current_delta != delta:
+                heapq.heappush(heap, (current_delta, order, node))
+                continue
+            ready.remove(node)
+            yield node
+            for name in set(node.inputs):
+                consumers = consumers_left[name]
+                consumers.discard(node)
+                if len(consumers) == 1 and not ready.isdisjoint(consumers):
+                    push(next(iter(consumers)))
+            for child in node_children.get(node, ()):
+                pending_parents[child] -= 1
+                if not pending_parents[child]:
+                    push(child)
+
+    def update(self, node: Node) -> dict[str, int]:
+        """Track the data in memory once ``node`` has run and its unused
+        datasets have been released, and spill datasets if it exceeds the
+        budget.
+
+        Args:
+            node: The ``Node`` that has just completed.
+
+        Returns:
+            The sizes in bytes measured for the datasets of ``node``.
+        """
+        for name in node.inputs:
+            self._loads_left[name] -= 1
+
+        measured = {}
+        for name in dict.fromkeys(chain(node.inputs, node.outputs)):
+            dataset = self._catalog.get(name)
+            self._in_memory.pop(name, None)
+            if not isinstance(dataset, MemoryDataset) or not dataset._is_in_memory():
+                continue
+            if name in node.outputs or name not in self._sizes:
+                self._sizes[name] = measured[name] = dataset._estimate_size()
+            self._in_memory[name] = self._sizes[name]
+        if measured:
+            self._default_size = self._mean_size()
+
+        self._spill_least_recently_used()
+        return measured
+
+    def _mean_size(self) -> float:
+        return sum(self._sizes.values()) / len(self._sizes) if self._sizes else 0.0
+
+    def _memory_delta(self, node: Node) -> float:
+        """Estimate how much the data in memory grows when ``node`` runs."""
+        added = sum(
+            self._sizes.get(dataset, self._default_size) for dataset in node.outputs
+        )
+        freed = sum(
+            self._sizes.get(dataset, self._default_size)
+            for dataset in set(node.inputs)
+            if dataset not in self._protected
+            and self._loads_left[dataset] == node.inputs.count(dataset)
+        )
+        return added - freed
+
+    def _spill_least_recently_used(self) -> None:
+        in_memory_size = sum(self._in_memory.values())
+        for name in list(self._in_memory):
+            if in_memory_size <= self._budget:
+                break
+            if name in self._unspillable:
+                continue
+            dataset = self._catalog.get(name)
+            filepath = self._get_spill_filepath(name)
+            try:
+                dataset._spill(filepath)  # type: ignore[union-attr]
+            except DatasetError as exc:
+                self._unspillable.add(name)
+                self._logger.warning(
+                    "Unable to spill dataset '%s' to stay within the memory budget: %s",
+                    name,
+                    exc,
+                )
+                continue
+            in_memory_size -= self._in_memory.pop(name)
+            self._spilled.add(name)
+            self._logger.info("Spilled dataset '%s' to '%s'.", name, filepath)
+
+    def close(self) -> None:
+        """Remove the spill files of the run once it has completed or failed.
+        The pipeline inputs and outputs still spilled are read back into
+        memory, while the data of the other datasets is dropped.
+        """
+        for name in self._spilled:
+            dataset: MemoryDataset = self._catalog.get(name)  # type: ignore[assignment]
+            if dataset._spill_path is None:
+                continue
+            if name in self._protected:
+                dataset._unspill()
+            else:
+                dataset._release()
+        self._spilled.clear()
+        if self._temporary_dir is not None:
+            self._temporary_dir.cleanup()
+            self._temporary_dir = None
+
+    def _get_spill_filepath(self, dataset: str) -> Path:
+        if self._spill_dir is None:
+            self._temporary_dir = tempfile.TemporaryDirectory(prefix="kedro-spill-")
+            self._spill_dir = Path(self._temporary_dir.name)
+        elif self._temporary_dir is None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]", "_", dataset)
+        return self._spill_dir / f"{next(self._spill_count)}-{safe_name}.pkl"
+
+
+def _build_node_children_index(
+    node_dependencies: dict[Node, set[Node]],
+) -> dict[Node, list[Node]]:
+    """Invert a node dependencies mapping into a node to children index.
+
+    Args:
+        node_dependencies: Mapping of each node to the set of its parent nodes.
+
+    Returns:
+        Dictionary mapping each parent node to the list of its child nodes.
+        Nodes without children are not included.
+    """
+    node_children: dict[Node, list[Node]] = {}
+    for child, parents in node_dependencies.items():
+        for parent in parents:
+            node_children.setdefault(parent, []).append(child)
+    return node_children
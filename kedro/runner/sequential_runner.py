@@ -10,10 +10,14 @@ from typing import TYPE_CHECKING
 from kedro.runner.runner import AbstractRunner
 
 if TYPE_CHECKING:
+    import os
+
     from pluggy import PluginManager
 
     from kedro.io import CatalogProtocol
     from kedro.pipeline import Pipeline
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
 
 
 class SequentialRunner(AbstractRunner):
@@ -22,17 +26,65 @@ class SequentialRunner(AbstractRunner):
     topological sort of provided nodes.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         is_async: bool = False,
+        run_history: RunHistory | None = None,
+        memory_budget: float | str | None = None,
+        spill_dir: str | os.PathLike | None = None,
+        fuse_nodes: bool = False,
+        journal: RunJournal | None = None,
+        chunk_write_depth: int = 0,
+        write_behind_threads: int = 0,
     ):
         """Instantiates the runner class.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations and
+                dataset sizes to.
+            memory_budget: Optional amount of memory, e.g. ``"32G"``, for the
+                data of ``MemoryDataset``s. If provided, nodes are run in an
+                order keeping this data small, using the dataset sizes of
+                ``run_history`` and those measured during the run, and the
+                least recently used datasets are spilled to disk while the
+                budget is exceeded.
+            spill_dir: Directory to spill datasets to when ``memory_budget``
+                is exceeded. Defaults to a new temporary directory.
+            fuse_nodes: If True, chains of nodes linked only by in-memory
+                datasets loaded by a single node run as single tasks, passing
+                these datasets from node to node in memory. Defaults to False.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            chunk_write_depth: Maximum number of chunks yielded by a generator
+                node waiting to be saved by background writer threads while
+                the node computes the next chunks. If 0, each chunk is saved
+                before the next one is computed. Defaults to 0.
+            write_behind_threads: Number of background threads saving the
+                persistent outputs of nodes, so a node completes without
+                waiting for its outputs to be written. The nodes loading these
+                outputs in the meantime receive them from memory, and the run
+                ends once all of them are written. If 0, outputs are saved
+                before the node completes. Defaults to 0.
+
+        Raises:
+            ValueError: When the memory budget, the chunk write depth or the
+                number of write behind threads are invalid, or when outputs
+                are written behind during a journaled run.
         """
-        super().__init__(is_async=is_async)
+        super().__init__(
+            is_async=is_async,
+            run_history=run_history,
+            memory_budget=memory_budget,
+            spill_dir=spill_dir,
+            fuse_nodes=fuse_nodes,
+            journal=journal,
+            chunk_write_depth=chunk_write_depth,
+            write_behind_threads=write_behind_threads,
+        )
 
     def _get_executor(self, max_workers: int) -> None:
         return None
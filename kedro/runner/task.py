@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import itertools as it
 import multiprocessing
+import os
+import signal
+from collections import deque
 from collections.abc import Iterable, Iterator
 from concurrent.futures import (
     ALL_COMPLETED,
@@ -11,6 +15,8 @@ from concurrent.futures import (
     as_completed,
     wait,
 )
+from contextlib import suppress
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from more_itertools import interleave
@@ -21,12 +27,30 @@ from kedro.framework.hooks.manager import (
     _register_hooks_entry_points,
 )
 from kedro.framework.project import settings
+from kedro.io import DatasetError
 
 if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.queues import SimpleQueue
+
     from pluggy import PluginManager
 
     from kedro.io import CatalogProtocol
     from kedro.pipeline.node import Node
+    from kedro.runner.scheduling import _Prefetcher, _WriteBehind
+
+
+# The catalog, nodes and hook manager of a ``ParallelRunner`` worker process.
+# They are set up once per process by ``_init_worker``, so tasks submitted to
+# the process only need to carry the name of the node to run.
+_worker_context: dict[str, Any] = {}
+
+# Environment variables read by the native thread pools of numerical libraries
+_NATIVE_THREADS_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+)
 
 
 class TaskError(Exception):
@@ -47,6 +71,10 @@ class Task:
         hook_manager: PluginManager | None = None,
         run_id: str | None = None,
         parallel: bool = False,
+        fused_nodes: list[Node] | None = None,
+        chunk_write_depth: int = 0,
+        prefetcher: _Prefetcher | None = None,
+        pending_writes: _WriteBehind | None = None,
     ):
         self.node = node
         self.catalog = catalog
@@ -54,6 +82,20 @@ class Task:
         self.is_async = is_async
         self.run_id = run_id
         self.parallel = parallel
+        # Nodes run right after ``node``, each receiving the outputs of the
+        # previous one in memory rather than through the catalog
+        self.fused_nodes = fused_nodes or []
+        # Wall-clock duration in seconds of each node run by a fused task
+        self.node_durations: list[tuple[Node, float]] = []
+        # Maximum number of chunks yielded by a generator node waiting to be
+        # saved in the background. Chunks are saved synchronously if it is 0
+        self.chunk_write_depth = chunk_write_depth
+        # Inputs loaded ahead of time by the runner, taken instead of loading
+        # them from the catalog
+        self.prefetcher = prefetcher
+        # Writes persistent outputs in the background, and serves them in
+        # memory until they are written
+        self.pending_writes = pending_writes
 
     def execute(self) -> Node:
         if self.is_async and inspect.isgeneratorfunction(self.node.func):
@@ -77,6 +119,12 @@ class Task:
                 logging_config=LOGGING,  # type: ignore[arg-type]
             )
             self.hook_manager = hook_manager
+        if self.fused_nodes:
+            return self._run_fused_nodes(
+                self.catalog,
+                self.hook_manager,  # type: ignore[arg-type]
+                self.run_id,
+            )
         if self.is_async:
             node = self._run_node_async(
                 self.node,
@@ -97,6 +145,53 @@ class Task:
 
         return node
 
+    async def aexecute(self) -> Node:
+        """Run the node on the running event loop. ``async def`` node functions
+        are awaited directly and other functions run in a thread. Datasets are
+        loaded and saved concurrently, awaiting their ``aload`` and ``asave``
+        coroutine methods when they define them and using threads otherwise.
+
+        Returns:
+            The node of the task.
+        """
+        if not self.hook_manager:
+            raise TaskError(
+                "No hook_manager provided. This is only allowed when running a ``Task`` with ``ParallelRunner``."
+            )
+
+        node = await self._run_node_asyncio(
+            self.node, self.catalog, self.hook_manager, self.run_id
+        )
+
+        for name in node.confirms:
+            await asyncio.to_thread(self.catalog.confirm, name)
+
+        return node
+
+    @classmethod
+    def _from_worker_context(
+        cls, node_name: str, fused_node_names: Iterable[str] = ()
+    ) -> Task:
+        """Create the ``Task`` running a node of the pipeline in a worker
+        process set up by ``_init_worker``.
+
+        Args:
+            node_name: The name of the node to run.
+            fused_node_names: The names of the nodes fused after it, if any.
+
+        Returns:
+            A ``Task`` using the catalog and hook manager of the worker.
+        """
+        nodes = _worker_context["nodes"]
+        return cls(
+            node=nodes[node_name],
+            catalog=_worker_context["catalog"],
+            hook_manager=_worker_context["hook_manager"],
+            is_async=_worker_context["is_async"],
+            run_id=_worker_context["run_id"],
+            fused_nodes=[nodes[name] for name in fused_node_names],
+        )
+
     def __call__(self) -> Node:
         """Make the class instance callable by ProcessPoolExecutor."""
         return self.execute()
@@ -148,11 +243,7 @@ class Task:
         inputs = {}
 
         for name in node.inputs:
-            hook_manager.hook.before_dataset_loaded(dataset_name=name, node=node)
-            inputs[name] = catalog.load(name)
-            hook_manager.hook.after_dataset_loaded(
-                dataset_name=name, data=inputs[name], node=node
-            )
+            inputs[name] = self._load_input(name, node, catalog, hook_manager)
 
         is_async = False
 
@@ -166,6 +257,7 @@ class Task:
         )
 
         items: Iterable = outputs.items()
+        save = self._save_output
         # if all outputs are iterators, then the node is a generator node
         if all(isinstance(d, Iterator) for d in outputs.values()):
             # Python dictionaries are ordered, so we are sure
@@ -178,16 +270,116 @@ class Task:
             # with an interleaved iterator of the streams
             # [(a, chunk_a), (b, chunk_b), ...] until all outputs complete
             items = zip(it.cycle(keys), interleave(*streams))
+            if self.chunk_write_depth > 0:
+                self._save_chunks_in_background(items, node, catalog, hook_manager)
+                return node
+            save = self._synchronous_dataset_save
 
         for name, data in items:
-            hook_manager.hook.before_dataset_saved(
-                dataset_name=name, data=data, node=node
+            save(name, data, node, catalog, hook_manager)
+        return node
+
+    def _save_chunks_in_background(
+        self,
+        chunks: Iterable[tuple[str, Any]],
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> None:
+        """Save the chunks yielded by a generator node while the node computes
+        the next ones. Each output dataset has its own writer thread saving its
+        chunks, and running the dataset save hooks around them, in the order
+        they are yielded. At most ``chunk_write_depth`` chunks wait to be saved
+        at any time, so pulling the next chunk blocks once the writers fall
+        behind.
+
+        Raises:
+            Exception: The first error raised while saving a chunk. No more
+                chunks are pulled from the node once it is known.
+        """
+        writers: dict[str, ThreadPoolExecutor] = {}
+        pending: deque[Future] = deque()
+        try:
+            for name, data in chunks:
+                while pending and (
+                    len(pending) >= self.chunk_write_depth or pending[0].done()
+                ):
+                    pending.popleft().result()
+                if name not in writers:
+                    writers[name] = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix=f"kedro-chunks-{name}"
+                    )
+                pending.append(
+                    writers[name].submit(
+                        self._synchronous_dataset_save,
+                        name,
+                        data,
+                        node,
+                        catalog,
+                        hook_manager,
+                    )
+                )
+            for future in pending:
+                future.result()
+        finally:
+            for writer in writers.values():
+                writer.shutdown(wait=True, cancel_futures=True)
+
+    def _run_fused_nodes(
+        self,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+        run_id: str | None = None,
+    ) -> Node:
+        """Run ``node`` and the nodes fused after it one after the other. The
+        outputs of each node are handed to the next one in memory, without
+        going through the catalog, while the dataset and node hooks still run
+        for each node.
+
+        Returns:
+            The last node of the chain.
+        """
+        nodes = [self.node, *self.fused_nodes]
+        in_memory: dict[str, Any] = {}
+        self.node_durations = []
+        for node in nodes:
+            start_time = perf_counter()
+            inputs = {}
+            for name in node.inputs:
+                if name not in in_memory:
+                    inputs[name] = self._load_input(name, node, catalog, hook_manager)
+                    continue
+                hook_manager.hook.before_dataset_loaded(dataset_name=name, node=node)
+                inputs[name] = in_memory[name]
+                hook_manager.hook.after_dataset_loaded(
+                    dataset_name=name, data=inputs[name], node=node
+                )
+            in_memory.clear()
+
+            inputs.update(
+                self._collect_inputs_from_hook(
+                    node, catalog, inputs, False, hook_manager, run_id=run_id
+                )
             )
-            catalog.save(name, data)
-            hook_manager.hook.after_dataset_saved(
-                dataset_name=name, data=data, node=node
+            outputs = self._call_node_run(
+                node, catalog, inputs, False, hook_manager, run_id=run_id
             )
-        return node
+
+            for name, data in outputs.items():
+                if node is nodes[-1]:
+                    self._save_output(name, data, node, catalog, hook_manager)
+                    continue
+                hook_manager.hook.before_dataset_saved(
+                    dataset_name=name, data=data, node=node
+                )
+                in_memory[name] = data
+                hook_manager.hook.after_dataset_saved(
+                    dataset_name=name, data=data, node=node
+                )
+            for name in node.confirms:
+                catalog.confirm(name)
+            self.node_durations.append((node, perf_counter() - start_time))
+        return nodes[-1]
 
     def _run_node_async(
         self,
@@ -201,7 +393,7 @@ class Task:
 
             for name in node.inputs:
                 inputs[name] = pool.submit(
-                    self._synchronous_dataset_load, name, node, catalog, hook_manager
+                    self._load_input, name, node, catalog, hook_manager
                 )
 
             wait(inputs.values(), return_when=ALL_COMPLETED)
@@ -219,6 +411,8 @@ class Task:
 
             future_dataset_mapping = {}
             for name, data in outputs.items():
+                if self.pending_writes and self.pending_writes.save(name, data, node):
+                    continue
                 hook_manager.hook.before_dataset_saved(
                     dataset_name=name, data=data, node=node
                 )
@@ -235,6 +429,164 @@ class Task:
                 )
         return node
 
+    async def _run_node_asyncio(
+        self,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+        run_id: str | None = None,
+    ) -> Node:
+        loaded = await asyncio.gather(
+            *(
+                self._asyncio_dataset_load(name, node, catalog, hook_manager)
+                for name in node.inputs
+            )
+        )
+        inputs = dict(zip(node.inputs, loaded))
+        is_async = True
+
+        additional_inputs = self._collect_inputs_from_hook(
+            node, catalog, inputs, is_async, hook_manager, run_id=run_id
+        )
+        inputs.update(additional_inputs)
+
+        try:
+            if inspect.iscoroutinefunction(node.func):
+                outputs = await node.arun(inputs)
+            else:
+                outputs = await asyncio.to_thread(node.run, inputs)
+        except Exception as exc:
+            hook_manager.hook.on_node_error(
+                error=exc,
+                node=node,
+                catalog=catalog,
+                inputs=inputs,
+                is_async=is_async,
+                run_id=run_id,
+            )
+            raise exc
+        hook_manager.hook.after_node_run(
+            node=node,
+            catalog=catalog,
+            inputs=inputs,
+            outputs=outputs,
+            is_async=is_async,
+            run_id=run_id,
+        )
+
+        # Chunks of generator nodes are saved one after another, in order
+        if outputs and all(isinstance(d, Iterator) for d in outputs.values()):
+            keys = list(outputs.keys())
+            streams = list(outputs.values())
+            for name, data in zip(it.cycle(keys), interleave(*streams)):
+                await self._asyncio_dataset_save(
+                    name, data, node, catalog, hook_manager
+                )
+            return node
+
+        await asyncio.gather(
+            *(
+                self._asyncio_dataset_save(name, data, node, catalog, hook_manager)
+                for name, data in outputs.items()
+            )
+        )
+        return node
+
+    @staticmethod
+    async def _asyncio_dataset_load(
+        dataset_name: str,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> Any:
+        """Load a dataset on the event loop, running the Hooks around it."""
+        hook_manager.hook.before_dataset_loaded(dataset_name=dataset_name, node=node)
+        dataset = catalog.get(dataset_name)
+        aload = getattr(dataset, "aload", None)
+        if inspect.iscoroutinefunction(aload):
+            try:
+                data = await aload()
+            except DatasetError:
+                raise
+            except Exception as exc:
+                raise DatasetError(
+                    f"Failed while loading data from dataset {dataset!s}.\n{exc!s}"
+                ) from exc
+        else:
+            data = await asyncio.to_thread(catalog.load, dataset_name)
+        hook_manager.hook.after_dataset_loaded(
+            dataset_name=dataset_name, data=data, node=node
+        )
+        return data
+
+    @staticmethod
+    async def _asyncio_dataset_save(
+        dataset_name: str,
+        data: Any,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> None:
+        """Save a dataset on the event loop, running the Hooks around it."""
+        hook_manager.hook.before_dataset_saved(
+            dataset_name=dataset_name, data=data, node=node
+        )
+        dataset = catalog.get(dataset_name)
+        asave = getattr(dataset, "asave", None)
+        if inspect.iscoroutinefunction(asave):
+            if data is None:
+                raise DatasetError("Saving 'None' to a 'Dataset' is not allowed")
+            try:
+                await asave(data)
+            except DatasetError:
+                raise
+            except Exception as exc:
+                raise DatasetError(
+                    f"Failed while saving data to dataset {dataset!s}.\n{exc!s}"
+                ) from exc
+        else:
+            await asyncio.to_thread(catalog.save, dataset_name, data)
+        hook_manager.hook.after_dataset_saved(
+            dataset_name=dataset_name, data=data, node=node
+        )
+
+    def _load_input(
+        self,
+        dataset_name: str,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> Any:
+        """Load an input of a node, taking its data from the runner if it is
+        still being written behind or was prefetched for the node."""
+        if self.pending_writes:
+            pending, data = self.pending_writes.load(dataset_name)
+            if pending:
+                hook_manager.hook.before_dataset_loaded(
+                    dataset_name=dataset_name, node=node
+                )
+                hook_manager.hook.after_dataset_loaded(
+                    dataset_name=dataset_name, data=data, node=node
+                )
+                return data
+        prefetched = (
+            self.prefetcher.take(node, dataset_name) if self.prefetcher else None
+        )
+        if prefetched is None:
+            return self._synchronous_dataset_load(
+                dataset_name, node, catalog, hook_manager
+            )
+        hook_manager.hook.before_dataset_loaded(dataset_name=dataset_name, node=node)
+        try:
+            data = prefetched.result()
+        except Exception:
+            # Load the dataset again, so a failure is raised by the node's task
+            data = catalog.load(dataset_name)
+        hook_manager.hook.after_dataset_loaded(
+            dataset_name=dataset_name, data=data, node=node
+        )
+        return data
+
     @staticmethod
     def _synchronous_dataset_load(
         dataset_name: str,
@@ -251,6 +603,37 @@ class Task:
         )
         return return_ds
 
+    def _save_output(
+        self,
+        dataset_name: str,
+        data: Any,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> None:
+        """Save an output of a node, handing it over to the runner if it
+        writes the output behind."""
+        if self.pending_writes and self.pending_writes.save(dataset_name, data, node):
+            return
+        self._synchronous_dataset_save(dataset_name, data, node, catalog, hook_manager)
+
+    @staticmethod
+    def _synchronous_dataset_save(
+        dataset_name: str,
+        data: Any,
+        node: Node,
+        catalog: CatalogProtocol,
+        hook_manager: PluginManager,
+    ) -> None:
+        """Save a dataset, running the Hooks around it in the same thread."""
+        hook_manager.hook.before_dataset_saved(
+            dataset_name=dataset_name, data=data, node=node
+        )
+        catalog.save(dataset_name, data)
+        hook_manager.hook.after_dataset_saved(
+            dataset_name=dataset_name, data=data, node=node
+        )
+
     @staticmethod
     def _collect_inputs_from_hook(  # noqa: PLR0913
         node: Node,
@@ -316,3 +699,106 @@ class Task:
             run_id=run_id,
         )
         return outputs
+
+
+class _WorkerPids:
+    """The process ids of the worker processes of a pool, which each worker
+    reports from its initializer when it starts, so the runner can terminate
+    the workers of a failed run.
+    """
+
+    def __init__(self, context: BaseContext):
+        self._queue: SimpleQueue[int] = context.SimpleQueue()
+        self._pids: set[int] = set()
+
+    def report(self) -> None:
+        """Report the process id of the current worker process."""
+        self._queue.put(os.getpid())
+
+    def terminate(self) -> None:
+        """Terminate the worker processes which reported their process id."""
+        while not self._queue.empty():
+            self._pids.add(self._queue.get())
+        for pid in self._pids:
+            # The worker may have exited already
+            with suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+
+def _init_worker(  # noqa: PLR0913
+    catalog: CatalogProtocol,
+    nodes: dict[str, Node],
+    is_async: bool,
+    run_id: str | None = None,
+    native_threads: int = 0,
+    node_threads: dict[str, int] | None = None,
+    worker_pids: _WorkerPids | None = None,
+) -> None:
+    """Initializer of the ``ParallelRunner`` worker processes. It bootstraps
+    the project and creates the hook manager once per process, and keeps the
+    catalog and nodes of the run for the tasks executed by the process.
+
+    Args:
+        catalog: The catalog of the run.
+        nodes: The nodes of the pipeline, keyed by name.
+        is_async: Whether to load and save data asynchronously with threads.
+        run_id: The id of the run.
+        native_threads: Number of threads of the native thread pools of the
+            process, or 0 to leave them unlimited.
+        node_threads: Number of native threads of the nodes needing another
+            number than ``native_threads``, keyed by node name.
+        worker_pids: Optional ``_WorkerPids`` to report the process id of the
+            worker to.
+    """
+    from kedro.framework.project import LOGGING, PACKAGE_NAME
+
+    if worker_pids is not None:
+        worker_pids.report()
+    if native_threads:
+        _limit_native_threads(native_threads)
+    hook_manager = Task._run_node_synchronization(
+        package_name=PACKAGE_NAME,
+        logging_config=LOGGING,  # type: ignore[arg-type]
+    )
+    _worker_context.clear()
+    _worker_context.update(
+        catalog=catalog,
+        nodes=nodes,
+        hook_manager=hook_manager,
+        is_async=is_async,
+        run_id=run_id,
+        native_threads=native_threads,
+        node_threads=node_threads or {},
+        current_native_threads=native_threads,
+    )
+
+
+def _limit_native_threads(threads: int) -> None:
+    """Limit the threads of the native thread pools, such as OpenMP, MKL and
+    OpenBLAS, of the current process.
+
+    The environment variables only apply to the libraries loaded afterwards,
+    so the libraries already loaded are limited with ``threadpoolctl`` when it
+    is installed.
+    """
+    for variable in _NATIVE_THREADS_VARIABLES:
+        os.environ[variable] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    threadpool_limits(limits=threads)
+
+
+def _limit_task_native_threads(node_names: Iterable[str]) -> None:
+    """Limit the native threads of a worker process to the largest number
+    needed by the nodes of the task it is about to run.
+    """
+    default_threads = _worker_context.get("native_threads")
+    if not default_threads:
+        return
+    node_threads = _worker_context["node_threads"]
+    threads = max(node_threads.get(name, default_threads) for name in node_names)
+    if threads != _worker_context["current_native_threads"]:
+        _limit_native_threads(threads)
+        _worker_context["current_native_threads"] = threads
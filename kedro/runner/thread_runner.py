@@ -10,24 +10,40 @@ from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from kedro.runner.runner import AbstractRunner
+from kedro.runner.scheduling import _max_antichain_width
 
 if TYPE_CHECKING:
     from pluggy import PluginManager
 
     from kedro.io import CatalogProtocol
     from kedro.pipeline import Pipeline
+    from kedro.runner.run_history import RunHistory
+    from kedro.runner.run_journal import RunJournal
 
 
 class ThreadRunner(AbstractRunner):
     """``ThreadRunner`` is an ``AbstractRunner`` implementation. It can
     be used to run the ``Pipeline`` in parallel groups formed by toposort
     using threads.
+
+    Nodes linked by ``StreamingDataset``s are started together, so a node
+    consumes the chunks saved by its parent while the parent is running.
     """
 
-    def __init__(
+    _SUPPORTS_STREAMING = True
+
+    def __init__(  # noqa: PLR0913
         self,
         max_workers: int | None = None,
         is_async: bool = False,
+        run_history: RunHistory | None = None,
+        resource_limits: dict[str, float | str] | None = None,
+        fuse_nodes: bool = False,
+        journal: RunJournal | None = None,
+        chunk_write_depth: int = 0,
+        fail_fast: bool = False,
+        prefetch_memory: float | str | None = None,
+        write_behind_threads: int = 0,
     ):
         """
         Instantiates the runner.
@@ -35,10 +51,43 @@ class ThreadRunner(AbstractRunner):
         Args:
             max_workers: Number of worker processes to spawn. If not set,
                 calculated automatically based on the pipeline configuration
-                and CPU core count.
+                and CPU core count, and raised to the number of nodes linked
+                by streams which must run at the same time.
             is_async: If True, set to False, because `ThreadRunner`
                 doesn't support loading and saving the node inputs and
                 outputs asynchronously with threads. Defaults to False.
+            run_history: Optional ``RunHistory`` to record node durations to.
+                If provided, ready nodes on the longest remaining path,
+                weighted by their recorded durations, are submitted first.
+            resource_limits: Optional total amounts of machine resources, e.g.
+                ``{"cpu": 16, "mem": "64G"}``. A node is only submitted when the
+                resources it declares fit within these limits next to the
+                nodes already running.
+            fuse_nodes: If True, chains of nodes linked only by in-memory
+                datasets loaded by a single node run as single tasks, passing
+                these datasets from node to node in memory. Defaults to False.
+            journal: Optional ``RunJournal`` recording the completed nodes and
+                checkpointing the in-memory datasets they produce. If it holds
+                the completed nodes of a failed run, the run resumes from the
+                nodes which did not complete.
+            chunk_write_depth: Maximum number of chunks yielded by a generator
+                node waiting to be saved by background writer threads while
+                the node computes the next chunks. If 0, each chunk is saved
+                before the next one is computed. Defaults to 0.
+            fail_fast: If True, as soon as a node fails, cancel the nodes
+                waiting to start and raise without waiting for the others to
+                complete, which keep running in the background. Defaults to
+                False.
+            prefetch_memory: Optional amount of memory, e.g. ``"2G"``, for the
+                persistent inputs loaded in the background for the nodes one
+                dependency away from ready, so they are in memory when the
+                nodes start. Inputs are not prefetched if it is not set.
+            write_behind_threads: Number of background threads saving the
+                persistent outputs of nodes, so a node completes without
+                waiting for its outputs to be written. The nodes loading these
+                outputs in the meantime receive them from memory, and the run
+                ends once all of them are written. If 0, outputs are saved
+                before the node completes. Defaults to 0.
         Raises:
             ValueError: bad parameters passed
         """
@@ -48,26 +97,40 @@ class ThreadRunner(AbstractRunner):
                 "node inputs and outputs asynchronously with threads. "
                 "Setting 'is_async' to False."
             )
-        super().__init__(is_async=False)
+        super().__init__(
+            is_async=False,
+            run_history=run_history,
+            resource_limits=resource_limits,
+            fuse_nodes=fuse_nodes,
+            journal=journal,
+            chunk_write_depth=chunk_write_depth,
+            fail_fast=fail_fast,
+            prefetch_memory=prefetch_memory,
+            write_behind_threads=write_behind_threads,
+        )
 
         self._max_workers = self._validate_max_workers(max_workers)
+        self._max_workers_given = max_workers is not None
 
     def _get_required_workers_count(self, pipeline: Pipeline) -> int:
         """
         Calculate the max number of processes required for the pipeline
         """
-        # Number of nodes is a safe upper-bound estimate.
-        # It's also safe to reduce it by the number of layers minus one,
-        # because each layer means some nodes depend on other nodes
-        # and they can not run in parallel.
-        # It might be not a perfect solution, but good enough and simple.
-        required_threads = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
-
-        return (
+        # At most the nodes of the largest set of mutually independent nodes,
+        # the maximum antichain of the pipeline, can run at the same time
+        required_threads = max(_max_antichain_width(pipeline), 1)
+        max_threads = (
             min(required_threads, self._max_workers)
             if self._max_workers
             else required_threads
         )
+        # The nodes linked by streams all need a thread at the same time
+        streaming_threads = max(
+            (len(group) + 1 for group in self._streaming_groups.values()), default=0
+        )
+        if self._max_workers_given:
+            streaming_threads = min(streaming_threads, self._max_workers)
+        return max(max_threads, streaming_threads)
 
     def _get_executor(self, max_workers: int) -> Executor:
         return ThreadPoolExecutor(max_workers=max_workers)
@@ -0,0 +1,130 @@
+# Write the benchmarking functions here.
+# See "Writing benchmarks" in the asv docs for more information.
+
+from kedro.pipeline import Pipeline
+from kedro_benchmarks.helpers import create_chain_nodes, create_layered_nodes
+
+
+class PipelineConstructionSuite:
+    """Track building, sorting and querying the dependency graph of large
+    pipelines."""
+
+    params = (1_000, 10_000, 100_000)
+    param_names = ("nodes",)
+    timeout = 300
+
+    def setup(self, size):
+        self.nodes = create_layered_nodes(size)
+        # Trigger the lazily computed node attributes outside the measurement
+        Pipeline(self.nodes)
+
+    def time_construction(self, size):
+        Pipeline(self.nodes)
+
+    def time_toposort(self, size):
+        Pipeline(self.nodes).grouped_nodes
+
+    def time_node_dependencies(self, size):
+        Pipeline(self.nodes).node_dependencies
+
+    def mem_pipeline(self, size):
+        return Pipeline(self.nodes)
+
+    def peakmem_toposort(self, size):
+        Pipeline(self.nodes).grouped_nodes
+
+
+class PipelineSlicingSuite:
+    """Track slicing the same 20k-node pipeline many times, as done to split a
+    pipeline into deployment jobs."""
+
+    timeout = 300
+
+    def setup(self):
+        self.pipeline = Pipeline(create_layered_nodes(20_000))
+
+    def time_from_nodes(self):
+        for i in range(0, 200, 10):
+            self.pipeline.from_nodes(f"node_{i}_0")
+
+    def time_to_nodes(self):
+        for i in range(0, 200, 10):
+            self.pipeline.to_nodes(f"node_{i}_0")
+
+    def time_filter(self):
+        for i in range(0, 190, 10):
+            self.pipeline.filter(
+                from_nodes=[f"node_{i}_0"], to_nodes=[f"node_{i + 10}_0"]
+            )
+
+
+class PipelineChainSlicingSuite:
+    """Track the time and peak memory of slicing a 50k-node chain, the
+    deepest pipeline of its size, as done when resuming a failed run."""
+
+    timeout = 300
+
+    def setup(self):
+        self.pipeline = Pipeline(create_chain_nodes(50_000))
+        self.pipeline.grouped_nodes
+
+    def time_from_nodes(self):
+        self.pipeline.from_nodes("node_25000")
+
+    def time_to_nodes(self):
+        self.pipeline.to_nodes("node_25000")
+
+    def peakmem_from_nodes(self):
+        self.pipeline.from_nodes("node_25000")
+
+    def peakmem_to_nodes(self):
+        self.pipeline.to_nodes("node_25000")
+
+
+class PipelineCompositionSuite:
+    """Track combining many registered pipelines, as ``KedroSession.run`` does
+    when running several of them."""
+
+    params = (10, 100)
+    param_names = ("pipelines",)
+    timeout = 300
+
+    def setup(self, count):
+        nodes = create_layered_nodes(20_000)
+        size = len(nodes) // count
+        self.pipelines = [
+            Pipeline(nodes[i : i + size]) for i in range(0, len(nodes), size)
+        ]
+
+    def time_sum(self, count):
+        sum(self.pipelines)
+
+    def time_add_in_loop(self, count):
+        combined = Pipeline([])
+        for pipeline in self.pipelines:
+            combined += pipeline
+
+
+class NodeSuite:
+    """Track creating, tagging and namespacing many nodes."""
+
+    timeout = 300
+
+    def setup(self):
+        self.nodes = create_layered_nodes(20_000)
+        self.pipeline = Pipeline(self.nodes)
+
+    def time_create_nodes(self):
+        create_layered_nodes(20_000)
+
+    def time_tag(self):
+        self.pipeline.tag("benchmark")
+
+    def time_namespace(self):
+        Pipeline(self.pipeline, namespace="benchmark")
+
+    def time_hash_nodes(self):
+        set(self.nodes)
+
+    def mem_nodes(self):
+        return create_layered_nodes(20_000)
@@ -2,14 +2,16 @@
 # See "Writing benchmarks" in the asv docs for more information.
 
 import importlib
+import logging
 import time
 from pathlib import Path
 
 import yaml
 
-from kedro.io import DataCatalog
+from kedro.io import DataCatalog, MemoryDataset
 from kedro.io.data_catalog import SharedMemoryDataCatalog
 from kedro.pipeline import node, pipeline
+from kedro_benchmarks.helpers import create_layered_nodes
 
 
 # Simulate an I/O-bound task
@@ -90,6 +92,12 @@ def create_compute_bound_pipeline():
     return dummy_pipeline
 
 
+def create_trivial_pipeline(layers=100, width=100):
+    """Layered pipeline of ``layers * width`` nodes doing no real work, where each
+    node consumes the outputs of two nodes from the previous layer."""
+    return pipeline(create_layered_nodes(layers * width, width))
+
+
 def _get_catalog(runner_name):
     """Instantiate the correct catalog based on the runner type."""
     if runner_name == "ParallelRunner":
@@ -158,3 +166,29 @@ class RunnerTimeSuite:
         runner_module = importlib.import_module("kedro.runner")
         runner_obj = getattr(runner_module, runner)()
         runner_obj.run(test_pipeline, catalog=catalog)
+
+
+class RunnerSchedulingSuite:
+    """Track the scheduling overhead of the runners on 10k trivial nodes."""
+
+    params = (
+        "SequentialRunner",
+        "ThreadRunner",
+        "ParallelRunner",
+    )
+    param_names = ("runner",)
+    timeout = 300
+
+    def setup(self, *args, **kwargs):
+        # Per-node log records would otherwise dominate the measurement
+        logging.getLogger("kedro").setLevel(logging.WARNING)
+        self.pipeline = create_trivial_pipeline()
+
+    def time_scheduling_overhead(self, runner):
+        catalog_class = (
+            SharedMemoryDataCatalog if runner == "ParallelRunner" else DataCatalog
+        )
+        catalog = catalog_class({"seed": MemoryDataset(1)})
+        runner_module = importlib.import_module("kedro.runner")
+        runner_obj = getattr(runner_module, runner)()
+        runner_obj.run(self.pipeline, catalog=catalog)
@@ -0,0 +1,35 @@
+"""Pipelines of trivial nodes shared by the benchmark suites."""
+
+from kedro.pipeline import node
+
+
+def trivial_task(*inputs):
+    return 1
+
+
+def create_layered_nodes(size, width=100):
+    """``size`` nodes in layers of ``width``, where each node consumes the
+    outputs of two nodes from the previous layer."""
+    nodes = [
+        node(trivial_task, "seed", f"out_0_{j}", name=f"node_0_{j}")
+        for j in range(width)
+    ]
+    for i in range(1, size // width):
+        nodes.extend(
+            node(
+                trivial_task,
+                [f"out_{i - 1}_{j}", f"out_{i - 1}_{(j + 1) % width}"],
+                f"out_{i}_{j}",
+                name=f"node_{i}_{j}",
+            )
+            for j in range(width)
+        )
+    return nodes
+
+
+def create_chain_nodes(size):
+    """``size`` nodes where each node consumes the output of the previous one."""
+    return [
+        node(trivial_task, f"out_{i - 1}", f"out_{i}", name=f"node_{i}")
+        for i in range(size)
+    ]
@@ -28,7 +28,9 @@ from kedro.framework.cli.utils import (
     validate_conf_source,
 )
 from kedro.framework.session import KedroSession
-from kedro.runner import ParallelRunner, SequentialRunner
+from kedro.pipeline import node, pipeline
+from kedro.runner import ParallelRunner, RunHistory, SequentialRunner
+from tests.test_utils import identity
 
 
 @click.group(name="stub_cli")
@@ -65,6 +67,13 @@ def requirements_file(tmp_path):
     yield reqs_file
 
 
+class BasicRunner(SequentialRunner):
+    """A custom runner which only takes the arguments of early Kedro runners."""
+
+    def __init__(self, is_async=False):
+        super().__init__(is_async=is_async)
+
+
 @fixture
 def fake_session(mocker):
     mock_session_create = mocker.patch.object(KedroSession, "create")
@@ -580,6 +589,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -622,6 +633,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -664,6 +677,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -697,6 +712,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=["fake_namespace"],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -723,6 +740,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -738,6 +757,149 @@ class TestRunCommand:
         assert isinstance(runner, SequentialRunner)
         assert runner._is_async
 
+    def test_run_incremental(
+        self, fake_project_cli, fake_metadata, fake_session, mocker
+    ):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--incremental"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert fake_session.run.call_args_list[0][1]["incremental"]
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert (
+            runner._run_history.filepath
+            == fake_metadata.project_path / ".kedro" / "run_history.json"
+        )
+
+    @pytest.mark.parametrize(
+        "option",
+        [["--incremental"], ["--journal"], ["--resume", "failed"]],
+    )
+    def test_run_option_unsupported_by_runner(
+        self, fake_project_cli, fake_metadata, fake_session, option
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", f"--runner={__name__}.BasicRunner", *option],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert (
+            f"Option '{option[0]}' cannot be used with 'BasicRunner'" in result.output
+        )
+        fake_session.run.assert_not_called()
+
+    def test_run_journal(self, fake_project_cli, fake_metadata, fake_session, mocker):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        fake_session.session_id = "2025-01-01T00.00.00.000Z"
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--journal"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert runner._journal.path == (
+            fake_metadata.project_path / ".kedro" / "journal" / fake_session.session_id
+        )
+
+    def test_run_resume(self, fake_project_cli, fake_metadata, fake_session, mocker):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        journal_path = fake_metadata.project_path / ".kedro" / "journal" / "failed"
+        journal_path.mkdir(parents=True)
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--resume", "failed"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert runner._journal.path == journal_path
+
+    def test_run_resume_missing_journal(
+        self, fake_project_cli, fake_metadata, fake_session, mocker
+    ):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--resume", "unknown"], obj=fake_metadata
+        )
+        assert result.exit_code
+        assert "No run journal found for session 'unknown'" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_cache_plan(
+        self, fake_project_cli, fake_metadata, fake_session, mocker
+    ):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--cache-plan"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        plan_cache = fake_session.run.call_args_list[0][1]["plan_cache"]
+        assert plan_cache.directory == (fake_metadata.project_path / ".kedro" / "plans")
+
+    def test_run_plan(self, fake_project_cli, fake_metadata, fake_session, mocker):
+        mocker.patch(
+            "kedro.framework.cli.project.find_kedro_project",
+            return_value=fake_metadata.project_path,
+        )
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            {
+                "__default__": pipeline(
+                    [
+                        node(identity, "a", "b", name="first"),
+                        node(identity, "a", "c", name="second"),
+                        node(identity, "c", "d", name="third", tags="tag1"),
+                    ]
+                )
+            },
+        )
+        run_history = RunHistory(
+            fake_metadata.project_path / ".kedro" / "run_history.json"
+        )
+        run_history.record_node_duration("first", 1.0)
+        run_history.record_node_duration("second", 2.0)
+        run_history.save()
+
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--plan"], obj=fake_metadata
+        )
+        assert not result.exit_code, result.output
+        assert "Predicted schedule of 3 nodes, 2 with a recorded duration" in (
+            result.output
+        )
+        assert "       1       4.50s         100%" in result.output
+        assert "       2       3.50s          64%" in result.output
+        assert "Critical path (3.50s): second -> third" in result.output
+        fake_session.run.assert_not_called()
+
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--plan", "--tags", "tag1"], obj=fake_metadata
+        )
+        assert "Predicted schedule of 1 nodes" in result.output
+
+    def test_run_plan_missing_pipeline(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--plan", "-p", "unknown"], obj=fake_metadata
+        )
+        assert result.exit_code
+        assert "Failed to find the pipeline named 'unknown'" in result.output
+
     @mark.parametrize("config_flag", ["--config", "-c"])
     def test_run_with_config(
         self,
@@ -765,6 +927,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
     def test_run_multiple_pipelines(
@@ -886,6 +1050,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
         mock_session_create.assert_called_once_with(
             env=mocker.ANY, conf_source=None, runtime_params=expected
@@ -1002,6 +1168,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
     def test_fail_split_load_versions(self, fake_project_cli, fake_metadata):
@@ -1066,6 +1234,8 @@ class TestRunCommand:
             pipeline_names=None,
             namespaces=[],
             only_missing_outputs=False,
+            incremental=False,
+            plan_cache=None,
         )
 
     def test_run_with_alternative_conf_source(self, fake_project_cli, fake_metadata):
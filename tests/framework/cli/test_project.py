@@ -3,6 +3,8 @@ import sys
 import pytest
 from click.testing import CliRunner
 
+from kedro.framework.session import KedroSession
+
 
 @pytest.fixture(autouse=True)
 def call_mock(mocker):
@@ -134,3 +136,24 @@ class TestPackageCommand:
                 ),
             ]
         )
+
+
+@pytest.mark.usefixtures("chdir_to_dummy_project")
+class TestWorkerCommand:
+    def test_happy_path(self, fake_project_cli, fake_metadata, mocker):
+        run_worker = mocker.patch("kedro.framework.cli.project.run_worker")
+        session_create = mocker.patch.object(KedroSession, "create")
+        session = session_create.return_value.__enter__.return_value
+
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["worker", "--connect", "scheduler:8765", "--env", "prod"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code, result.stdout
+        session_create.assert_called_once_with(env="prod", conf_source=None)
+        run_worker.assert_called_once_with(
+            session.load_context.return_value.catalog,
+            session._hook_manager,
+            address="scheduler:8765",
+        )
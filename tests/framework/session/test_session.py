@@ -25,8 +25,9 @@ from kedro.framework.project import (
     _ProjectSettings,
 )
 from kedro.framework.session import KedroSession
-from kedro.framework.session.session import KedroSessionError
+from kedro.framework.session.session import KedroSessionError, _combine_pipelines
 from kedro.framework.session.store import BaseSessionStore
+from kedro.pipeline import PlanCache, node, pipeline
 from kedro.utils import _has_rich_handler
 
 _FAKE_PROJECT_NAME = "fake_project"
@@ -655,6 +656,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_runner.__name__,
             "only_missing_outputs": False,
+            "incremental": False,
         }
 
         mock_hook.before_pipeline_run.assert_called_once_with(
@@ -666,6 +668,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=False,
+            incremental=False,
         )
         mock_hook.after_pipeline_run.assert_called_once_with(
             run_params=record_data,
@@ -771,6 +774,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_thread_runner.__name__,
             "only_missing_outputs": False,
+            "incremental": False,
         }
         mock_catalog = mock_context._get_catalog.return_value
         mock_pipeline = filter_mock.filter().filter()
@@ -784,6 +788,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=False,
+            incremental=False,
         )
         mock_hook.after_pipeline_run.assert_called_once_with(
             run_params=record_data,
@@ -848,6 +853,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_runner.__name__,
             "only_missing_outputs": False,
+            "incremental": False,
         }
 
         mock_hook.before_pipeline_run.assert_called_once_with(
@@ -861,6 +867,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=False,
+            incremental=False,
         )
         mock_hook.after_pipeline_run.assert_called_once_with(
             run_params=record_data,
@@ -934,6 +941,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_runner.__name__,
             "only_missing_outputs": False,
+            "incremental": False,
         }
 
         mock_hook.on_pipeline_error.assert_called_once_with(
@@ -1009,6 +1017,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": broken_runner.__name__,
             "only_missing_outputs": False,
+            "incremental": False,
         }
 
         mock_hook.on_pipeline_error.assert_called_once_with(
@@ -1029,6 +1038,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=False,
+            incremental=False,
         )
 
         record_data["runner"] = "MockRunner"
@@ -1104,6 +1114,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=True,
+            incremental=False,
         )
 
         record_data = {
@@ -1123,6 +1134,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_runner.__name__,
             "only_missing_outputs": True,
+            "incremental": False,
         }
 
         mock_hook.before_pipeline_run.assert_called_once_with(
@@ -1165,6 +1177,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=False,
+            incremental=False,
         )
 
     @pytest.mark.usefixtures("mock_settings_context_class")
@@ -1203,6 +1216,7 @@ class TestKedroSession:
             session._hook_manager,
             run_id=fake_session_id,
             only_missing_outputs=True,
+            incremental=False,
         )
 
         record_data = {
@@ -1222,6 +1236,7 @@ class TestKedroSession:
             "namespaces": None,
             "runner": mock_runner.__name__,
             "only_missing_outputs": True,
+            "incremental": False,
         }
 
         mock_hook.before_pipeline_run.assert_called_once_with(
@@ -1260,3 +1275,38 @@ def test_no_DictConfig_in_store(
     assert not any(
         OmegaConf.is_config(value) for value in get_all_values(session._store)
     )
+
+
+def _identity(arg):
+    return arg
+
+
+class TestCombinePipelines:
+    @pytest.fixture
+    def registered(self, mocker):
+        registered = {
+            "first": pipeline([node(_identity, "a", "b", name="first")]),
+            "second": pipeline([node(_identity, "b", "c", name="second")]),
+        }
+        mocker.patch("kedro.framework.session.session.pipelines", registered)
+        return registered
+
+    def test_combine(self, registered):
+        combined = _combine_pipelines(["first", "second"])
+
+        assert combined.nodes == (registered["first"] + registered["second"]).nodes
+
+    def test_combine_with_plan_cache(self, registered, tmp_path, mocker):
+        plan_cache = PlanCache(tmp_path)
+        combine_spy = mocker.spy(plan_cache, "combine")
+
+        for _ in range(2):
+            combined = _combine_pipelines(["first", "second"], plan_cache)
+            assert [n.name for n in combined.nodes] == ["first", "second"]
+
+        assert combine_spy.call_count == 2
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_missing_pipeline(self, registered):
+        with pytest.raises(ValueError, match="Failed to find the pipeline named 'x'"):
+            _combine_pipelines(["first", "x"])
@@ -9,6 +9,7 @@ from kedro_datasets.pandas import CSVDataset
 from kedro.io import DatasetError, MemoryDataset
 from kedro.io.memory_dataset import (
     _copy_with_mode,
+    _estimate_size,
     _infer_copy_mode,
     _is_memory_dataset,
 )
@@ -244,3 +245,77 @@ def test_infer_mode_assign():
 )
 def test_is_memory_dataset(ds_or_type, expected_result):
     assert _is_memory_dataset(ds_or_type) == expected_result
+
+
+class TestSpill:
+    def test_spill_and_reload(self, tmp_path):
+        dataset = MemoryDataset(data={"a": [1, 2, 3]})
+        filepath = tmp_path / "spilled.pkl"
+        dataset._spill(filepath)
+
+        assert filepath.is_file()
+        assert not dataset._is_in_memory()
+        assert dataset.exists()
+        assert dataset.load() == {"a": [1, 2, 3]}
+        assert dataset._is_in_memory()
+        assert not filepath.exists()
+
+    def test_release_removes_spilled_data(self, tmp_path):
+        dataset = MemoryDataset(data="data")
+        filepath = tmp_path / "spilled.pkl"
+        dataset._spill(filepath)
+        dataset.release()
+
+        assert not filepath.exists()
+        assert not dataset.exists()
+
+    def test_save_replaces_spilled_data(self, tmp_path):
+        dataset = MemoryDataset(data="old")
+        filepath = tmp_path / "spilled.pkl"
+        dataset._spill(filepath)
+        dataset.save("new")
+
+        assert not filepath.exists()
+        assert dataset.load() == "new"
+
+    def test_spill_unpicklable_data(self, tmp_path):
+        dataset = MemoryDataset(data=lambda: None, copy_mode="assign")
+        filepath = tmp_path / "spilled.pkl"
+        with pytest.raises(DatasetError, match="Unable to spill data of type"):
+            dataset._spill(filepath)
+
+        assert dataset._is_in_memory()
+        assert not filepath.exists()
+
+
+def test_estimate_size():
+    array = np.zeros(1000)
+    df = pd.DataFrame({"col1": ["a", "b"], "col2": [1, 2]})
+    assert _estimate_size(array) == array.nbytes
+    assert _estimate_size(df) == df.memory_usage(deep=True).sum()
+    assert _estimate_size(df["col1"]) == df["col1"].memory_usage(deep=True)
+    assert _estimate_size([array, array.copy()]) > 2 * array.nbytes
+    assert _estimate_size([array, array]) < 2 * array.nbytes
+    assert MemoryDataset()._estimate_size() == 0
+
+
+def test_estimate_size_memory_usage():
+    class Frame:
+        def memory_usage(self, deep=False):
+            return 123 if deep else 1
+
+    class Process:
+        def memory_usage(self):
+            return 123
+
+    assert _estimate_size(Frame()) == 123
+    assert _estimate_size(Process()) == sys.getsizeof(Process())
+
+
+def test_estimate_size_self_referencing():
+    data = [1, 2]
+    data.append(data)
+    mapping = {"a": 1}
+    mapping["self"] = mapping
+    assert _estimate_size(data) > 0
+    assert _estimate_size(mapping) > 0
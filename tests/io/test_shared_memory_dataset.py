@@ -1,3 +1,7 @@
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
 import pytest
 
 from kedro.io import DatasetError, SharedMemoryDataset
@@ -90,3 +94,73 @@ class TestSharedMemoryDataset:
         """Check that exists returns False when no manager is set"""
         dataset = SharedMemoryDataset(manager=None)
         assert not dataset.exists()
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Shared memory blocks are not used on Windows"
+)
+class TestSharedMemoryBlocks:
+    @pytest.fixture(autouse=True)
+    def always_use_shared_memory(self, mocker, shared_memory_dataset):
+        mocker.patch("kedro.io.shared_memory_dataset._MIN_SHARED_MEMORY_BYTES", 0)
+        yield
+        shared_memory_dataset.release()
+
+    def _block_name(self, dataset):
+        return dataset.shared_memory_dataset.load().block_name
+
+    @pytest.mark.parametrize(
+        "input_data", ["dummy_dataframe", "dummy_numpy_array"], indirect=True
+    )
+    def test_save_and_load(self, shared_memory_dataset, input_data):
+        shared_memory_dataset.save(input_data)
+        assert self._block_name(shared_memory_dataset)
+        assert _check_equals(shared_memory_dataset.load(), input_data)
+
+    def test_writes_stay_private(self, shared_memory_dataset):
+        shared_memory_dataset.save(np.zeros(10))
+        loaded = shared_memory_dataset.load()
+        loaded[0] = 1
+
+        assert shared_memory_dataset.load()[0] == 0
+
+    def test_small_data_not_in_shared_memory(self, shared_memory_dataset, mocker):
+        mocker.patch("kedro.io.shared_memory_dataset._MIN_SHARED_MEMORY_BYTES", 1024)
+        shared_memory_dataset.save(np.zeros(10))
+
+        assert self._block_name(shared_memory_dataset) is None
+        assert _check_equals(shared_memory_dataset.load(), np.zeros(10))
+
+    def test_data_without_buffers(self, shared_memory_dataset):
+        shared_memory_dataset.save({"a": [1, 2]})
+
+        assert self._block_name(shared_memory_dataset) is None
+        assert shared_memory_dataset.load() == {"a": [1, 2]}
+
+    def test_release_frees_block(self, shared_memory_dataset):
+        shared_memory_dataset.save(np.zeros(10))
+        block_name = self._block_name(shared_memory_dataset)
+        shared_memory_dataset.release()
+
+        assert not shared_memory_dataset.exists()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
+
+    def test_save_frees_previous_block(self, shared_memory_dataset):
+        shared_memory_dataset.save(np.zeros(10))
+        block_name = self._block_name(shared_memory_dataset)
+        shared_memory_dataset.save(np.ones(10))
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
+        assert _check_equals(shared_memory_dataset.load(), np.ones(10))
+
+    def test_move_out_of_shared_memory(self, shared_memory_dataset):
+        shared_memory_dataset.save(np.zeros(10))
+        block_name = self._block_name(shared_memory_dataset)
+        shared_memory_dataset._move_out_of_shared_memory()
+
+        assert self._block_name(shared_memory_dataset) is None
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
+        assert _check_equals(shared_memory_dataset.load(), np.zeros(10))
@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from kedro.io import DatasetError, StreamingDataset
+
+
+@pytest.fixture
+def streaming_dataset():
+    return StreamingDataset(max_chunks=2)
+
+
+class TestStreamingDataset:
+    def test_ephemeral_attribute(self, streaming_dataset):
+        assert streaming_dataset._EPHEMERAL is True
+
+    def test_invalid_max_chunks(self):
+        with pytest.raises(DatasetError, match="'max_chunks' should be positive"):
+            StreamingDataset(max_chunks=0)
+
+    def test_load_chunks_until_closed(self, streaming_dataset):
+        streaming_dataset.save(1)
+        streaming_dataset.save(2)
+        streaming_dataset.close()
+        assert list(streaming_dataset.load()) == [1, 2]
+
+    def test_save_blocks_while_full(self, streaming_dataset):
+        def produce():
+            for chunk in range(10):
+                streaming_dataset.save(chunk)
+                waiting.append(len(streaming_dataset._chunks))
+            streaming_dataset.close()
+
+        waiting: list[int] = []
+        producer = threading.Thread(target=produce)
+        producer.start()
+        assert list(streaming_dataset.load()) == list(range(10))
+        producer.join()
+        assert max(waiting) <= 2
+
+    def test_abort(self, streaming_dataset):
+        streaming_dataset.save(1)
+        streaming_dataset.abort("failure")
+
+        with pytest.raises(DatasetError, match="Stream aborted: failure"):
+            next(streaming_dataset.load())
+        with pytest.raises(DatasetError, match="Stream aborted: failure"):
+            streaming_dataset.save(2)
+
+    def test_save_after_close(self, streaming_dataset):
+        streaming_dataset.close()
+        with pytest.raises(DatasetError, match="Cannot save to a closed stream"):
+            streaming_dataset.save(1)
+
+    def test_release_discards_chunks(self, streaming_dataset):
+        streaming_dataset.save(1)
+        streaming_dataset.save(2)
+        streaming_dataset.release()
+        # Saving does not block once the consumer is gone
+        streaming_dataset.save(3)
+        streaming_dataset.close()
+        assert list(streaming_dataset.load()) == []
+
+    def test_reset(self, streaming_dataset):
+        streaming_dataset.save(1)
+        streaming_dataset.abort("failure")
+        streaming_dataset.reset()
+        assert not streaming_dataset.exists()
+
+        streaming_dataset.save(2)
+        assert streaming_dataset.exists()
+        streaming_dataset.close()
+        assert list(streaming_dataset.load()) == [2]
+
+    def test_str_representation(self, streaming_dataset):
+        assert "max_chunks=2" in str(streaming_dataset)
@@ -1,3 +1,4 @@
+import pickle
 import re
 from collections.abc import Callable
 from functools import partial, update_wrapper, wraps
@@ -5,6 +6,7 @@ from functools import partial, update_wrapper, wraps
 import pytest
 
 from kedro.pipeline import node
+from kedro.pipeline.node import Node
 from kedro.pipeline.preview_contract import (
     CustomPreview,
     ImagePreview,
@@ -214,6 +216,14 @@ class TestNodeComparisons:
         )
         assert first != second
 
+    def test_pickled_node_equals(self):
+        original = node(biconcat, ["input1", "input2"], "output1", name="a_node")
+        loaded = pickle.loads(pickle.dumps(original))  # noqa: S301
+        assert loaded == original
+        assert hash(loaded) == hash(original)
+        # The hash is computed again by each process loading the node
+        assert "_hash" not in original.__getstate__()
+
 
 def bad_input_type_node():
     return lambda x: None, ("A", "D"), "B"
@@ -389,6 +399,105 @@ class TestTag:
         )
         with pytest.raises(ValueError, match=re.escape(pattern)):
             node(identity, ["in"], ["out"], tags=bad_tag)
+        with pytest.raises(ValueError, match=re.escape(pattern)):
+            node(identity, ["in"], ["out"]).tag(bad_tag)
+
+
+class TestCompactNode:
+    def test_no_instance_dict(self):
+        assert not hasattr(node(identity, "input1", "output1"), "__dict__")
+
+    def test_dataset_names_interned(self):
+        suffix = "1"
+        first = node(identity, "input" + suffix, "output" + suffix)
+        second = node(identity, "output" + suffix, "final" + suffix)
+        assert first.outputs[0] is second.inputs[0]
+
+    @pytest.mark.parametrize(
+        "inputs,outputs",
+        [
+            ("input1", "output1"),
+            (["input1"], ["output1"]),
+            ({"input1": "input1"}, {"a": "output1"}),
+        ],
+    )
+    def test_dataset_names_not_copied(self, inputs, outputs):
+        a_node = node(identity, inputs, outputs)
+        assert a_node.inputs is a_node.inputs == ["input1"]
+        assert a_node.outputs is a_node.outputs == ["output1"]
+
+    def test_tag_skips_validation(self, mocker):
+        original = node(identity, "input1", "output1", name="a_node")
+        validate_spy = mocker.spy(Node, "_validate_inputs")
+        tagged = original.tag("new_tag")
+        validate_spy.assert_not_called()
+        assert tagged == original
+        assert tagged.tags == {"new_tag"}
+        assert not original.tags
+
+    def test_namespace_copy_skips_validation(self, mocker):
+        original = node(biconcat, ["input1", "input2"], "output1", name="a_node")
+        namespaced = node(
+            biconcat, ["input1", "input2"], "output1", name="a_node", namespace="ns"
+        )
+        validate_spy = mocker.spy(Node, "_validate_inputs")
+        copied = original._copy(namespace="ns", inputs=["input1", "input2"])
+        validate_spy.assert_not_called()
+        assert copied.name == "ns.a_node"
+        assert copied == namespaced
+        assert hash(copied) == hash(namespaced)
+
+    def test_copy_with_new_inputs_validates(self, mocker):
+        original = node(identity, "input1", "output1", name="a_node")
+        validate_spy = mocker.spy(Node, "_validate_inputs")
+        copied = original._copy(inputs="input2", namespace="ns")
+        validate_spy.assert_called_once()
+        assert copied.inputs == ["input2"]
+
+
+class TestResources:
+    def test_no_resources_by_default(self):
+        assert node(identity, "input", "output").resources == {}
+
+    @pytest.mark.parametrize(
+        "amount, expected",
+        [
+            (4, 4),
+            (0.5, 0.5),
+            ("2", 2),
+            ("1.5K", 1.5 * 1024),
+            ("512Mi", 512 * 1024**2),
+            ("4GB", 4 * 1024**3),
+            ("1t", 1024**4),
+        ],
+    )
+    def test_parse_resource_amounts(self, amount, expected):
+        n = node(identity, "input", "output", resources={"mem": amount})
+        assert n.resources == {"mem": expected}
+
+    def test_resources_are_kept_on_copy(self):
+        n = node(identity, "input", "output", resources={"cpu": 2})
+        assert n.tag("hello").resources == {"cpu": 2}
+
+    @pytest.mark.parametrize("bad_amount", [-1, True, "lots", "4X", "G"])
+    def test_invalid_resource_amount(self, bad_amount):
+        pattern = f"'{bad_amount}' is not a valid resource amount."
+        with pytest.raises(ValueError, match=re.escape(pattern)):
+            node(identity, "input", "output", resources={"mem": bad_amount})
+
+
+class TestTimeout:
+    def test_no_timeout_by_default(self):
+        assert node(identity, "input", "output").timeout is None
+
+    def test_timeout_is_kept_on_copy(self):
+        n = node(identity, "input", "output", timeout=1.5)
+        assert n.tag("hello").timeout == 1.5
+
+    @pytest.mark.parametrize("bad_timeout", [0, -1, float("nan")])
+    def test_invalid_timeout(self, bad_timeout):
+        with pytest.raises(ValueError, match="'timeout' must be a positive number"):
+            node(identity, "input", "output", timeout=bad_timeout)
 
 
 class TestNames:
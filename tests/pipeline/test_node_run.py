@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from kedro.pipeline import node
@@ -38,6 +40,44 @@ def test_valid_nodes(valid_nodes_with_inputs):
         assert output["dsOut"] == 42
 
 
+async def async_one_in_one_out(arg):
+    await asyncio.sleep(0)
+    return arg
+
+
+class TestAsyncNodeRun:
+    def test_run(self):
+        """Check that node.run runs async node functions to completion."""
+        output = node(async_one_in_one_out, "ds1", "dsOut").run({"ds1": 42})
+        assert output == {"dsOut": 42}
+
+    def test_run_in_running_event_loop(self):
+        """Check that node.run also works when an event loop is already running,
+        as in a Jupyter notebook."""
+
+        async def main():
+            return node(async_one_in_one_out, "ds1", "dsOut").run({"ds1": 42})
+
+        assert asyncio.run(main()) == {"dsOut": 42}
+
+    def test_arun(self):
+        output = asyncio.run(
+            node(async_one_in_one_out, "ds1", "dsOut").arun({"ds1": 42})
+        )
+        assert output == {"dsOut": 42}
+
+    def test_arun_sync_function(self):
+        output = asyncio.run(
+            node(one_in_dict_out, "ds1", {"ret": "dsOut"}).arun({"ds1": 42})
+        )
+        assert output == {"dsOut": 42}
+
+    def test_arun_invalid_input(self):
+        pattern = r"expected one input named 'ds1'"
+        with pytest.raises(ValueError, match=pattern):
+            asyncio.run(node(async_one_in_one_out, "ds1", "A").arun({}))
+
+
 def test_run_got_dataframe(mocked_dataset):
     """Check an exception when non-dictionary (class object) is passed."""
     pattern = r"Node.run\(\) expects a dictionary or None, "
@@ -311,6 +311,32 @@ class TestValidPipeline:
         # non-deterministic, so we are only checking they have the same set of nodes.
         assert all(set(g) == e for g, e in zip(grouped, expected))
 
+    def test_grouped_nodes_sorted(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "B", "C", name="d"),
+                node(identity, "A", "B", name="c"),
+                node(identity, "B", "D", name="a"),
+                node(identity, "X", "Y", name="b"),
+            ]
+        )
+        assert [[n.name for n in g] for g in test_pipeline.grouped_nodes] == [
+            ["b", "c"],
+            ["a", "d"],
+        ]
+
+    def test_node_dependencies_transcoded(self):
+        first = node(identity, "A", ["B@pandas", "C"], name="first")
+        second = node(biconcat, ["B@spark", "C"], "D", name="second")
+        third = node(identity, "X", "Y", name="third")
+        test_pipeline = pipeline([first, second, third])
+
+        assert test_pipeline.node_dependencies == {
+            first: set(),
+            second: {first},
+            third: set(),
+        }
+
     def test_free_input(self, all_pipeline_input_data):
         nodes = all_pipeline_input_data["nodes"]
         inputs = all_pipeline_input_data["free_inputs"]
@@ -530,6 +556,19 @@ class TestInvalidPipeline:
         with pytest.raises(CircularDependencyError, match=pattern):
             pipeline(pipeline_with_circle)
 
+    def test_circle_with_downstream_nodes(self, pipeline_with_circle):
+        nodes = [
+            *pipeline_with_circle,
+            node(identity, "C", "D", name="node4"),
+            node(identity, "X", "Y", name="node5"),
+        ]
+        with pytest.raises(CircularDependencyError, match="3 item") as exc_info:
+            pipeline(nodes)
+        message = str(exc_info.value)
+        assert all(f"node{i}" in message for i in (1, 2, 3))
+        assert "node4" not in message
+        assert "node5" not in message
+
     def test_unique_outputs(self, non_unique_node_outputs):
         with pytest.raises(OutputNotUniqueError, match=r"\['D', 'E'\]"):
             pipeline(non_unique_node_outputs)
@@ -770,6 +809,63 @@ class TestPipelineOperators:
         combined = pipeline1 + pipeline2 + pipeline3
         assert len(combined.nodes) == 3
 
+    @pytest.mark.parametrize(
+        "other_node, error, pattern",
+        [
+            (
+                node(identity, "C", "B", name="c"),
+                OutputNotUniqueError,
+                r"Output\(s\) \['B'\] are returned by more than one nodes",
+            ),
+            (
+                node(identity, "C", "D", name="c", confirms="A"),
+                ConfirmNotUniqueError,
+                r"\['A'\] datasets are confirmed by more than one node",
+            ),
+            (
+                node(identity, "C", "D", name="a"),
+                ValueError,
+                "Pipeline nodes must have unique names",
+            ),
+            (
+                node(identity, "B@spark", "D", name="c"),
+                ValueError,
+                "used with transcoding, but were referenced without the separator: B",
+            ),
+            (
+                node(identity, "B", "A", name="c"),
+                CircularDependencyError,
+                "Circular dependencies exist among the following 2 item",
+            ),
+        ],
+    )
+    def test_combine_invalid(self, other_node, error, pattern):
+        pipeline1 = pipeline([node(identity, "A", "B", name="a", confirms="A")])
+        with pytest.raises(error, match=pattern):
+            pipeline1 + pipeline([other_node])
+
+    def test_combine_many_connected(self):
+        pipelines = [
+            pipeline([node(identity, f"d{i}", f"d{i + 1}", name=f"n{i}")])
+            for i in range(10)
+        ]
+        combined = sum(reversed(pipelines))
+        assert [n.name for n in combined.nodes] == [f"n{i}" for i in range(10)]
+        assert combined.inputs() == {"d0"}
+        assert (combined - pipelines[5]).outputs() == {"d5", "d10"}
+
+    def test_combine_interrupting_namespace(self):
+        pipeline1 = pipeline(
+            [
+                node(identity, "A", "B", name="first", namespace="ns"),
+                node(identity, "C", "D", name="last", namespace="ns"),
+            ],
+            prefix_datasets_with_namespace=False,
+        )
+        pipeline2 = pipeline([node(identity, "B", "C", name="middle", namespace="x")])
+        with pytest.warns(UserWarning, match="Namespace 'ns' is interrupted"):
+            pipeline1 + pipeline2
+
     def test_connected_pipeline(self, disjoint_pipeline):
         """Connect two separate pipelines."""
         nodes = disjoint_pipeline["nodes"]
@@ -1189,6 +1285,41 @@ class TestPipelineFilterHelpers:
         with pytest.raises(ValueError, match=expected_error_message):
             test_pipeline.only_nodes_with_namespaces(["non_existent"])
 
+    def test_slices_share_root_graph(self, complex_pipeline):
+        sliced = complex_pipeline.from_nodes("node4")
+        assert sliced._index_root is complex_pipeline
+        sliced = sliced.to_nodes("node3")
+        assert sliced._index_root is complex_pipeline
+        assert {n.name for n in sliced.nodes} == {"node3", "node4"}
+        filtered = complex_pipeline.filter(from_nodes=["node4"], to_nodes=["node3"])
+        assert filtered._index_root is complex_pipeline
+        assert filtered.nodes == sliced.nodes
+
+    def test_slice_of_slice_skipping_nodes(self):
+        """Nodes left out of a slice no longer link the nodes around them."""
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="middle"),
+                node(identity, "C", "D", name="last"),
+                node(identity, "A", "E", name="other"),
+            ]
+        )
+        sliced = test_pipeline.only_nodes("first", "last")
+        assert sliced._index_root is sliced
+        assert {n.name for n in sliced.from_nodes("first").nodes} == {"first"}
+        assert {n.name for n in sliced.to_outputs("D").nodes} == {"last"}
+
+        sliced = test_pipeline.to_nodes("last")
+        assert {n.name for n in sliced.from_inputs("A").nodes} == {
+            "first",
+            "middle",
+            "last",
+        }
+        assert {
+            n.name for n in sliced.only_nodes("first").from_nodes("first").nodes
+        } == {"first"}
+
 
 class TestPipelineRunnerHelpers:
     """Node selection functions used in AbstractRunner."""
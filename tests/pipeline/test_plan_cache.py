@@ -0,0 +1,137 @@
+import pytest
+
+from kedro.pipeline import PlanCache, node, pipeline
+from kedro.pipeline import plan_cache as plan_cache_module
+from kedro.pipeline.pipeline import OutputNotUniqueError
+
+
+def identity(arg):
+    return arg
+
+
+@pytest.fixture
+def plan_dir(tmp_path):
+    return tmp_path / "plans"
+
+
+@pytest.fixture
+def registered():
+    """A fan out and a chain sharing their first node, registered apart."""
+    split = node(identity, "A", "B", name="split")
+    return [
+        pipeline(
+            [
+                split,
+                node(identity, "B", "C", name="left"),
+                node(identity, "B", "D", name="right"),
+            ]
+        ),
+        pipeline(
+            [
+                node(identity, "E", "F", name="chain_2"),
+                split,
+                node(identity, "B", "E", name="chain_1"),
+            ]
+        ),
+    ]
+
+
+class TestPlanCache:
+    def test_compile_and_save(self, plan_dir, registered):
+        combined = PlanCache(plan_dir).combine(registered)
+
+        assert combined.nodes == sum(registered).nodes
+        assert len(list(plan_dir.glob("*.json"))) == 1
+
+    def test_restore(self, plan_dir, registered, mocker):
+        expected = sum(registered)
+        PlanCache(plan_dir).combine(registered)
+        compile_spy = mocker.spy(plan_cache_module, "_compile_plan")
+
+        combined = PlanCache(plan_dir).combine(registered)
+
+        compile_spy.assert_not_called()
+        assert {"_graph", "_toposorted_ids"} <= combined.__dict__.keys()
+        assert combined.nodes == expected.nodes
+        assert combined.grouped_nodes == expected.grouped_nodes
+        assert combined.node_dependencies == expected.node_dependencies
+        assert combined.inputs() == expected.inputs()
+        assert (
+            combined.from_nodes("chain_1").nodes == expected.from_nodes("chain_1").nodes
+        )
+
+    def test_restore_without_validation(self, plan_dir, registered, mocker):
+        PlanCache(plan_dir).combine(registered)
+        init_spy = mocker.spy(plan_cache_module.Pipeline, "__init__")
+
+        PlanCache(plan_dir).combine(registered)
+
+        init_spy.assert_not_called()
+
+    def test_unfiltered_pipeline_shares_plan(self, plan_dir, registered):
+        cache = PlanCache(plan_dir)
+        cache.combine(registered)
+        combined = cache.combine(registered)
+
+        filtered = combined.filter()
+
+        assert filtered._graph is combined._graph
+        assert filtered._toposorted_ids is combined._toposorted_ids
+
+    def test_changed_pipeline(self, plan_dir, registered):
+        cache = PlanCache(plan_dir)
+        cache.combine(registered)
+        changed = [*registered, pipeline([node(identity, "F", "G", name="last")])]
+
+        assert cache.combine(changed).nodes == sum(changed).nodes
+        assert len(list(plan_dir.glob("*.json"))) == 2
+
+    def test_invalid_combination(self, plan_dir, registered):
+        cache = PlanCache(plan_dir)
+        conflicting = [*registered, pipeline([node(identity, "A", "C", name="x")])]
+
+        for _ in range(2):
+            with pytest.raises(OutputNotUniqueError):
+                cache.combine(conflicting)
+        assert not plan_dir.exists()
+
+    def test_keep_most_recent_plans(self, plan_dir, registered):
+        cache = PlanCache(plan_dir, max_plans=1)
+        cache.combine(registered[:1])
+        cache.combine(registered[1:])
+
+        assert len(list(plan_dir.glob("*.json"))) == 1
+
+    def test_recompile_corrupted_plan(self, plan_dir, registered, caplog):
+        cache = PlanCache(plan_dir)
+        cache.combine(registered)
+        (filepath,) = plan_dir.glob("*.json")
+        filepath.write_text("{not json")
+
+        combined = cache.combine(registered)
+
+        assert "Unable to read the compiled plan" in caplog.text
+        assert combined.nodes == sum(registered).nodes
+        assert filepath.read_text().startswith('{"key"')
+
+    def test_recompile_mismatching_plan(self, plan_dir, registered, caplog):
+        cache = PlanCache(plan_dir)
+        cache.combine(registered)
+        (filepath,) = plan_dir.glob("*.json")
+        filepath.write_text(filepath.read_text().replace('"nodes": [', '"nodes": [9, '))
+
+        combined = cache.combine(registered)
+
+        assert "Unable to use the compiled plan" in caplog.text
+        assert combined.nodes == sum(registered).nodes
+
+    def test_clear(self, plan_dir, registered):
+        cache = PlanCache(plan_dir)
+        cache.combine(registered)
+        cache.clear()
+
+        assert not list(plan_dir.glob("*.json"))
+
+    def test_invalid_max_plans(self, plan_dir):
+        with pytest.raises(ValueError, match="'max_plans' should be positive"):
+            PlanCache(plan_dir, max_plans=0)
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager, hook_impl
+from kedro.io import (
+    AbstractDataset,
+    DataCatalog,
+    DatasetError,
+    MemoryDataset,
+    StreamingDataset,
+)
+from kedro.pipeline import node, pipeline
+from kedro.runner import AsyncRunner
+from kedro.runner.async_runner import _EventLoopExecutor
+from tests.runner.conftest import exception_fn, identity
+
+
+async def async_identity(arg):
+    await asyncio.sleep(0)
+    return arg
+
+
+class AsyncDataset(AbstractDataset):
+    def __init__(self, data: Any = None):
+        self._data = data
+        self.aload_count = 0
+        self.asave_count = 0
+
+    def load(self) -> Any:
+        raise AssertionError("load should not be called")
+
+    def save(self, data: Any) -> None:
+        raise AssertionError("save should not be called")
+
+    async def aload(self) -> Any:
+        await asyncio.sleep(0)
+        self.aload_count += 1
+        return self._data
+
+    async def asave(self, data: Any) -> None:
+        await asyncio.sleep(0)
+        self.asave_count += 1
+        self._data = data
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+class ErrorHooks:
+    def __init__(self):
+        self.errors = []
+
+    @hook_impl
+    def on_node_error(self, error, node):
+        self.errors.append((node.name, error))
+
+
+class TestValidAsyncRunner:
+    def test_run(self, fan_out_fan_in, catalog):
+        catalog["A"] = 42
+        result = AsyncRunner().run(fan_out_fan_in, catalog)
+        assert result["Z"].load() == (42, 42, 42)
+
+    def test_run_with_plugin_manager(self, fan_out_fan_in, catalog):
+        catalog["A"] = 42
+        result = AsyncRunner().run(
+            fan_out_fan_in, catalog, hook_manager=_create_hook_manager()
+        )
+        assert result["Z"].load() == (42, 42, 42)
+
+    def test_async_nodes(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(async_identity, "A", "B"),
+                node(identity, "B", "C"),
+                node(async_identity, "C", "D"),
+            ]
+        )
+        catalog["A"] = 42
+        result = AsyncRunner().run(test_pipeline, catalog)
+        assert result["D"].load() == 42
+
+    def test_async_nodes_run_on_event_loop(self, catalog):
+        async def record_loop(arg):
+            return threading.get_ident(), id(asyncio.get_running_loop())
+
+        def record_thread(arg):
+            return threading.get_ident()
+
+        test_pipeline = pipeline(
+            [
+                node(record_loop, "A", "B"),
+                node(record_loop, "A", "C"),
+                node(record_thread, "A", "D"),
+            ]
+        )
+        catalog["A"] = 42
+        result = AsyncRunner().run(test_pipeline, catalog)
+        assert result["B"].load() == result["C"].load()
+        assert result["D"].load() != result["B"].load()[0]
+
+    def test_async_nodes_run_concurrently(self, catalog):
+        """Nodes waiting on each other only complete if they run at once."""
+        event = None
+
+        async def wait_for_event(arg):
+            nonlocal event
+            event = event or asyncio.Event()
+            await asyncio.wait_for(event.wait(), timeout=5)
+            return arg
+
+        async def set_event(arg):
+            while event is None:
+                await asyncio.sleep(0)
+            event.set()
+            return arg
+
+        test_pipeline = pipeline(
+            [
+                node(wait_for_event, "A", "B", name="wait"),
+                node(set_event, "A", "C", name="set"),
+            ]
+        )
+        catalog["A"] = 42
+        result = AsyncRunner().run(test_pipeline, catalog)
+        assert result["B"].load() == 42
+        assert result["C"].load() == 42
+
+    def test_async_datasets(self):
+        source, target = AsyncDataset(42), AsyncDataset()
+        catalog = DataCatalog({"A": source, "B": target})
+        test_pipeline = pipeline([node(async_identity, "A", "B")])
+        AsyncRunner().run(test_pipeline, catalog)
+
+        assert source.aload_count == 1
+        assert target.asave_count == 1
+        assert target._data == 42
+
+    def test_generator_node(self, catalog):
+        def generate(arg):
+            yield from range(arg)
+
+        class ChunkDataset(MemoryDataset):
+            def __init__(self):
+                super().__init__()
+                self.chunks = []
+
+            def save(self, data):
+                self.chunks.append(data)
+
+        chunks = ChunkDataset()
+        catalog["A"] = 3
+        catalog["B"] = chunks
+        AsyncRunner().run(pipeline([node(generate, "A", "B")]), catalog)
+        assert chunks.chunks == [0, 1, 2]
+
+    def test_max_concurrency(self, catalog):
+        running = 0
+        max_running = 0
+
+        async def count_running(arg):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return arg
+
+        test_pipeline = pipeline(
+            [node(count_running, "A", f"out_{i}", name=f"n{i}") for i in range(5)]
+        )
+        catalog["A"] = 42
+        AsyncRunner(max_concurrency=2).run(test_pipeline, catalog)
+        assert max_running <= 2
+
+    def test_is_async_ignored(self, fan_out_fan_in, catalog):
+        catalog["A"] = 42
+        result = AsyncRunner(is_async=False).run(fan_out_fan_in, catalog)
+        assert result["Z"].load() == (42, 42, 42)
+
+
+class TestInvalidAsyncRunner:
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_max_concurrency_not_positive(self, max_concurrency):
+        with pytest.raises(ValueError, match="max_concurrency should be positive"):
+            AsyncRunner(max_concurrency=max_concurrency)
+
+    def test_streaming_not_supported(self, catalog):
+        catalog["B"] = StreamingDataset()
+        test_pipeline = pipeline([node(identity, "A", "B"), node(identity, "B", "C")])
+        catalog["A"] = 42
+        with pytest.raises(ValueError, match="AsyncRunner does not support streaming"):
+            AsyncRunner().run(test_pipeline, catalog)
+
+    def test_node_failure(self, catalog):
+        test_pipeline = pipeline(
+            [node(identity, "A", "B"), node(exception_fn, "B", "C")]
+        )
+        catalog["A"] = 42
+        with pytest.raises(Exception, match="test exception"):
+            AsyncRunner().run(test_pipeline, catalog)
+
+    def test_failure_cancels_running_nodes(self, catalog):
+        started = cancelled = False
+
+        async def wait_forever(arg):
+            nonlocal started, cancelled
+            started = True
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def fail(arg):
+            while not started:
+                await asyncio.sleep(0)
+            raise ValueError("async failure")
+
+        test_pipeline = pipeline(
+            [
+                node(wait_forever, "A", "B", name="wait"),
+                node(fail, "A", "C", name="fail"),
+            ]
+        )
+        catalog["A"] = 42
+        with pytest.raises(ValueError, match="async failure"):
+            AsyncRunner().run(test_pipeline, catalog)
+        assert cancelled
+
+    def test_timeout_cancels_node(self, catalog):
+        cancelled = False
+
+        async def wait_forever(arg):
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(wait_forever, "B", "C", name="slow", timeout=0.2),
+            ]
+        )
+        catalog["A"] = 42
+        hook_manager = _create_hook_manager()
+        hooks = ErrorHooks()
+        hook_manager.register(hooks)
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match=r"Node 'slow' timed out after 0\.2"):
+            AsyncRunner().run(test_pipeline, catalog, hook_manager)
+        assert time.perf_counter() - start < 2
+        assert cancelled
+        assert [name for name, _ in hooks.errors] == ["slow"]
+        assert isinstance(hooks.errors[0][1], TimeoutError)
+
+    def test_run_from_running_loop(self, fan_out_fan_in, catalog):
+        async def run():
+            AsyncRunner().run(fan_out_fan_in, catalog)
+
+        catalog["A"] = 42
+        with pytest.raises(RuntimeError, match="cannot run from a running event"):
+            asyncio.run(run())
+
+    def test_executor_submit_other_function(self):
+        executor = _EventLoopExecutor()
+        try:
+            with pytest.raises(TypeError, match="submitted with '_execute_task'"):
+                executor.submit(identity, 42)
+        finally:
+            executor.shutdown()
+
+    def test_aload_error_wrapped(self):
+        class FailingDataset(AsyncDataset):
+            async def aload(self):
+                raise OSError("connection lost")
+
+        catalog = DataCatalog({"A": FailingDataset()})
+        test_pipeline = pipeline([node(identity, "A", "B")])
+        pattern = re.escape("Failed while loading data from dataset")
+        with pytest.raises(DatasetError, match=pattern):
+            AsyncRunner().run(test_pipeline, catalog)
+
+    def test_asave_none(self):
+        catalog = DataCatalog({"B": AsyncDataset()})
+        test_pipeline = pipeline([node(lambda: None, None, "B")])
+        with pytest.raises(DatasetError, match="Saving 'None' to a 'Dataset'"):
+            AsyncRunner().run(test_pipeline, catalog)
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import logging
+import shutil
+import socket
+import tempfile
+import threading
+from multiprocessing.connection import AuthenticationError, Client
+from pathlib import Path
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import AbstractDataset, DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import DistributedRunner
+from kedro.runner.distributed_runner import _WorkerPool, run_worker
+from tests.runner.conftest import exception_fn, identity, return_not_serialisable
+from tests.test_utils import fan_in
+
+AUTHKEY = "secret"
+
+
+class DictDataset(AbstractDataset):
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def _load(self):
+        return self._store[self._key]
+
+    def _save(self, data):
+        self._store[self._key] = data
+
+    def _describe(self):
+        return {"key": self._key}
+
+
+@pytest.fixture
+def address():
+    # Unix socket paths are limited to about 100 characters
+    directory = tempfile.mkdtemp(prefix="kedro-")
+    yield f"unix:{directory}/runner.sock"
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def start_workers():
+    threads = []
+
+    def start(address, count=1, catalog=None):
+        for _ in range(count):
+            thread = threading.Thread(
+                target=run_worker,
+                args=(catalog or DataCatalog(), _create_hook_manager()),
+                kwargs={"address": address, "authkey": AUTHKEY},
+            )
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    yield start
+    for thread in threads:
+        thread.join(10)
+        assert not thread.is_alive()
+
+
+@pytest.fixture
+def fan_out_pipeline():
+    return pipeline(
+        [
+            node(identity, "A", "B", name="left"),
+            node(identity, "A", "C", name="right"),
+            node(fan_in, ["B", "C"], "Z", name="join"),
+        ]
+    )
+
+
+class TestValidDistributedRunner:
+    def test_run_over_unix_socket(self, address, start_workers, fan_out_pipeline):
+        start_workers(address, count=2)
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        result = DistributedRunner(address=address, authkey=AUTHKEY).run(
+            fan_out_pipeline, catalog
+        )
+        assert result["Z"].load() == (42, 42)
+
+    def test_run_over_tcp(self, start_workers, fan_out_pipeline):
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            port = sock.getsockname()[1]
+        address = f"localhost:{port}"
+        start_workers(address)
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        result = DistributedRunner(address=address, authkey=AUTHKEY).run(
+            fan_out_pipeline, catalog
+        )
+        assert result["Z"].load() == (42, 42)
+
+    def test_datasets_resolved_on_worker(self, address, start_workers):
+        runner_store: dict = {}
+        worker_store: dict = {}
+        start_workers(
+            address,
+            catalog=DataCatalog({"B": DictDataset(worker_store, "B")}),
+        )
+        catalog = DataCatalog(
+            {"A": MemoryDataset(42), "B": DictDataset(runner_store, "B")}
+        )
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="save"),
+                node(identity, "B", "C", name="load"),
+            ]
+        )
+        result = DistributedRunner(address=address, authkey=AUTHKEY).run(
+            test_pipeline, catalog
+        )
+        assert worker_store == {"B": 42}
+        assert runner_store == {}
+        assert result["C"].load() == 42
+
+    def test_env_defaults(self, address, start_workers, monkeypatch):
+        monkeypatch.setenv("KEDRO_DISTRIBUTED_ADDRESS", address)
+        monkeypatch.setenv("KEDRO_DISTRIBUTED_AUTHKEY", AUTHKEY)
+        start_workers(None)
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        result = DistributedRunner().run(pipeline([node(identity, "A", "B")]), catalog)
+        assert result["B"].load() == 42
+
+    def test_lost_worker(self, address, start_workers, caplog):
+        def lose_task():
+            connection = Client(address[len("unix:") :], authkey=AUTHKEY.encode())
+            connection.send(("ready", 1))
+            connection.recv()
+            connection.close()
+            start_workers(address)
+
+        thread = threading.Thread(target=run_worker_later(address, lose_task))
+        thread.start()
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        result = DistributedRunner(address=address, authkey=AUTHKEY).run(
+            pipeline([node(identity, "A", "B", name="only")]), catalog
+        )
+        thread.join()
+        assert result["B"].load() == 42
+        assert "Lost the connection to a worker running node 'only'" in caplog.text
+
+    @pytest.mark.parametrize(
+        "authkey, hello",
+        [("wrong", None), (AUTHKEY, ("ready", 99))],
+    )
+    def test_rejected_worker(self, address, start_workers, caplog, authkey, hello):
+        def connect():
+            try:
+                connection = Client(address[len("unix:") :], authkey=authkey.encode())
+            except AuthenticationError:
+                pass
+            else:
+                connection.send(hello)
+                connection.close()
+            start_workers(address)
+
+        caplog.set_level(logging.WARNING)
+        thread = threading.Thread(target=run_worker_later(address, connect))
+        thread.start()
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        result = DistributedRunner(address=address, authkey=AUTHKEY).run(
+            pipeline([node(identity, "A", "B")]), catalog
+        )
+        thread.join()
+        assert result["B"].load() == 42
+        assert "Rejected a worker" in caplog.text
+
+
+def run_worker_later(address, target):
+    """Run the target once the runner listens on the Unix socket address."""
+    path = Path(address[len("unix:") :])
+
+    def wait_and_run():
+        while not path.exists():
+            threading.Event().wait(0.05)
+        target()
+
+    return wait_and_run
+
+
+class TestInvalidDistributedRunner:
+    def test_node_error(self, address, start_workers):
+        start_workers(address)
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        with pytest.raises(Exception, match="test exception"):
+            DistributedRunner(address=address, authkey=AUTHKEY).run(
+                pipeline([node(exception_fn, "A", "B")]), catalog
+            )
+
+    def test_unpicklable_output(self, address, start_workers):
+        start_workers(address)
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        with pytest.raises(RuntimeError, match="Unable to send the result of node"):
+            DistributedRunner(address=address, authkey=AUTHKEY).run(
+                pipeline([node(return_not_serialisable, "A", "B", name="n")]),
+                catalog,
+            )
+
+    def test_dataset_missing_on_worker(self, address, start_workers):
+        start_workers(address)
+        catalog = DataCatalog({"A": MemoryDataset(42), "B": DictDataset({}, "B")})
+        with pytest.raises(ValueError, match="Dataset 'B' of node 'n' is not defined"):
+            DistributedRunner(address=address, authkey=AUTHKEY).run(
+                pipeline([node(identity, "A", "B", name="n")]), catalog
+            )
+
+    def test_unserialisable_node(self, address):
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        with pytest.raises(AttributeError, match="cannot be serialised"):
+            DistributedRunner(address=address, authkey=AUTHKEY).run(
+                pipeline([node(lambda x: x, "A", "B")]), catalog
+            )
+
+    @pytest.mark.parametrize("bad_address", ["localhost", "host:port", "unix:"])
+    def test_invalid_address(self, bad_address):
+        with pytest.raises(ValueError, match=f"Invalid address '{bad_address}'"):
+            DistributedRunner(address=bad_address, authkey=AUTHKEY)
+
+    def test_missing_authkey(self, monkeypatch):
+        monkeypatch.delenv("KEDRO_DISTRIBUTED_AUTHKEY", raising=False)
+        with pytest.raises(ValueError, match="An authentication key"):
+            DistributedRunner()
+
+    def test_worker_connect_timeout(self, address):
+        with pytest.raises(ConnectionError, match="Unable to connect to a runner"):
+            run_worker(
+                DataCatalog(),
+                _create_hook_manager(),
+                address=address,
+                authkey=AUTHKEY,
+                connect_timeout=0.1,
+            )
+
+    def test_submit_other_function(self, address):
+        pool = _WorkerPool(address[len("unix:") :], AUTHKEY.encode())
+        try:
+            with pytest.raises(TypeError, match="Workers only run the node"):
+                pool.submit(identity, 1)
+        finally:
+            pool.shutdown()
+
+    def test_no_worker_connects(self, address):
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        runner = DistributedRunner(
+            address=address, authkey=AUTHKEY, connect_timeout=0.2
+        )
+        with pytest.raises(TimeoutError, match="No worker connected to the runner"):
+            runner.run(pipeline([node(identity, "A", "B")]), catalog)
+
+    def test_all_workers_lost(self, address):
+        def lose_task():
+            connection = Client(address[len("unix:") :], authkey=AUTHKEY.encode())
+            connection.send(("ready", 1))
+            connection.recv()
+            connection.close()
+
+        thread = threading.Thread(target=run_worker_later(address, lose_task))
+        thread.start()
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        runner = DistributedRunner(
+            address=address, authkey=AUTHKEY, connect_timeout=None, idle_timeout=0.2
+        )
+        with pytest.raises(TimeoutError, match="All the workers disconnected"):
+            runner.run(pipeline([node(identity, "A", "B")]), catalog)
+        thread.join()
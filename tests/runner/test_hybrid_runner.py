@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager, hook_impl
+from kedro.io import DataCatalog, MemoryDataset, SharedMemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import HybridRunner
+from kedro.runner.parallel_runner import _execute_worker_task
+from kedro.runner.scheduling import _Prefetcher
+from tests.runner.conftest import exception_fn, identity
+from tests.test_utils import fan_in
+
+
+def get_pid(*args):
+    return os.getpid()
+
+
+class DatasetTypeHooks:
+    def __init__(self):
+        self.types = {}
+
+    @hook_impl
+    def before_node_run(self, node, catalog):
+        self.types[node.name] = {name: type(catalog.get(name)) for name in "ABCD"}
+
+
+def get_thread_id(*args):
+    return threading.get_ident()
+
+
+class TestValidHybridRunner:
+    def test_run(self, fan_out_fan_in, catalog):
+        catalog["A"] = 42
+        result = HybridRunner().run(fan_out_fan_in, catalog)
+        assert result["Z"].load() == (42, 42, 42)
+
+    def test_run_with_plugin_manager(self, fan_out_fan_in, catalog):
+        catalog["A"] = 42
+        result = HybridRunner().run(
+            fan_out_fan_in, catalog, hook_manager=_create_hook_manager()
+        )
+        assert result["Z"].load() == (42, 42, 42)
+
+    def test_routes_nodes_by_tag(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(get_pid, "A", "process_pid", tags="executor.process"),
+                node(get_pid, "A", "thread_pid", tags="executor.thread"),
+                node(get_thread_id, "A", "thread_id"),
+            ]
+        )
+        catalog["A"] = 42
+        runner = HybridRunner()
+        result = runner.run(test_pipeline, catalog)
+
+        assert result["process_pid"].load() != os.getpid()
+        assert result["thread_pid"].load() == os.getpid()
+        assert result["thread_id"].load() != threading.get_ident()
+
+    def test_default_executor_process(self, catalog):
+        test_pipeline = pipeline([node(get_pid, "A", "pid")])
+        catalog["A"] = 42
+        runner = HybridRunner(default_executor="process")
+        result = runner.run(test_pipeline, catalog)
+        assert result["pid"].load() != os.getpid()
+
+    def test_data_crossing_process_boundary(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="thread_1"),
+                node(identity, "B", "C", name="process", tags="executor.process"),
+                node(identity, "C", "D", name="thread_2"),
+                node(fan_in, ["B", "D"], "Z", name="thread_3"),
+            ]
+        )
+        catalog["A"] = 42
+        hook_manager = _create_hook_manager()
+        hooks = DatasetTypeHooks()
+        hook_manager.register(hooks)
+        runner = HybridRunner()
+        result = runner.run(test_pipeline, catalog, hook_manager)
+
+        assert result["Z"].load() == (42, 42)
+        # Only the datasets used by the node running in a process are shared
+        assert hooks.types["thread_3"] == {
+            "A": MemoryDataset,
+            "B": SharedMemoryDataset,
+            "C": SharedMemoryDataset,
+            "D": MemoryDataset,
+        }
+
+    def test_restore_catalog_after_run(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="thread"),
+                node(identity, "B", "C", name="process", tags="executor.process"),
+            ]
+        )
+        datasets = {"A": MemoryDataset(42), "B": MemoryDataset(), "C": MemoryDataset()}
+        catalog = DataCatalog(dict(datasets))
+        HybridRunner().run(test_pipeline, catalog)
+
+        assert {name: catalog.get(name) for name in datasets} == datasets
+        assert catalog.load("C") == 42
+
+    def test_restore_catalog_after_failed_run(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="thread"),
+                node(exception_fn, "B", "C", name="process", tags="executor.process"),
+            ]
+        )
+        dataset = MemoryDataset()
+        catalog = DataCatalog({"A": MemoryDataset(42), "B": dataset})
+        with pytest.raises(Exception, match="test exception"):
+            HybridRunner().run(test_pipeline, catalog)
+
+        assert catalog.get("B") is dataset
+        assert catalog.load("B") == 42
+
+    def test_catalog_unchanged_during_run(self):
+        datasets = {"A": MemoryDataset(42), "B": MemoryDataset(), "C": MemoryDataset()}
+        catalog = DataCatalog(dict(datasets))
+        seen = {}
+
+        def record(x):
+            seen.update({name: catalog.get(name) for name in datasets})
+            return x
+
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="process", tags="executor.process"),
+                node(record, "B", "C", name="thread"),
+            ]
+        )
+        HybridRunner().run(test_pipeline, catalog)
+
+        assert seen == datasets
+        assert catalog.load("C") == 42
+
+    def test_thread_only_pipeline_keeps_memory_datasets(self, fan_out_fan_in):
+        catalog = DataCatalog({"A": MemoryDataset(42)})
+        HybridRunner().run(fan_out_fan_in, catalog)
+        assert not any(
+            isinstance(catalog.get(name), SharedMemoryDataset)
+            for name in fan_out_fan_in.datasets()
+        )
+
+    def test_pools_sized_by_max_antichain_width(self):
+        process = "executor.process"
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="thread_1"),
+                node(identity, "A", "C", name="thread_2"),
+                node(identity, "A", "D", name="thread_3"),
+                node(identity, "A", "E", name="process_1", tags=process),
+                node(identity, "E", "F", name="process_2", tags=process),
+                node(identity, "F", "G", name="process_3", tags=process),
+            ]
+        )
+        runner = HybridRunner(max_threads=8, max_workers=8)
+        assert runner._get_required_workers_count(test_pipeline) == 4
+        assert runner._get_pool_sizes(test_pipeline) == (3, 1)
+
+    def test_executor_submit(self):
+        executor = HybridRunner()._get_executor(1, 1)
+        try:
+            assert executor.submit(threading.get_ident).result() != (
+                threading.get_ident()
+            )
+            assert executor.submit(_execute_worker_task, "missing", ()).exception()
+        finally:
+            executor.shutdown()
+
+    def test_executor_submit_without_process_pool(self):
+        executor = HybridRunner()._get_executor(1)
+        try:
+            with pytest.raises(RuntimeError, match="No process pool"):
+                executor.submit(_execute_worker_task, "missing", ())
+        finally:
+            executor.shutdown()
+
+
+class TestFuseNodes:
+    def test_only_fuse_nodes_in_same_pool(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="thread"),
+                node(identity, "B", "C", name="process_1", tags="executor.process"),
+                node(identity, "C", "D", name="process_2", tags="executor.process"),
+            ]
+        )
+        catalog["A"] = 42
+        runner = HybridRunner(fuse_nodes=True)
+        result = runner.run(test_pipeline, catalog)
+
+        nodes = {n.name: n for n in test_pipeline.nodes}
+        assert runner._fused_nodes == {nodes["process_1"]: [nodes["process_2"]]}
+        assert result["D"].load() == 42
+
+
+class TestPrefetch:
+    def test_only_prefetch_for_nodes_in_threads(self, catalog, mocker):
+        prefetch = mocker.spy(_Prefetcher, "prefetch")
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(fan_in, ["B", "C"], "D", name="thread"),
+                node(fan_in, ["B", "C"], "E", name="process", tags="executor.process"),
+            ]
+        )
+        catalog["A"] = 42
+        catalog["C"] = 1
+        result = HybridRunner(prefetch_memory="1M").run(test_pipeline, catalog)
+
+        assert [call.args[1].name for call in prefetch.call_args_list] == ["thread"]
+        assert result["D"].load() == (42, 1)
+
+
+def sleep(arg):
+    # Nodes timing out in threads are not stopped, so keep it short
+    time.sleep(3)
+    return arg
+
+
+class TestNodeTimeouts:
+    @pytest.mark.parametrize("tag", ["executor.process", "executor.thread"])
+    def test_timeout(self, catalog, tag):
+        test_pipeline = pipeline(
+            [node(sleep, "A", "B", name="sleep", tags=[tag, "timeout.0.5"])]
+        )
+        catalog["A"] = 42
+        with pytest.raises(TimeoutError, match="Node 'sleep' timed out"):
+            HybridRunner().run(test_pipeline, catalog)
+
+
+class TestInvalidHybridRunner:
+    def test_invalid_default_executor(self):
+        with pytest.raises(ValueError, match="default_executor should be one of"):
+            HybridRunner(default_executor="gpu")
+
+    @pytest.mark.parametrize(
+        "tags",
+        [["executor.gpu"], ["executor.thread", "executor.process"]],
+    )
+    def test_invalid_executor_tag(self, catalog, tags):
+        test_pipeline = pipeline([node(identity, "A", "B", name="node", tags=tags)])
+        catalog["A"] = 42
+        pattern = "Node 'node' should be tagged with exactly one of"
+        with pytest.raises(ValueError, match=pattern):
+            HybridRunner().run(test_pipeline, catalog)
+
+    def test_unserialisable_process_node(self, catalog):
+        test_pipeline = pipeline(
+            [node(lambda x: x, "A", "B", name="lambda", tags="executor.process")]
+        )
+        catalog["A"] = 42
+        with pytest.raises(AttributeError, match="cannot be serialised"):
+            HybridRunner().run(test_pipeline, catalog)
+
+    def test_unserialisable_thread_node(self, catalog):
+        test_pipeline = pipeline([node(lambda x: x, "A", "B", name="lambda")])
+        catalog["A"] = 42
+        result = HybridRunner().run(test_pipeline, catalog)
+        assert result["B"].load() == 42
+
+    def test_node_failure_in_process(self, catalog):
+        test_pipeline = pipeline(
+            [node(exception_fn, "A", "B", tags="executor.process")]
+        )
+        catalog["A"] = 42
+        with pytest.raises(Exception, match="test exception"):
+            HybridRunner().run(test_pipeline, catalog)
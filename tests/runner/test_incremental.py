@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import logging
+import os
+from functools import partial
+
+import pytest
+from kedro_datasets.pickle import PickleDataset
+
+from kedro.io import AbstractDataset, DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import RunHistory, SequentialRunner
+from kedro.runner.fingerprint import (
+    _compute_node_fingerprints,
+    _dataset_fingerprint,
+    _function_fingerprint,
+)
+from tests.runner.conftest import identity
+
+
+def scale(data, factor):
+    return data * factor
+
+
+def shift(data):
+    return data + 1
+
+
+def shift_twice(data):
+    return data + 2
+
+
+class NoFileDataset(AbstractDataset):
+    def _load(self):
+        return 1
+
+    def _save(self, data):
+        pass
+
+    def _describe(self):
+        return {}
+
+
+@pytest.fixture
+def run_history(tmp_path):
+    return RunHistory(tmp_path / "run_history.json")
+
+
+@pytest.fixture
+def incremental_pipeline():
+    return pipeline(
+        [
+            node(scale, ["raw", "params:factor"], "scaled", name="scale"),
+            node(shift, "scaled", "shifted", name="shift"),
+            node(identity, "raw", "copy", name="copy"),
+        ]
+    )
+
+
+@pytest.fixture
+def make_catalog(tmp_path):
+    raw_filepath = tmp_path / "raw.pkl"
+    PickleDataset(filepath=str(raw_filepath)).save(3)
+
+    def _make_catalog(factor=2):
+        return DataCatalog(
+            {
+                "raw": PickleDataset(filepath=str(raw_filepath)),
+                "params:factor": MemoryDataset(factor),
+                "scaled": PickleDataset(filepath=str(tmp_path / "scaled.pkl")),
+                "shifted": PickleDataset(filepath=str(tmp_path / "shifted.pkl")),
+                "copy": PickleDataset(filepath=str(tmp_path / "copy.pkl")),
+            }
+        )
+
+    return _make_catalog
+
+
+def run_incremental(test_pipeline, catalog, run_history):
+    executed = []
+
+    class RecordingRunner(SequentialRunner):
+        def _record_node_duration(self, node, duration):
+            executed.append(node.name)
+            super()._record_node_duration(node, duration)
+
+    RecordingRunner(run_history=run_history).run(
+        test_pipeline, catalog, incremental=True
+    )
+    run_history.save()
+    return sorted(executed)
+
+
+class TestIncrementalRun:
+    def test_first_run_runs_all_nodes(
+        self, incremental_pipeline, make_catalog, run_history
+    ):
+        executed = run_incremental(incremental_pipeline, make_catalog(), run_history)
+        assert executed == ["copy", "scale", "shift"]
+        assert set(run_history.node_fingerprints) == {"copy", "scale", "shift"}
+
+    def test_skip_unchanged_nodes(
+        self, incremental_pipeline, make_catalog, run_history, caplog
+    ):
+        caplog.set_level(logging.INFO)
+        run_incremental(incremental_pipeline, make_catalog(), run_history)
+        executed = run_incremental(incremental_pipeline, make_catalog(), run_history)
+        assert executed == []
+        assert "Skipping 3 unchanged nodes: copy, scale, shift" in caplog.text
+
+    def test_rerun_on_parameter_change(
+        self, incremental_pipeline, make_catalog, run_history
+    ):
+        run_incremental(incremental_pipeline, make_catalog(), run_history)
+        catalog = make_catalog(factor=10)
+        executed = run_incremental(incremental_pipeline, catalog, run_history)
+
+        assert executed == ["scale", "shift"]
+        assert catalog.load("shifted") == 31
+
+    def test_rerun_on_input_change(
+        self, incremental_pipeline, make_catalog, run_history
+    ):
+        run_incremental(incremental_pipeline, make_catalog(), run_history)
+        catalog = make_catalog()
+        catalog.save("raw", 5)
+        stat = os.stat(catalog["raw"]._filepath)
+        os.utime(
+            catalog["raw"]._filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        executed = run_incremental(incremental_pipeline, catalog, run_history)
+
+        assert executed == ["copy", "scale", "shift"]
+        assert catalog.load("shifted") == 11
+
+    def test_rerun_on_code_change(
+        self, incremental_pipeline, make_catalog, run_history
+    ):
+        run_incremental(incremental_pipeline, make_catalog(), run_history)
+        changed_pipeline = pipeline(
+            [
+                node(scale, ["raw", "params:factor"], "scaled", name="scale"),
+                node(shift_twice, "scaled", "shifted", name="shift"),
+                node(identity, "raw", "copy", name="copy"),
+            ]
+        )
+        executed = run_incremental(changed_pipeline, make_catalog(), run_history)
+        assert executed == ["shift"]
+
+    def test_rerun_on_missing_output(
+        self, incremental_pipeline, make_catalog, run_history, tmp_path
+    ):
+        run_incremental(incremental_pipeline, make_catalog(), run_history)
+        (tmp_path / "copy.pkl").unlink()
+        executed = run_incremental(incremental_pipeline, make_catalog(), run_history)
+        assert executed == ["copy"]
+
+    def test_run_unchanged_parent_of_ephemeral_input(self, make_catalog, run_history):
+        """An unchanged node still runs if a changed child needs its in-memory
+        output.
+        """
+        first = pipeline(
+            [
+                node(scale, ["raw", "params:factor"], "in_memory", name="scale"),
+                node(shift, "in_memory", "shifted", name="shift"),
+            ]
+        )
+        run_incremental(first, make_catalog(), run_history)
+        second = pipeline(
+            [
+                node(scale, ["raw", "params:factor"], "in_memory", name="scale"),
+                node(shift_twice, "in_memory", "shifted", name="shift"),
+            ]
+        )
+        executed = run_incremental(second, make_catalog(), run_history)
+        assert executed == ["scale", "shift"]
+
+    def test_requires_run_history(self, incremental_pipeline, make_catalog):
+        with pytest.raises(ValueError, match="Incremental runs need a 'run_history'"):
+            SequentialRunner().run(
+                incremental_pipeline, make_catalog(), incremental=True
+            )
+
+
+class TestNodeFingerprints:
+    def test_unknown_input_fingerprint(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "unknown", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+            ]
+        )
+        fingerprints = _compute_node_fingerprints(test_pipeline, DataCatalog())
+        assert set(fingerprints.values()) == {None}
+
+    def test_fingerprints_are_stable(self):
+        test_pipeline = pipeline([node(identity, "A", "B", name="first")])
+        catalog = DataCatalog({"A": MemoryDataset([1, 2, 3])})
+        first = _compute_node_fingerprints(test_pipeline, catalog)
+        second = _compute_node_fingerprints(test_pipeline, catalog)
+        assert first == second
+        assert first[test_pipeline.nodes[0]] is not None
+
+    def test_function_fingerprint(self):
+        namespace = {}
+        exec("def generated(x):\n    return x", namespace)  # noqa: S102
+
+        assert _function_fingerprint(partial(scale, factor=2)) != _function_fingerprint(
+            partial(scale, factor=3)
+        )
+        assert _function_fingerprint(len) == "builtins.len"
+        assert _function_fingerprint(namespace["generated"]) != _function_fingerprint(
+            identity
+        )
+
+    def test_dataset_fingerprint(self, tmp_path, mocker):
+        missing = PickleDataset(filepath=str(tmp_path / "missing.pkl"))
+        assert _dataset_fingerprint(None) is None
+        assert _dataset_fingerprint(MemoryDataset()) is None
+        assert _dataset_fingerprint(missing) is None
+        assert _dataset_fingerprint(NoFileDataset()) is None
+        assert _dataset_fingerprint(MemoryDataset(lambda: 1)) is None
+
+        no_metadata = PickleDataset(filepath=str(tmp_path / "raw.pkl"))
+        mocker.patch.object(no_metadata._fs, "info", return_value={"size": 1})
+        assert _dataset_fingerprint(no_metadata) is None
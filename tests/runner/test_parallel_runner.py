@@ -3,9 +3,12 @@ from __future__ import annotations
 import os
 import re
 import sys
-from concurrent.futures.process import ProcessPoolExecutor
+import time
+from concurrent.futures.process import BrokenProcessPool, ProcessPoolExecutor
+from multiprocessing import get_context
 from typing import Any
 
+import numpy as np
 import pytest
 
 from kedro.framework.hooks import _create_hook_manager
@@ -21,6 +24,14 @@ from kedro.runner.parallel_runner import (
     ParallelRunnerManager,
 )
 from kedro.runner.runner import _MAX_WINDOWS_WORKERS
+from kedro.runner.task import (
+    _NATIVE_THREADS_VARIABLES,
+    _init_worker,
+    _limit_native_threads,
+    _limit_task_native_threads,
+    _worker_context,
+    _WorkerPids,
+)
 from tests.runner.conftest import (
     exception_fn,
     identity,
@@ -77,6 +88,209 @@ class TestValidParallelRunner:
         assert "Using synchronous mode for loading and saving data." in caplog.text
 
 
+class TestWorkerInitializer:
+    def test_catalog_and_nodes_shipped_once_per_worker(
+        self, mocker, fan_out_fan_in, shared_memory_catalog
+    ):
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        )
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+
+        shared_memory_catalog["A"] = 42
+        runner = ParallelRunner()
+        result = runner.run(fan_out_fan_in, shared_memory_catalog)
+        assert result["Z"].load() == (42, 42, 42)
+
+        kwargs = executor_cls_mock.call_args.kwargs
+        assert kwargs["initializer"] is _init_worker
+        catalog, nodes, *_ = kwargs["initargs"]
+        assert catalog is shared_memory_catalog
+        assert set(nodes) == {n.name for n in fan_out_fan_in.nodes}
+        # Tasks only carry the name of the node to run
+        submitted = [call.args[2] for call in submit.call_args_list]
+        assert sorted(submitted) == sorted(nodes)
+        assert runner._worker_initargs == ()
+
+
+def _native_threads(arg):
+    return tuple(os.environ.get(variable) for variable in _NATIVE_THREADS_VARIABLES)
+
+
+class TestNativeThreads:
+    def test_cores_divided_between_workers(self, mocker, shared_memory_catalog):
+        mocker.patch("os.cpu_count", return_value=8)
+        test_pipeline = pipeline(
+            [
+                node(_native_threads, "A", "default", name="default"),
+                node(_native_threads, "A", "heavy", name="heavy", resources={"cpu": 6}),
+            ]
+        )
+        shared_memory_catalog["A"] = 42
+        runner = ParallelRunner(max_workers=2)
+        result = runner.run(test_pipeline, shared_memory_catalog)
+
+        assert result["default"].load() == ("4", "4", "4")
+        assert result["heavy"].load() == ("6", "6", "6")
+
+    def test_native_threads(self, shared_memory_catalog):
+        test_pipeline = pipeline([node(_native_threads, "A", "B")])
+        shared_memory_catalog["A"] = 42
+        runner = ParallelRunner(native_threads=3)
+        result = runner.run(test_pipeline, shared_memory_catalog)
+        assert result["B"].load() == ("3", "3", "3")
+
+    def test_unlimited_native_threads(self, mocker, shared_memory_catalog):
+        mocker.patch.dict(os.environ, {"OMP_NUM_THREADS": "7"})
+        test_pipeline = pipeline([node(_native_threads, "A", "B")])
+        shared_memory_catalog["A"] = 42
+        runner = ParallelRunner(native_threads=0)
+        result = runner.run(test_pipeline, shared_memory_catalog)
+        assert result["B"].load()[0] == "7"
+
+    def test_threadpoolctl_limits(self, mocker):
+        threadpoolctl = mocker.MagicMock()
+        mocker.patch.dict(sys.modules, {"threadpoolctl": threadpoolctl})
+        mocker.patch.dict(os.environ)
+
+        _limit_native_threads(2)
+
+        threadpoolctl.threadpool_limits.assert_called_once_with(limits=2)
+        assert os.environ["MKL_NUM_THREADS"] == "2"
+
+    def test_fused_nodes_limited_to_most_threads(self, mocker):
+        limit_native_threads = mocker.patch("kedro.runner.task._limit_native_threads")
+        mocker.patch.dict(
+            _worker_context,
+            native_threads=2,
+            node_threads={"heavy": 8},
+            current_native_threads=2,
+        )
+
+        _limit_task_native_threads(["light"])
+        limit_native_threads.assert_not_called()
+        _limit_task_native_threads(["light", "heavy"])
+        limit_native_threads.assert_called_once_with(8)
+
+    def test_negative_native_threads(self):
+        with pytest.raises(ValueError, match="'native_threads' should not be negative"):
+            ParallelRunner(native_threads=-1)
+
+
+def _large_array(value):
+    return np.full(500_000, value)
+
+
+def _array_sum(array):
+    return float(array.sum())
+
+
+class TestFuseNodes:
+    def test_fused_chain_submitted_once(self, mocker, shared_memory_catalog):
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+                node(identity, "C", "D", name="third"),
+            ]
+        )
+        shared_memory_catalog["A"] = 42
+        runner = ParallelRunner(fuse_nodes=True)
+        result = runner.run(test_pipeline, shared_memory_catalog)
+
+        assert result["D"].load() == 42
+        submitted = [call.args[2:] for call in submit.call_args_list]
+        assert submitted == [("first", ("second", "third"))]
+
+
+def _sleep(arg):
+    time.sleep(30)
+    return arg
+
+
+def _fail_soon(arg):
+    time.sleep(0.5)
+    raise ValueError("failed")
+
+
+class TestFailFast:
+    def test_terminate_running_nodes(self, shared_memory_catalog):
+        test_pipeline = pipeline(
+            [
+                node(_fail_soon, "A", "B", name="fail"),
+                node(_sleep, "A", "C", name="sleep"),
+            ]
+        )
+        shared_memory_catalog["A"] = 42
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match="failed"):
+            ParallelRunner(max_workers=2, fail_fast=True).run(
+                test_pipeline, shared_memory_catalog
+            )
+        assert time.perf_counter() - start < 15
+
+    def test_terminate_reported_workers(self):
+        context = get_context()
+        worker_pids = _WorkerPids(context)
+        with ProcessPoolExecutor(
+            1, mp_context=context, initializer=worker_pids.report
+        ) as pool:
+            pid = pool.submit(os.getpid).result()
+            future = pool.submit(_sleep, 42)
+            worker_pids.terminate()
+            with pytest.raises(BrokenProcessPool):
+                future.result(timeout=15)
+        assert worker_pids._pids == {pid}
+
+
+class TestNodeTimeouts:
+    def test_terminate_node_timing_out(self, shared_memory_catalog):
+        test_pipeline = pipeline([node(_sleep, "A", "B", name="sleep", timeout=0.5)])
+        shared_memory_catalog["A"] = 42
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match="Node 'sleep' timed out"):
+            ParallelRunner(max_workers=1).run(test_pipeline, shared_memory_catalog)
+        assert time.perf_counter() - start < 15
+
+
+class TestSharedMemoryTransport:
+    def test_large_arrays_between_workers(self, shared_memory_catalog):
+        test_pipeline = pipeline(
+            [
+                node(_large_array, "A", "array", name="produce"),
+                node(_array_sum, "array", "Z", name="consume"),
+            ]
+        )
+        shared_memory_catalog["A"] = 2
+        runner = ParallelRunner()
+        result = runner.run(test_pipeline, shared_memory_catalog)
+        assert result["Z"].load() == 1_000_000
+
+    def test_free_blocks_after_run(self, shared_memory_catalog):
+        test_pipeline = pipeline([node(_large_array, "A", "array", name="produce")])
+        shared_memory_catalog["A"] = 2
+        runner = ParallelRunner()
+        result = runner.run(test_pipeline, shared_memory_catalog)
+
+        assert not list(shared_memory_catalog["array"]._shared_memory_blocks)
+        assert result["array"].load().sum() == 1_000_000
+
+    def test_free_blocks_after_failed_run(self, shared_memory_catalog):
+        test_pipeline = pipeline(
+            [
+                node(_large_array, "A", "array", name="produce"),
+                node(exception_fn, "array", "Z", name="fail"),
+            ]
+        )
+        shared_memory_catalog["A"] = 2
+        with pytest.raises(Exception, match="test exception"):
+            ParallelRunner().run(test_pipeline, shared_memory_catalog)
+
+        assert not list(shared_memory_catalog["array"]._shared_memory_blocks)
+
+
 class TestMaxWorkers:
     @pytest.mark.parametrize("is_async", [False, True])
     @pytest.mark.parametrize(
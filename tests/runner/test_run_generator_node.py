@@ -1,6 +1,12 @@
+import threading
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager, hook_impl
 from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, DatasetError, MemoryDataset
 from kedro.pipeline import Pipeline, node
-from kedro.runner import SequentialRunner
+from kedro.runner import SequentialRunner, ThreadRunner
 
 
 def generate_one():
@@ -100,3 +106,107 @@ class TestRunGeneratorNode:
         assert left.save.call_args_list == expected_left
         assert 10 == right.save.call_count
         assert right.save.call_args_list == expected_right
+
+
+class RecordingDataset(MemoryDataset):
+    def __init__(self, delay_event=None):
+        super().__init__()
+        self.chunks = []
+        self.delay_event = delay_event
+
+    def _save(self, data):
+        if self.delay_event is not None and not self.chunks:
+            # Hold the first chunk until the node has computed the next one
+            self.saved_after_next_chunk = self.delay_event.wait(5)
+        self.chunks.append(data)
+
+
+class SaveHooks:
+    def __init__(self):
+        self.events = []
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name, data):
+        self.events.append(("before", dataset_name, data))
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, data):
+        self.events.append(("after", dataset_name, data))
+
+
+@pytest.mark.parametrize("runner_class", [SequentialRunner, ThreadRunner])
+class TestBackgroundChunkWriting:
+    def test_chunk_order(self, runner_class):
+        catalog = DataCatalog({"left": RecordingDataset(), "right": RecordingDataset()})
+        hook_manager = _create_hook_manager()
+        hooks = SaveHooks()
+        hook_manager.register(hooks)
+
+        n = node(generate_dict, inputs=None, outputs={"idx": "left", "square": "right"})
+        runner_class(chunk_write_depth=3).run(Pipeline([n]), catalog, hook_manager)
+
+        assert catalog["left"].chunks == list(range(10))
+        assert catalog["right"].chunks == [i * i for i in range(10)]
+        for name, chunks in (
+            ("left", range(10)),
+            ("right", (i * i for i in range(10))),
+        ):
+            expected = [(when, name, c) for c in chunks for when in ("before", "after")]
+            assert [e for e in hooks.events if e[1] == name] == expected
+
+    def test_compute_overlaps_writes(self, runner_class):
+        next_chunk_computed = threading.Event()
+
+        def generate():
+            yield 0
+            next_chunk_computed.set()
+            yield 1
+
+        dataset = RecordingDataset(delay_event=next_chunk_computed)
+        catalog = DataCatalog({"result": dataset})
+        n = node(generate, inputs=None, outputs="result")
+        runner_class(chunk_write_depth=2).run(Pipeline([n]), catalog)
+
+        assert dataset.saved_after_next_chunk
+        assert dataset.chunks == [0, 1]
+
+    def test_pending_chunks_bounded(self, runner_class):
+        dataset = RecordingDataset()
+        waiting = []
+
+        def generate():
+            for i in range(20):
+                waiting.append(i - len(dataset.chunks))
+                yield i
+
+        catalog = DataCatalog({"result": dataset})
+        n = node(generate, inputs=None, outputs="result")
+        runner_class(chunk_write_depth=2).run(Pipeline([n]), catalog)
+
+        assert dataset.chunks == list(range(20))
+        assert max(waiting) <= 2
+
+    def test_save_error_stops_node(self, runner_class, mocker):
+        pulled = []
+
+        def generate():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        dataset = mocker.Mock()
+        dataset.save.side_effect = DatasetError("save failed")
+        catalog = DataCatalog()
+        mocker.patch.object(catalog, "get", return_value=dataset)
+        n = node(generate, inputs=None, outputs="result")
+
+        with pytest.raises(DatasetError, match="save failed"):
+            runner_class(chunk_write_depth=1).run(
+                Pipeline([n]), catalog, _NullPluginManager()
+            )
+        assert len(pulled) < 100
+
+
+def test_negative_chunk_write_depth():
+    with pytest.raises(ValueError, match="'chunk_write_depth' should not be negative"):
+        SequentialRunner(chunk_write_depth=-1)
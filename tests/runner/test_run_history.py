@@ -0,0 +1,162 @@
+import json
+
+import pytest
+
+from kedro.io import DataCatalog
+from kedro.pipeline import node, pipeline
+from kedro.runner import RunHistory, SequentialRunner, ThreadRunner
+from kedro.runner.scheduling import _critical_path_priorities
+from tests.runner.conftest import identity
+
+
+@pytest.fixture
+def history_filepath(tmp_path):
+    return tmp_path / "history" / "run_history.json"
+
+
+@pytest.fixture
+def chain_and_leaf():
+    """A three-node chain next to an independent leaf node."""
+    return pipeline(
+        [
+            node(identity, "A", "B", name="chain_1"),
+            node(identity, "B", "C", name="chain_2"),
+            node(identity, "C", "D", name="chain_3"),
+            node(identity, "A", "E", name="leaf"),
+        ]
+    )
+
+
+class TestRunHistory:
+    def test_empty_when_file_missing(self, history_filepath):
+        assert RunHistory(history_filepath).node_durations == {}
+
+    def test_save_and_load(self, history_filepath):
+        history = RunHistory(history_filepath)
+        history.record_node_duration("node1", 1.5)
+        history.save()
+
+        assert RunHistory(history_filepath).node_durations == {"node1": 1.5}
+
+    def test_save_keeps_other_sections(self, history_filepath):
+        history_filepath.parent.mkdir(parents=True)
+        history_filepath.write_text(json.dumps({"other": {"a": 1}}))
+
+        history = RunHistory(history_filepath)
+        history.record_node_duration("node1", 2.0)
+        history.save()
+
+        saved = json.loads(history_filepath.read_text())
+        assert saved == {"node_durations": {"node1": 2.0}, "other": {"a": 1}}
+
+    def test_save_and_load_fingerprints(self, history_filepath):
+        history = RunHistory(history_filepath)
+        history.record_node_fingerprint("node1", "abc")
+        history.save()
+
+        assert RunHistory(history_filepath).node_fingerprints == {"node1": "abc"}
+
+    def test_ignore_corrupted_file(self, history_filepath, caplog):
+        history_filepath.parent.mkdir(parents=True)
+        history_filepath.write_text("{not json")
+
+        assert RunHistory(history_filepath).node_durations == {}
+        assert "Unable to read run history" in caplog.text
+
+
+class TestCriticalPathPriorities:
+    def test_fall_back_to_graph_depth(self, chain_and_leaf):
+        priorities = {
+            n.name: p for n, p in _critical_path_priorities(chain_and_leaf, {}).items()
+        }
+        assert priorities == {"chain_1": 3, "chain_2": 2, "chain_3": 1, "leaf": 1}
+
+    def test_weighted_by_durations(self, chain_and_leaf):
+        durations = {"chain_1": 1.0, "chain_2": 1.0, "chain_3": 1.0, "leaf": 10.0}
+        priorities = {
+            n.name: p
+            for n, p in _critical_path_priorities(chain_and_leaf, durations).items()
+        }
+        assert priorities == {
+            "chain_1": 3.0,
+            "chain_2": 2.0,
+            "chain_3": 1.0,
+            "leaf": 10.0,
+        }
+
+    def test_unknown_nodes_use_average_duration(self, chain_and_leaf):
+        durations = {"chain_3": 2.0, "leaf": 4.0}
+        priorities = {
+            n.name: p
+            for n, p in _critical_path_priorities(chain_and_leaf, durations).items()
+        }
+        assert priorities["chain_1"] == 3.0 + 3.0 + 2.0
+
+
+class TestRunnerWithRunHistory:
+    def test_record_durations(self, chain_and_leaf, history_filepath):
+        catalog = DataCatalog()
+        catalog["A"] = 42
+        SequentialRunner(run_history=RunHistory(history_filepath)).run(
+            chain_and_leaf, catalog
+        )
+
+        durations = RunHistory(history_filepath).node_durations
+        assert set(durations) == {"chain_1", "chain_2", "chain_3", "leaf"}
+        assert all(duration >= 0 for duration in durations.values())
+
+    def test_submit_critical_path_first(self, chain_and_leaf, history_filepath):
+        history = RunHistory(history_filepath)
+        for name, duration in [
+            ("chain_1", 1.0),
+            ("chain_2", 1.0),
+            ("chain_3", 1.0),
+            ("leaf", 10.0),
+        ]:
+            history.record_node_duration(name, duration)
+        history.save()
+
+        executed = []
+
+        class RecordingRunner(ThreadRunner):
+            def _record_node_duration(self, node, duration):
+                executed.append(node.name)
+
+        catalog = DataCatalog()
+        catalog["A"] = 42
+        RecordingRunner(max_workers=1, run_history=RunHistory(history_filepath)).run(
+            chain_and_leaf, catalog
+        )
+
+        assert executed[0] == "leaf"
+
+    def test_late_ready_node_runs_before_queued_nodes(self, history_filepath):
+        history = RunHistory(history_filepath)
+        for name, duration in [("first", 1.0), ("late", 100.0)]:
+            history.record_node_duration(name, duration)
+        for name in ("other_1", "other_2", "other_3"):
+            history.record_node_duration(name, 2.0)
+        history.save()
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="late"),
+                node(identity, "A", "D", name="other_1"),
+                node(identity, "A", "E", name="other_2"),
+                node(identity, "A", "F", name="other_3"),
+            ]
+        )
+
+        executed = []
+
+        class RecordingRunner(ThreadRunner):
+            def _record_node_duration(self, node, duration):
+                executed.append(node.name)
+
+        catalog = DataCatalog()
+        catalog["A"] = 42
+        RecordingRunner(max_workers=1, run_history=RunHistory(history_filepath)).run(
+            test_pipeline, catalog
+        )
+
+        assert executed[:2] == ["first", "late"]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import (
+    AsyncRunner,
+    RunJournal,
+    SequentialRunner,
+    ThreadRunner,
+)
+
+calls: list[str] = []
+
+
+def load_raw(raw):
+    calls.append("load_raw")
+    return raw + 1
+
+
+def double(data):
+    calls.append("double")
+    return data * 2
+
+
+def maybe_fail(data, fail):
+    calls.append("maybe_fail")
+    if fail:
+        raise ValueError("failed")
+    return data + 1
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return RunJournal(tmp_path / "journal" / "session")
+
+
+@pytest.fixture
+def journal_pipeline():
+    return pipeline(
+        [
+            node(load_raw, "raw", "first", name="load_raw"),
+            node(double, "first", "second", name="double"),
+            node(maybe_fail, ["second", "params:fail"], "result", name="maybe_fail"),
+        ]
+    )
+
+
+def make_catalog(fail):
+    return DataCatalog(
+        {
+            "raw": MemoryDataset(1),
+            "params:fail": MemoryDataset(fail),
+            "result": MemoryDataset(),
+        }
+    )
+
+
+def fail_then_resume(runner_class, journal_pipeline, journal):
+    with pytest.raises(ValueError, match="failed"):
+        runner_class(journal=journal).run(journal_pipeline, make_catalog(fail=True))
+    calls.clear()
+    catalog = make_catalog(fail=False)
+    runner_class(journal=RunJournal(journal.path)).run(journal_pipeline, catalog)
+    return catalog
+
+
+class TestRunJournal:
+    def test_record_and_reload_nodes(self, journal):
+        assert journal.completed_nodes == set()
+        journal.record_node("first")
+        journal.record_node("second")
+
+        assert RunJournal(journal.path).completed_nodes == {"first", "second"}
+
+    def test_checkpoints(self, journal):
+        assert not journal.has_checkpoint("a/b")
+        assert journal.checkpoint("a/b", [1, 2])
+        assert journal.has_checkpoint("a/b")
+        assert journal.load_checkpoint("a/b") == [1, 2]
+
+        journal.evict("a/b")
+        assert not journal.has_checkpoint("a/b")
+        journal.evict("a/b")
+
+    def test_unpicklable_checkpoint(self, journal, caplog):
+        assert not journal.checkpoint("lock", threading.Lock())
+        assert not journal.has_checkpoint("lock")
+        assert "Unable to checkpoint dataset 'lock'" in caplog.text
+
+    def test_clear(self, journal):
+        journal.record_node("first")
+        journal.checkpoint("data", 1)
+        journal.clear()
+
+        assert not journal.path.exists()
+        assert journal.completed_nodes == set()
+
+
+@pytest.mark.parametrize("runner_class", [SequentialRunner, ThreadRunner, AsyncRunner])
+class TestResumeFromJournal:
+    def test_resume_restores_in_memory_inputs(
+        self, runner_class, journal_pipeline, journal, caplog
+    ):
+        caplog.set_level(logging.INFO)
+        catalog = fail_then_resume(runner_class, journal_pipeline, journal)
+
+        assert calls == ["maybe_fail"]
+        assert catalog.load("result") == 5
+        assert (
+            "skipping 2 completed nodes and restoring 1 checkpointed datasets"
+            in caplog.text
+        )
+
+    def test_journal_cleared_after_success(
+        self, runner_class, journal_pipeline, journal
+    ):
+        fail_then_resume(runner_class, journal_pipeline, journal)
+        assert not journal.path.exists()
+
+    def test_failure_records_progress(
+        self, runner_class, journal_pipeline, journal, caplog
+    ):
+        with pytest.raises(ValueError, match="failed"):
+            runner_class(journal=journal).run(journal_pipeline, make_catalog(fail=True))
+
+        assert journal.completed_nodes == {"load_raw", "double"}
+        # "first" was released once "double" completed
+        assert not journal.has_checkpoint("first")
+        assert journal.has_checkpoint("second")
+        assert '--resume "session"' in caplog.text
+
+    def test_rerun_parents_of_missing_checkpoints(
+        self, runner_class, journal_pipeline, journal
+    ):
+        with pytest.raises(ValueError, match="failed"):
+            runner_class(journal=journal).run(journal_pipeline, make_catalog(fail=True))
+        journal.evict("second")
+        calls.clear()
+        catalog = make_catalog(fail=False)
+        runner_class(journal=RunJournal(journal.path)).run(journal_pipeline, catalog)
+
+        assert calls == ["load_raw", "double", "maybe_fail"]
+        assert catalog.load("result") == 5
+
+
+def test_resume_skipping_all_nodes(journal_pipeline, journal):
+    for n in journal_pipeline.nodes:
+        journal.record_node(n.name)
+    catalog = make_catalog(fail=False)
+    catalog.save("result", 5)
+
+    SequentialRunner(journal=journal).run(journal_pipeline, catalog)
+    assert calls == []
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pytest
+
+from kedro.pipeline import node, pipeline
+from kedro.runner import RunHistory, ScheduleSimulator
+from kedro.runner.schedule_simulator import SchedulePrediction
+from kedro.runner.scheduling import _max_antichain_width
+from tests.runner.conftest import identity
+from tests.test_utils import fan_in
+
+
+@pytest.fixture
+def diamond_pipeline():
+    r"""
+
+        (first)
+        /  |  \
+    (left) | (right)
+       |   |    |
+    (down) |    |
+        \  |   /
+        (last)
+
+    """
+    return pipeline(
+        [
+            node(identity, "a", "b", name="first"),
+            node(identity, "b", "c", name="left"),
+            node(identity, "c", "d", name="down"),
+            node(identity, "b", "e", name="right"),
+            node(fan_in, ["b", "d", "e"], "f", name="last"),
+        ]
+    )
+
+
+DURATIONS = {"first": 2.0, "left": 3.0, "down": 1.0, "right": 3.0, "last": 1.0}
+
+
+class TestMaxAntichainWidth:
+    def test_fan_out_fan_in(self, fan_out_fan_in):
+        assert _max_antichain_width(fan_out_fan_in) == 3
+
+    def test_transitive_dependencies(self, two_branches_crossed_pipeline):
+        # The layers heuristic allows 4 nodes, but only one node of each
+        # branch can run at a time
+        assert _max_antichain_width(two_branches_crossed_pipeline) == 2
+
+    def test_chains_with_shared_descendant(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "a", "b", name="a1"),
+                node(identity, "b", "c", name="a2"),
+                node(identity, "x", "y", name="x1"),
+                node(fan_in, ["c", "y"], "z", name="join"),
+                node(identity, "x", "w", name="x2"),
+            ]
+        )
+        # "a1" or "a2", with "x1" and "x2"
+        assert _max_antichain_width(test_pipeline) == 3
+
+    def test_subset_of_nodes(self, diamond_pipeline):
+        nodes = {n.name: n for n in diamond_pipeline.nodes}
+        # "first" and "down" are linked through "left", which is not counted
+        subset = [nodes["first"], nodes["down"]]
+        assert _max_antichain_width(diamond_pipeline, subset) == 1
+        subset = [nodes["down"], nodes["right"]]
+        assert _max_antichain_width(diamond_pipeline, subset) == 2
+
+    def test_empty_pipeline(self, empty_pipeline):
+        assert _max_antichain_width(empty_pipeline) == 0
+
+
+class TestScheduleSimulator:
+    def test_max_parallelism(self, diamond_pipeline):
+        assert ScheduleSimulator(diamond_pipeline).max_parallelism == 2
+
+    def test_critical_path(self, diamond_pipeline):
+        simulator = ScheduleSimulator(diamond_pipeline, DURATIONS)
+        assert [n.name for n in simulator.critical_path] == [
+            "first",
+            "left",
+            "down",
+            "last",
+        ]
+        assert simulator.critical_path_length == 7.0
+
+    @pytest.mark.parametrize(
+        "workers, makespan, utilisation",
+        [(1, 10.0, 1.0), (2, 7.0, 10 / 14), (3, 7.0, 10 / 21)],
+    )
+    def test_simulate(self, diamond_pipeline, workers, makespan, utilisation):
+        prediction = ScheduleSimulator(diamond_pipeline, DURATIONS).simulate(workers)
+        assert prediction == SchedulePrediction(
+            workers=workers,
+            makespan=makespan,
+            utilisation=pytest.approx(utilisation),
+        )
+
+    def test_longest_path_scheduled_first(self):
+        test_pipeline = pipeline(
+            [
+                node(identity, "a", "b", name="a_short"),
+                node(identity, "a", "c", name="b_short"),
+                node(identity, "a", "d", name="c_long"),
+                node(identity, "d", "e", name="d_after_long"),
+            ]
+        )
+        simulator = ScheduleSimulator(
+            test_pipeline, {n.name: 2.0 for n in test_pipeline.nodes}
+        )
+        # Starting both short nodes first would take 6 seconds
+        assert simulator.simulate(2).makespan == 4.0
+
+    def test_unknown_durations_default_to_mean(self, diamond_pipeline):
+        simulator = ScheduleSimulator(
+            diamond_pipeline, {"first": 1.0, "right": 3.0, "unknown": 10.0}
+        )
+        assert simulator.simulate(1).makespan == 10.0
+
+    def test_without_durations(self, diamond_pipeline):
+        assert ScheduleSimulator(diamond_pipeline).simulate(1).makespan == 5.0
+
+    def test_run_history(self, diamond_pipeline, tmp_path):
+        run_history = RunHistory(tmp_path / "run_history.json")
+        for name, duration in DURATIONS.items():
+            run_history.record_node_duration(name, duration)
+        assert (
+            ScheduleSimulator(diamond_pipeline, run_history).simulate(2).makespan == 7.0
+        )
+
+    def test_empty_pipeline(self, empty_pipeline):
+        simulator = ScheduleSimulator(empty_pipeline)
+        assert simulator.simulate(1) == SchedulePrediction(1, 0.0, 0.0)
+        assert simulator.critical_path == []
+
+    def test_invalid_workers(self, diamond_pipeline):
+        with pytest.raises(ValueError, match="'workers' should be positive"):
+            ScheduleSimulator(diamond_pipeline).simulate(0)
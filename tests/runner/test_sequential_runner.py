@@ -1,20 +1,23 @@
 from __future__ import annotations
 
+import logging
 import re
+import tempfile
 from typing import Any
 
 import pandas as pd
 import pytest
 
-from kedro.framework.hooks import _create_hook_manager
+from kedro.framework.hooks import _create_hook_manager, hook_impl
 from kedro.io import (
     AbstractDataset,
     DataCatalog,
     DatasetError,
     MemoryDataset,
+    StreamingDataset,
 )
 from kedro.pipeline import node, pipeline
-from kedro.runner import SequentialRunner
+from kedro.runner import RunHistory, SequentialRunner
 from tests.runner.conftest import exception_fn, identity
 from tests.test_utils import sink, source
 
@@ -54,6 +57,13 @@ class TestValidSequentialRunner:
 
         assert result_first_run == result_second_run
 
+    def test_streaming_not_supported(self, catalog):
+        catalog["B"] = StreamingDataset()
+        test_pipeline = pipeline([node(identity, "A", "B"), node(identity, "B", "C")])
+        catalog["A"] = 42
+        with pytest.raises(ValueError, match="does not support streaming datasets"):
+            SequentialRunner().run(test_pipeline, catalog)
+
 
 @pytest.mark.parametrize("is_async", [False, True])
 class TestSequentialRunnerBranchlessPipeline:
@@ -236,6 +246,21 @@ class TestSequentialRunnerRelease:
         # we want to the release after both the loads
         assert log == [("load", "dataset"), ("load", "dataset"), ("release", "dataset")]
 
+    def test_count_repeated_loads_by_one_node(self, is_async):
+        log = []
+        test_pipeline = pipeline(
+            [
+                node(source, None, "dataset"),
+                node(lambda x, y: x, ["dataset", "dataset"], "out", name="bob"),
+                node(sink, "dataset", None, name="fred"),
+            ]
+        )
+        catalog = DataCatalog({"dataset": LoggingDataset(log, "dataset")})
+        SequentialRunner(is_async=is_async).run(test_pipeline, catalog)
+
+        # we want to see the release only once, after all three loads
+        assert log == [("load", "dataset")] * 3 + [("release", "dataset")]
+
     def test_release_transcoded(self, is_async):
         log = []
         test_pipeline = pipeline(
@@ -375,3 +400,284 @@ class TestMemoryDatasetBehaviour:
         assert (
             "RegularOutput" not in output
         )  # This output is registered in DataCatalog and so should not be in free outputs
+
+
+def _grow(value):
+    return list(range(10_000))
+
+
+def _shrink(values):
+    return len(values)
+
+
+@pytest.fixture
+def two_heavy_branches():
+    """Two branches each producing a large intermediate that is reduced to a
+    small one, before both small ones are combined."""
+    return pipeline(
+        [
+            node(_grow, "A", "big_1", name="grow_1"),
+            node(_grow, "A", "big_2", name="grow_2"),
+            node(_shrink, "big_1", "small_1", name="shrink_1"),
+            node(_shrink, "big_2", "small_2", name="shrink_2"),
+            node(lambda x, y: x + y, ["small_1", "small_2"], "Z", name="combine"),
+        ]
+    )
+
+
+class TestMemoryBudget:
+    def _run(self, test_pipeline, runner):
+        executed = []
+
+        class RecordingRunner(SequentialRunner):
+            def _record_node_duration(self, node, duration):
+                executed.append(node.name)
+
+        recording_runner = RecordingRunner(
+            run_history=runner._run_history,
+            memory_budget=runner._memory_budget,
+            spill_dir=runner._spill_dir,
+        )
+        catalog = DataCatalog()
+        catalog["A"] = 42
+        result = recording_runner.run(test_pipeline, catalog)
+        return executed, result["Z"].load()
+
+    def test_default_order_keeps_intermediates_alive(self, two_heavy_branches):
+        executed, result = self._run(two_heavy_branches, SequentialRunner())
+        assert executed[:2] == ["grow_1", "grow_2"]
+        assert result == 20_000
+
+    def test_reduce_large_intermediates_first(self, two_heavy_branches):
+        executed, result = self._run(
+            two_heavy_branches, SequentialRunner(memory_budget="1G")
+        )
+        assert executed == ["grow_1", "shrink_1", "grow_2", "shrink_2", "combine"]
+        assert result == 20_000
+
+    def test_use_recorded_dataset_sizes(self, two_heavy_branches, tmp_path):
+        history = RunHistory(tmp_path / "run_history.json")
+        history.record_dataset_size("big_1", 1_000_000)
+        history.record_dataset_size("big_2", 10)
+        history.record_dataset_size("small_1", 10)
+        history.record_dataset_size("small_2", 10)
+
+        executed, _ = self._run(
+            two_heavy_branches,
+            SequentialRunner(run_history=history, memory_budget="1G"),
+        )
+        assert executed[:3] == ["grow_2", "shrink_2", "grow_1"]
+
+    def test_prefer_last_consumer_of_large_dataset(self, tmp_path):
+        test_pipeline = pipeline(
+            [
+                node(_grow, "A", "big", name="grow"),
+                node(_shrink, "big", "small", name="shrink"),
+                node(lambda values: values[:100], "big", "head", name="head"),
+                node(lambda x: [x] * 10, "small", "Z", name="repeat"),
+            ]
+        )
+        history = RunHistory(tmp_path / "run_history.json")
+        history.record_dataset_size("small", 10)
+        history.record_dataset_size("head", 2000)
+        history.record_dataset_size("Z", 1000)
+
+        executed, _ = self._run(
+            test_pipeline,
+            SequentialRunner(run_history=history, memory_budget="1G"),
+        )
+        # Once ``shrink`` has run, ``head`` frees ``big`` and runs before
+        # ``repeat`` although it was queued with a larger memory delta
+        assert executed == ["grow", "shrink", "head", "repeat"]
+
+    def test_record_dataset_sizes(self, two_heavy_branches, tmp_path):
+        filepath = tmp_path / "run_history.json"
+        self._run(
+            two_heavy_branches,
+            SequentialRunner(run_history=RunHistory(filepath), memory_budget="1G"),
+        )
+
+        sizes = RunHistory(filepath).dataset_sizes
+        assert sizes["big_1"] > sizes["small_1"] > 0
+        assert set(sizes) >= {"big_1", "big_2", "small_1", "small_2", "Z"}
+
+    def test_spill_when_budget_exceeded(self, two_heavy_branches, tmp_path, caplog):
+        caplog.set_level(logging.INFO, logger="kedro.runner.scheduling")
+        _, result = self._run(
+            two_heavy_branches,
+            SequentialRunner(memory_budget=1, spill_dir=tmp_path / "spill"),
+        )
+
+        assert result == 20_000
+        assert "Spilled dataset 'big_1'" in caplog.text
+        assert "Spilled dataset 'Z'" in caplog.text
+        assert not list((tmp_path / "spill").iterdir())
+
+    def test_remove_temporary_spill_dir(
+        self, two_heavy_branches, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        _, result = self._run(two_heavy_branches, SequentialRunner(memory_budget=1))
+
+        assert result == 20_000
+        assert not list(tmp_path.iterdir())
+
+    def test_remove_spill_files_on_failure(self, tmp_path):
+        test_pipeline = pipeline(
+            [
+                node(lambda x: [x] * 1000, "A", "big", name="grow"),
+                node(exception_fn, "big", "Z", name="fail"),
+            ]
+        )
+        with pytest.raises(Exception, match="test exception"):
+            self._run(
+                test_pipeline,
+                SequentialRunner(memory_budget=1, spill_dir=tmp_path / "spill"),
+            )
+
+        assert not list((tmp_path / "spill").iterdir())
+
+    def test_data_which_cannot_be_spilled(self, tmp_path, caplog):
+        test_pipeline = pipeline(
+            [
+                node(lambda x: lambda: x, "A", "fn", name="make_fn"),
+                node(lambda fn: fn(), "fn", "Z", name="call_fn"),
+            ]
+        )
+        _, result = self._run(
+            test_pipeline, SequentialRunner(memory_budget=1, spill_dir=tmp_path)
+        )
+
+        assert result == 42
+        assert "Unable to spill dataset 'fn'" in caplog.text
+
+
+class RecordingHooks:
+    def __init__(self):
+        self.calls = []
+
+    @hook_impl
+    def before_node_run(self, node):
+        self.calls.append(("before_node_run", node.name))
+
+    @hook_impl
+    def after_node_run(self, node):
+        self.calls.append(("after_node_run", node.name))
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, node):
+        self.calls.append(("after_dataset_loaded", dataset_name, node.name))
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, node):
+        self.calls.append(("after_dataset_saved", dataset_name, node.name))
+
+
+@pytest.fixture
+def linear_chain():
+    return pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "C", "D", name="third"),
+        ]
+    )
+
+
+class TestFuseNodes:
+    def test_not_fused_by_default(self, linear_chain, catalog):
+        runner = SequentialRunner()
+        catalog["A"] = 42
+        runner.run(linear_chain, catalog)
+        assert runner._fused_nodes == {}
+
+    def test_fuse_linear_chain(self, linear_chain):
+        class SpyDataset(MemoryDataset):
+            saved = False
+
+            def save(self, data):
+                SpyDataset.saved = True
+                super().save(data)
+
+        catalog = DataCatalog({"B": SpyDataset(), "C": SpyDataset()})
+        catalog["A"] = 42
+        runner = SequentialRunner(fuse_nodes=True)
+        result = runner.run(linear_chain, catalog)
+
+        first, second, third = linear_chain.nodes
+        assert runner._fused_nodes == {first: [second, third]}
+        assert result["D"].load() == 42
+        assert not SpyDataset.saved
+
+    def test_hooks_run_for_each_fused_node(self, linear_chain, catalog):
+        hooks = RecordingHooks()
+        hook_manager = _create_hook_manager()
+        hook_manager.register(hooks)
+        catalog["A"] = 42
+        SequentialRunner(fuse_nodes=True).run(linear_chain, catalog, hook_manager)
+
+        assert hooks.calls == [
+            ("after_dataset_loaded", "A", "first"),
+            ("before_node_run", "first"),
+            ("after_node_run", "first"),
+            ("after_dataset_saved", "B", "first"),
+            ("after_dataset_loaded", "B", "second"),
+            ("before_node_run", "second"),
+            ("after_node_run", "second"),
+            ("after_dataset_saved", "C", "second"),
+            ("after_dataset_loaded", "C", "third"),
+            ("before_node_run", "third"),
+            ("after_node_run", "third"),
+            ("after_dataset_saved", "D", "third"),
+        ]
+
+    def test_record_duration_of_each_fused_node(self, linear_chain, tmp_path):
+        history = RunHistory(tmp_path / "run_history.json")
+        catalog = DataCatalog()
+        catalog["A"] = 42
+        SequentialRunner(run_history=history, fuse_nodes=True).run(
+            linear_chain, catalog
+        )
+        assert set(history.node_durations) == {"first", "second", "third"}
+
+    def test_persisted_dataset_not_fused(self, linear_chain):
+        log = []
+        catalog = DataCatalog({"B": LoggingDataset(log, "B")})
+        catalog["A"] = 42
+        runner = SequentialRunner(fuse_nodes=True)
+        result = runner.run(linear_chain, catalog)
+
+        _, second, third = linear_chain.nodes
+        assert runner._fused_nodes == {second: [third]}
+        assert ("load", "B") in log
+        assert result["D"].load() == 42
+
+    def test_branches_not_fused(self, fan_out_fan_in, catalog):
+        runner = SequentialRunner(fuse_nodes=True)
+        catalog["A"] = 42
+        result = runner.run(fan_out_fan_in, catalog)
+        assert runner._fused_nodes == {}
+        assert result["Z"].load() == (42, 42, 42)
+
+    def test_generator_node_not_fused(self, catalog):
+        def generate(arg):
+            yield arg
+
+        test_pipeline = pipeline(
+            [node(generate, "A", "B", name="generate"), node(identity, "B", "C")]
+        )
+        runner = SequentialRunner(fuse_nodes=True)
+        catalog["A"] = 42
+        runner.run(test_pipeline, catalog)
+        assert runner._fused_nodes == {}
+
+    def test_failure_in_fused_chain(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(exception_fn, "B", "C", name="fail"),
+            ]
+        )
+        catalog["A"] = 42
+        with pytest.raises(Exception, match="test exception"):
+            SequentialRunner(fuse_nodes=True).run(test_pipeline, catalog)
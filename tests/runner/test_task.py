@@ -3,7 +3,8 @@ import pytest
 from kedro.framework.hooks.manager import _NullPluginManager
 from kedro.pipeline import node
 from kedro.runner import Task
-from kedro.runner.task import TaskError
+from kedro.runner.task import TaskError, _init_worker
+from tests.runner.conftest import identity
 
 
 def generate_one():
@@ -93,3 +94,24 @@ class TestTask:
                 parallel=False,
             )
             task.execute()
+
+
+class TestWorkerContext:
+    def test_init_worker_once_per_process(self, mocker):
+        hook_manager = _NullPluginManager()
+        synchronization = mocker.patch.object(
+            Task, "_run_node_synchronization", return_value=hook_manager
+        )
+        catalog = mocker.MagicMock()
+        nodes = {"first": node(identity, "A", "B", name="first")}
+        _init_worker(catalog, nodes, False, "fake_run_id")
+
+        for _ in range(3):
+            task = Task._from_worker_context("first")
+            assert task.node is nodes["first"]
+            assert task.catalog is catalog
+            assert task.hook_manager is hook_manager
+            assert task.run_id == "fake_run_id"
+            assert not task.parallel
+
+        synchronization.assert_called_once()
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
 
-from kedro.framework.hooks import _create_hook_manager
+from kedro.framework.hooks import _create_hook_manager, hook_impl
 from kedro.io import (
     AbstractDataset,
     DataCatalog,
     DatasetError,
     MemoryDataset,
+    StreamingDataset,
 )
 from kedro.pipeline import node, pipeline
 from kedro.runner import ThreadRunner
@@ -45,6 +48,36 @@ class TestValidThreadRunner:
         ThreadRunner().run(fan_out_fan_in, catalog)
         assert "Using synchronous mode for loading and saving data." not in caplog.text
 
+    def test_nodes_run_after_all_parents(self, catalog):
+        """Each node is scheduled once, only after all of its parents completed."""
+        execution_order = []
+
+        def record(name):
+            def _record(*args):
+                execution_order.append(name)
+                return name
+
+            _record.__name__ = name
+            return _record
+
+        test_pipeline = pipeline(
+            [
+                node(record("a"), "in", "a"),
+                node(record("b"), "a", "b"),
+                node(record("c"), "a", "c"),
+                node(record("d"), ["b", "c"], "d"),
+                node(record("e"), ["a", "d"], "e"),
+            ]
+        )
+        catalog["in"] = 0
+
+        result = ThreadRunner().run(test_pipeline, catalog)
+
+        assert result["e"].load() == "e"
+        assert sorted(execution_order) == ["a", "b", "c", "d", "e"]
+        assert execution_order[0] == "a"
+        assert execution_order[-2:] == ["d", "e"]
+
     def test_thread_run_with_patterns(self):
         """Test warm-up is done and patterns are resolved before running pipeline.
 
@@ -105,12 +138,473 @@ class TestMaxWorkers:
 
         executor_cls_mock.assert_called_once_with(max_workers=expected_number)
 
+    def test_max_antichain_width(self, mocker, two_branches_crossed_pipeline):
+        """Only one node of each branch of the pipeline can run at a time."""
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.thread_runner.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        )
+        catalog = DataCatalog({"ds0_A": MemoryDataset(1), "ds0_B": MemoryDataset(2)})
+        ThreadRunner(max_workers=8).run(two_branches_crossed_pipeline, catalog)
+
+        executor_cls_mock.assert_called_once_with(max_workers=2)
+
     def test_init_with_negative_process_count(self):
         pattern = "max_workers should be positive"
         with pytest.raises(ValueError, match=pattern):
             ThreadRunner(max_workers=-1)
 
 
+class TestResourceLimits:
+    def test_heavy_nodes_do_not_overlap(self, catalog):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def heavy(value):
+            with lock:
+                running.append(value)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(value)
+            return value
+
+        test_pipeline = pipeline(
+            [
+                node(heavy, "A", f"out_{i}", name=f"heavy_{i}", resources={"mem": "3G"})
+                for i in range(3)
+            ]
+        )
+        catalog["A"] = 42
+        ThreadRunner(max_workers=3, resource_limits={"mem": "4G"}).run(
+            test_pipeline, catalog
+        )
+
+        assert max(max_running) == 1
+
+    def test_unlimited_resources_are_ignored(self, catalog):
+        test_pipeline = pipeline(
+            [node(identity, "A", "B", resources={"gpu": 1, "mem": "1G"})]
+        )
+        catalog["A"] = 42
+        result = ThreadRunner(resource_limits={"mem": "2G"}).run(test_pipeline, catalog)
+        assert result["B"].load() == 42
+
+    def test_node_exceeding_limits(self, catalog):
+        test_pipeline = pipeline(
+            [node(identity, "A", "B", name="too_big", resources={"cpu": 8})]
+        )
+        catalog["A"] = 42
+        with pytest.raises(ValueError, match=r"need more resources.*too_big"):
+            ThreadRunner(resource_limits={"cpu": 4}).run(test_pipeline, catalog)
+
+
+class TestFuseNodes:
+    def test_fuse_parallel_chains(self, catalog):
+        test_pipeline = pipeline(
+            [
+                node(identity, "A", "B", name="left_1"),
+                node(identity, "B", "C", name="left_2"),
+                node(identity, "A", "X", name="right_1"),
+                node(identity, "X", "Y", name="right_2"),
+            ]
+        )
+        catalog["A"] = 42
+        runner = ThreadRunner(fuse_nodes=True)
+        result = runner.run(test_pipeline, catalog)
+
+        nodes = {n.name: n for n in test_pipeline.nodes}
+        assert runner._fused_nodes == {
+            nodes["left_1"]: [nodes["left_2"]],
+            nodes["right_1"]: [nodes["right_2"]],
+        }
+        assert result["C"].load() == 42
+        assert result["Y"].load() == 42
+
+
+def produce_chunks(count):
+    yield from range(count)
+
+
+def sum_chunks(chunks):
+    return sum(chunks)
+
+
+def add_offset(chunks, offset):
+    for chunk in chunks:
+        yield chunk + offset
+
+
+@pytest.fixture
+def stream_catalog():
+    return DataCatalog(
+        {
+            "count": MemoryDataset(10),
+            "chunks": StreamingDataset(max_chunks=1),
+            "shifted": StreamingDataset(max_chunks=1),
+        }
+    )
+
+
+class TestStreaming:
+    def test_consume_while_producing(self, stream_catalog):
+        events = []
+
+        def produce(count):
+            for chunk in range(count):
+                events.append(("produce", chunk))
+                yield chunk
+
+        def consume(chunks):
+            for chunk in chunks:
+                events.append(("consume", chunk))
+            return len(events)
+
+        test_pipeline = pipeline(
+            [
+                node(produce, "count", "chunks", name="produce"),
+                node(add_offset, ["chunks", "count"], "shifted", name="shift"),
+                node(consume, "shifted", "total", name="consume"),
+            ]
+        )
+        result = ThreadRunner().run(test_pipeline, stream_catalog)
+
+        assert result["total"].load() == 20
+        assert [e for e in events if e[0] == "consume"] == [
+            ("consume", chunk + 10) for chunk in range(10)
+        ]
+        # The first chunk is consumed before the last one is produced
+        assert events.index(("consume", 10)) < events.index(("produce", 9))
+
+    def test_stream_with_other_parents(self, stream_catalog):
+        def slow_offset(count):
+            time.sleep(0.05)
+            return count
+
+        test_pipeline = pipeline(
+            [
+                node(slow_offset, "count", "offset", name="offset"),
+                node(produce_chunks, "count", "chunks", name="produce"),
+                node(add_offset, ["chunks", "offset"], "shifted", name="shift"),
+                node(sum_chunks, "shifted", "total", name="sum"),
+            ]
+        )
+        runner = ThreadRunner()
+        result = runner.run(test_pipeline, stream_catalog)
+
+        nodes = {n.name: n for n in test_pipeline.nodes}
+        assert runner._streaming_groups == {
+            nodes["produce"]: [nodes["shift"], nodes["sum"]]
+        }
+        assert result["total"].load() == 145
+
+    def test_stop_consuming_early(self, stream_catalog):
+        test_pipeline = pipeline(
+            [
+                node(produce_chunks, "count", "chunks", name="produce"),
+                node(next, "chunks", "first", name="first"),
+            ]
+        )
+        result = ThreadRunner().run(test_pipeline, stream_catalog)
+        assert result["first"].load() == 0
+
+    def test_producer_failure(self, stream_catalog):
+        def fail_after_one(count):
+            yield 1
+            raise ValueError("producer failed")
+
+        test_pipeline = pipeline(
+            [
+                node(fail_after_one, "count", "chunks", name="produce"),
+                node(sum_chunks, "chunks", "total", name="sum"),
+            ]
+        )
+        with pytest.raises(ValueError, match="producer failed"):
+            ThreadRunner().run(test_pipeline, stream_catalog)
+
+    def test_consumer_failure(self, stream_catalog):
+        def fail_on_first(chunks):
+            next(chunks)
+            raise ValueError("consumer failed")
+
+        test_pipeline = pipeline(
+            [
+                node(produce_chunks, "count", "chunks", name="produce"),
+                node(fail_on_first, "chunks", "total", name="consume"),
+            ]
+        )
+        with pytest.raises(ValueError, match="consumer failed"):
+            ThreadRunner().run(test_pipeline, stream_catalog)
+
+    def test_not_enough_workers(self, stream_catalog):
+        test_pipeline = pipeline(
+            [
+                node(produce_chunks, "count", "chunks", name="produce"),
+                node(add_offset, ["chunks", "count"], "shifted", name="shift"),
+                node(sum_chunks, "shifted", "total", name="sum"),
+            ]
+        )
+        with pytest.raises(ValueError, match=r"link 3 nodes.*only has 2 workers"):
+            ThreadRunner(max_workers=2).run(test_pipeline, stream_catalog)
+
+    @pytest.mark.parametrize(
+        "test_pipeline",
+        [
+            pipeline(
+                [
+                    node(produce_chunks, "count", "chunks", name="produce"),
+                    node(sum_chunks, "chunks", "total_1", name="sum_1"),
+                    node(sum_chunks, "chunks", "total_2", name="sum_2"),
+                ]
+            ),
+            pipeline([node(produce_chunks, "count", "chunks", name="produce")]),
+        ],
+    )
+    def test_invalid_streams(self, test_pipeline, stream_catalog):
+        with pytest.raises(ValueError, match=r"\['chunks'\] must be saved by exactly"):
+            ThreadRunner().run(test_pipeline, stream_catalog)
+
+
+class ErrorHooks:
+    def __init__(self):
+        self.errors = []
+
+    @hook_impl
+    def on_node_error(self, error, node):
+        self.errors.append((node.name, error))
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    # Let the nodes left running in the background complete
+    event.set()
+
+
+class TestFailFast:
+    def test_cancel_waiting_nodes(self, release):
+        ran = []
+
+        def slow(x):
+            ran.append(x)
+            release.wait(5)
+            return x
+
+        def fail(x):
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        # The thread which ran the failed node may take the next node before
+        # it is cancelled, but not the one after it
+        test_pipeline = pipeline(
+            [
+                node(fail, "x", "a", name="a_fail"),
+                node(slow, "b", "b_out", name="b_slow"),
+                node(slow, "c", "c_out", name="c_slow"),
+                node(slow, "d", "d_out", name="d_slow"),
+            ]
+        )
+        catalog = DataCatalog(
+            {name: MemoryDataset(name) for name in ("x", "b", "c", "d")}
+        )
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match="failed"):
+            ThreadRunner(max_workers=2, fail_fast=True).run(test_pipeline, catalog)
+
+        assert time.perf_counter() - start < 2
+        assert "b" in ran
+        assert "d" not in ran
+
+    def test_ready_nodes_run_after_failure(self):
+        ran = []
+
+        def record(x):
+            ran.append(x)
+            return x
+
+        test_pipeline = pipeline(
+            [
+                node(exception_fn, "x", "a", name="a_fail"),
+                node(record, "b", "b_out", name="b_record"),
+                node(record, "c", "c_out", name="c_record"),
+            ]
+        )
+        catalog = DataCatalog({name: MemoryDataset(name) for name in ("x", "b", "c")})
+        with pytest.raises(Exception, match="test exception"):
+            ThreadRunner(max_workers=1).run(test_pipeline, catalog)
+
+        assert sorted(ran) == ["b", "c"]
+
+
+class TestNodeTimeouts:
+    @pytest.mark.parametrize("timeout, tags", [(0.2, None), (None, "timeout.0.2")])
+    def test_timeout(self, release, timeout, tags):
+        def slow(x):
+            release.wait(5)
+            return x
+
+        test_pipeline = pipeline(
+            [
+                node(identity, "x", "y", name="first"),
+                node(slow, "y", "z", name="slow", timeout=timeout, tags=tags),
+            ]
+        )
+        catalog = DataCatalog({"x": MemoryDataset(1)})
+        hook_manager = _create_hook_manager()
+        hooks = ErrorHooks()
+        hook_manager.register(hooks)
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match=r"Node 'slow' timed out after 0\.2"):
+            ThreadRunner().run(test_pipeline, catalog, hook_manager)
+        assert time.perf_counter() - start < 2
+        assert [name for name, _ in hooks.errors] == ["slow"]
+        assert isinstance(hooks.errors[0][1], TimeoutError)
+
+    def test_timeout_attribute_overrides_tags(self):
+        n = node(identity, "x", "y", timeout=5, tags=["timeout.1", "timeout.2"])
+        assert ThreadRunner()._get_node_timeout(n) == 5
+        assert ThreadRunner()._get_node_timeout(n.tag("other")) == 5
+        n = node(identity, "x", "y", tags=["timeout.1", "timeout.2"])
+        assert ThreadRunner()._get_node_timeout(n) == 1
+
+    def test_node_completing_within_timeout(self):
+        test_pipeline = pipeline([node(identity, "x", "y", timeout=5)])
+        catalog = DataCatalog({"x": MemoryDataset(1)})
+        ThreadRunner().run(test_pipeline, catalog)
+        assert catalog.load("y") == 1
+
+    @pytest.mark.parametrize("tag", ["timeout.soon", "timeout.0", "timeout.-1"])
+    def test_invalid_timeout_tag(self, tag):
+        test_pipeline = pipeline([node(identity, "x", "y", name="n", tags=tag)])
+        catalog = DataCatalog({"x": MemoryDataset(1)})
+        with pytest.raises(ValueError, match=f"invalid timeout tag '{tag}'"):
+            ThreadRunner().run(test_pipeline, catalog)
+
+    def test_nodes_with_timeout_are_not_fused(self, mocker):
+        submit = mocker.spy(ThreadPoolExecutor, "submit")
+        test_pipeline = pipeline(
+            [
+                node(identity, "x", "y", name="first"),
+                node(identity, "y", "z", name="second", tags="timeout.5"),
+            ]
+        )
+        catalog = DataCatalog({"x": MemoryDataset(1)})
+        ThreadRunner(fuse_nodes=True).run(test_pipeline, catalog)
+        assert submit.call_count == 2
+
+
+class ThreadRecordingDataset(AbstractDataset):
+    def __init__(self, value, failures=0):
+        self.value = value
+        self.failures = failures
+        self.loading_threads = []
+
+    def _load(self) -> Any:
+        self.loading_threads.append(threading.current_thread().name)
+        if self.failures:
+            self.failures -= 1
+            raise DatasetError("flaky")
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.value = data
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+class LoadHooks:
+    def __init__(self):
+        self.loaded = []
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, data, node):
+        self.loaded.append((dataset_name, node.name, data))
+
+
+def slow_identity(x):
+    time.sleep(0.2)
+    return x
+
+
+@pytest.fixture
+def prefetch_pipeline():
+    return pipeline(
+        [
+            node(slow_identity, "a", "b", name="first"),
+            node(lambda b, c: b + c, ["b", "c"], "d", name="second"),
+        ]
+    )
+
+
+class TestPrefetch:
+    def test_prefetch_inputs_of_almost_ready_nodes(self, prefetch_pipeline):
+        b = ThreadRecordingDataset(None)
+        c = ThreadRecordingDataset(2)
+        catalog = DataCatalog({"a": MemoryDataset(1), "b": b, "c": c})
+        hook_manager = _create_hook_manager()
+        hooks = LoadHooks()
+        hook_manager.register(hooks)
+
+        ThreadRunner(prefetch_memory="1M").run(prefetch_pipeline, catalog, hook_manager)
+
+        assert catalog.load("d") == 3
+        assert len(c.loading_threads) == 1
+        assert c.loading_threads[0].startswith("kedro-prefetch")
+        # "b" is only saved once "first" has completed
+        assert not b.loading_threads[0].startswith("kedro-prefetch")
+        assert ("c", "second", 2) in hooks.loaded
+
+    def test_prefetched_data_exceeding_memory(self, prefetch_pipeline):
+        c = ThreadRecordingDataset(list(range(1000)))
+        catalog = DataCatalog({"a": MemoryDataset([1]), "c": c})
+
+        ThreadRunner(prefetch_memory=10).run(prefetch_pipeline, catalog)
+
+        assert catalog.load("d") == [1, *range(1000)]
+        assert len(c.loading_threads) == 2
+        assert not c.loading_threads[1].startswith("kedro-prefetch")
+
+    def test_no_prefetch_memory(self, prefetch_pipeline):
+        c = ThreadRecordingDataset(2)
+        catalog = DataCatalog({"a": MemoryDataset(1), "c": c})
+
+        ThreadRunner(prefetch_memory=0).run(prefetch_pipeline, catalog)
+
+        assert catalog.load("d") == 3
+        assert len(c.loading_threads) == 1
+        assert not c.loading_threads[0].startswith("kedro-prefetch")
+
+    def test_failed_prefetch_loaded_again(self, prefetch_pipeline):
+        c = ThreadRecordingDataset(2, failures=1)
+        catalog = DataCatalog({"a": MemoryDataset(1), "c": c})
+
+        ThreadRunner(prefetch_memory="1M").run(prefetch_pipeline, catalog)
+
+        assert catalog.load("d") == 3
+        assert len(c.loading_threads) == 2
+
+    def test_prefetcher_closed_when_run_fails(self):
+        test_pipeline = pipeline(
+            [
+                node(exception_fn, "a", "b", name="first"),
+                node(lambda b, c: b + c, ["b", "c"], "d", name="second"),
+            ]
+        )
+        catalog = DataCatalog({"a": MemoryDataset(1), "c": ThreadRecordingDataset(2)})
+        runner = ThreadRunner(prefetch_memory="1M")
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(test_pipeline, catalog)
+        assert runner._prefetcher is None
+
+    def test_invalid_prefetch_memory(self):
+        with pytest.raises(ValueError, match="'lots' is not a valid resource amount"):
+            ThreadRunner(prefetch_memory="lots")
+
+
 class TestIsAsync:
     def test_thread_run(self, fan_out_fan_in, catalog):
         catalog["A"] = 42
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager, hook_impl
+from kedro.io import AbstractDataset, DataCatalog, DatasetError, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import RunJournal, SequentialRunner, ThreadRunner
+from kedro.runner.scheduling import _WriteBehind
+from tests.runner.conftest import identity
+
+
+class LoggingDataset(AbstractDataset):
+    def __init__(self, log, name, written=None, fail=False):
+        self.log = log
+        self.name = name
+        # Writes wait for this event, if given
+        self.written = written
+        self.fail = fail
+        self.data = None
+
+    def _load(self) -> Any:
+        self.log.append(("load", self.name))
+        return self.data
+
+    def _save(self, data: Any) -> None:
+        if self.written is not None:
+            assert self.written.wait(5)
+        if self.fail:
+            raise ValueError("write failed")
+        self.log.append(("save", self.name))
+        self.data = list(data)
+
+    def _describe(self) -> dict[str, Any]:
+        return {"name": self.name}
+
+
+class SaveHooks:
+    def __init__(self):
+        self.saved = []
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, data, node):
+        self.saved.append((dataset_name, threading.current_thread().name))
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.mark.parametrize("runner_class", [SequentialRunner, ThreadRunner])
+class TestWriteBehind:
+    def test_consumer_reads_in_flight_data(self, runner_class, release):
+        log = []
+
+        def consume(data):
+            # The output is still being written
+            assert log == []
+            data.append(4)
+            release.set()
+            return data
+
+        test_pipeline = pipeline(
+            [
+                node(identity, "a", "b", name="produce"),
+                node(consume, "b", "c", name="consume"),
+            ]
+        )
+        b = LoggingDataset(log, "b", release)
+        catalog = DataCatalog({"a": MemoryDataset([1, 2, 3]), "b": b})
+
+        runner_class(write_behind_threads=1).run(test_pipeline, catalog)
+
+        assert log == [("save", "b")]
+        # The consumer received a copy of the data being written
+        assert b.data == [1, 2, 3]
+        assert catalog.load("c") == [1, 2, 3, 4]
+
+    def test_outputs_without_consumers_written_first(self, runner_class, release):
+        log = []
+
+        def split(data):
+            return data, data
+
+        def consume(data):
+            release.set()
+            return data
+
+        test_pipeline = pipeline(
+            [
+                node(split, "a", ["blocker", "x"], name="first"),
+                node(split, "x", ["used", "unused"], name="second"),
+                node(consume, "used", "z", name="third"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "a": MemoryDataset([1]),
+                "blocker": LoggingDataset(log, "blocker", release),
+                "used": LoggingDataset(log, "used"),
+                "unused": LoggingDataset(log, "unused"),
+            }
+        )
+
+        runner_class(write_behind_threads=1).run(test_pipeline, catalog)
+
+        assert log == [("save", "blocker"), ("save", "unused"), ("save", "used")]
+
+    def test_write_error(self, runner_class):
+        test_pipeline = pipeline([node(identity, "a", "b", name="produce")])
+        catalog = DataCatalog(
+            {"a": MemoryDataset([1]), "b": LoggingDataset([], "b", fail=True)}
+        )
+        with pytest.raises(DatasetError, match="write failed"):
+            runner_class(write_behind_threads=1).run(test_pipeline, catalog)
+
+    def test_no_node_runs_after_write_error(self, runner_class):
+        runner = runner_class(write_behind_threads=1)
+        consumed = []
+
+        def wait_for_write_error(data):
+            for _ in range(500):
+                if runner._pending_writes.error is not None:
+                    break
+                time.sleep(0.01)
+            return data
+
+        def consume(b, w):
+            consumed.append(b)
+            return b
+
+        test_pipeline = pipeline(
+            [
+                node(identity, "a", "b", name="produce"),
+                node(wait_for_write_error, "a", "w", name="wait"),
+                node(consume, ["b", "w"], "c", name="consume"),
+            ]
+        )
+        b = LoggingDataset([], "b", fail=True)
+        b.data = ["STALE"]
+        catalog = DataCatalog({"a": MemoryDataset([1]), "b": b})
+        with pytest.raises(DatasetError, match="write failed"):
+            runner.run(test_pipeline, catalog)
+        assert consumed == []
+
+    def test_node_failure_flushes_writes(self, runner_class):
+        def split(data):
+            return data, data
+
+        def fail(data):
+            raise ValueError("node failed")
+
+        log = []
+        test_pipeline = pipeline(
+            [
+                node(split, "a", ["b", "x"], name="produce"),
+                node(fail, "x", "c", name="fail"),
+            ]
+        )
+        catalog = DataCatalog({"a": MemoryDataset([1]), "b": LoggingDataset(log, "b")})
+        runner = runner_class(write_behind_threads=1)
+        with pytest.raises(ValueError, match="node failed"):
+            runner.run(test_pipeline, catalog)
+        assert log == [("save", "b")]
+        assert runner._pending_writes is None
+
+    def test_hooks(self, runner_class):
+        hooks = SaveHooks()
+        hook_manager = _create_hook_manager()
+        hook_manager.register(hooks)
+        test_pipeline = pipeline([node(identity, "a", "b", name="produce")])
+        catalog = DataCatalog({"a": MemoryDataset([1]), "b": LoggingDataset([], "b")})
+
+        runner_class(write_behind_threads=1).run(test_pipeline, catalog, hook_manager)
+
+        assert hooks.saved == [("b", "kedro-write-behind-0")]
+
+    def test_negative_write_behind_threads(self, runner_class):
+        with pytest.raises(ValueError, match="should not be negative"):
+            runner_class(write_behind_threads=-1)
+
+    def test_journal_not_supported(self, runner_class, tmp_path):
+        with pytest.raises(ValueError, match="cannot be used with a 'journal'"):
+            runner_class(write_behind_threads=1, journal=RunJournal(tmp_path))
+
+
+def test_async_saving(release):
+    log = []
+
+    def consume(data):
+        release.set()
+        return data
+
+    test_pipeline = pipeline(
+        [
+            node(identity, "a", "b", name="produce"),
+            node(consume, "b", "c", name="consume"),
+        ]
+    )
+    catalog = DataCatalog(
+        {"a": MemoryDataset([1]), "b": LoggingDataset(log, "b", release)}
+    )
+
+    SequentialRunner(is_async=True, write_behind_threads=1).run(test_pipeline, catalog)
+
+    assert log == [("save", "b")]
+    assert catalog.load("c") == [1]
+
+
+def test_in_flight_outputs_not_prefetched(release):
+    log = []
+
+    def slow(data):
+        time.sleep(0.3)
+        return data
+
+    def consume(b, c):
+        release.set()
+        return b + c
+
+    test_pipeline = pipeline(
+        [
+            node(identity, "a", "b", name="produce"),
+            node(slow, "a", "c", name="slow"),
+            node(consume, ["b", "c"], "d", name="consume"),
+        ]
+    )
+    catalog = DataCatalog(
+        {"a": MemoryDataset([1]), "b": LoggingDataset(log, "b", release)}
+    )
+
+    ThreadRunner(prefetch_memory="1M", write_behind_threads=1).run(
+        test_pipeline, catalog
+    )
+
+    assert log == [("save", "b")]
+    assert catalog.load("d") == [1, 1]
+
+
+def test_load_failed_write():
+    test_pipeline = pipeline(
+        [
+            node(identity, "a", "b", name="produce"),
+            node(identity, "b", "c", name="consume"),
+        ]
+    )
+    catalog = DataCatalog(
+        {"a": MemoryDataset([1]), "b": LoggingDataset([], "b", fail=True)}
+    )
+    pending_writes = _WriteBehind(
+        test_pipeline, catalog, _create_hook_manager(), 1, lambda n: True
+    )
+    assert pending_writes.save("b", [1], test_pipeline.nodes[0])
+    assert isinstance(pending_writes.flush(), DatasetError)
+    assert pending_writes.is_pending("b")
+    with pytest.raises(DatasetError, match="write failed"):
+        pending_writes.load("b")
+
+
+def test_outputs_saved_by_node():
+    test_pipeline = pipeline(
+        [
+            node(identity, "a", "b", name="produce_b"),
+            node(identity, "b", "c", name="process"),
+            node(identity, "a", "d@pandas", name="produce_d"),
+            node(identity, "d@spark", "e", name="transcode"),
+            node(identity, "a", "f", name="produce_f"),
+        ]
+    )
+    catalog = DataCatalog(
+        {
+            name: LoggingDataset([], name)
+            for name in ("b", "c", "d@pandas", "d@spark", "e", "f")
+        }
+    )
+    catalog["a"] = MemoryDataset([1])
+    pending_writes = _WriteBehind(
+        test_pipeline,
+        catalog,
+        _create_hook_manager(),
+        1,
+        lambda n: n.name != "process",
+    )
+    try:
+        assert pending_writes._outputs == {"e", "f"}
+    finally:
+        pending_writes.flush()